@@ -1,3 +1,3 @@
 rm src/*.c *.so -rf build
-git checkout src/cdfdif.c src/cdfdif_wrapper.c
+git checkout src/cdfdif.c
 python setup.py build_ext --inplace
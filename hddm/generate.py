@@ -1,12 +1,17 @@
 
 
+import os
+import multiprocessing
 import kabuki
 import hddm
 import numpy as np
 import pandas as pd
 
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
 from numpy.random import rand
-from scipy.stats import uniform, norm
+from scipy.stats import norm
 from copy import copy
 
 
@@ -131,6 +136,16 @@ def gen_rand_params(include=(), cond_dict=None, seed=None):
 # Functions to generate RT distributions with specified parameters #
 ####################################################################
 
+def _gen_rts_size(size):
+    """Number of RTs gen_rts simulates for size."""
+    if isinstance(size, tuple):  # this line is because pymc stochastic use tuple for sample size
+        if size == ():
+            size = 1
+        else:
+            size = size[0]
+    return size
+
+
 def gen_rts(size=1000, range_=(-6, 6), dt=1e-3,
             intra_sv=1., structured=True, subj_idx=None,
             method='cdf', **params):
@@ -160,6 +175,7 @@ def gen_rts(size=1000, range_=(-6, 6), dt=1e-3,
             Which method to use to simulate the RTs:
                 * 'cdf': fast, uses the inverse of cumulative density function to sample, dt can be 1e-2.
                 * 'drift': slow, simulates each complete drift process, dt should be 1e-4.
+                * 'exact': fast and exact, rejection sampling of the first-passage time, dt and range_ are ignored.
 
     """
     if 'v_switch' in params and method != 'drift':
@@ -176,22 +192,20 @@ def gen_rts(size=1000, range_=(-6, 6), dt=1e-3,
     if 'sz' not in params:
         params['sz'] = 0
 
-    # check sample
-    if isinstance(size, tuple):  # this line is because pymc stochastic use tuple for sample size
-        if size == ():
-            size = 1
-        else:
-            size = size[0]
+    size = _gen_rts_size(size)
 
     if method == 'cdf_py':
         rts = _gen_rts_from_cdf(params, size, range_, dt)
     elif method == 'drift':
-        rts = _gen_rts_from_simulated_drift(params, size, dt, intra_sv)[0]
+        rts = _gen_rts_from_simulated_drift(params, size, dt, intra_sv, keep_drifts=0)[0]
     elif method == 'cdf':
         rts = hddm.wfpt.gen_rts_from_cdf(params['v'], params['sv'], params['a'], params['z'],
                                          params['sz'], params[
                                              't'], params['st'],
                                          size, range_[0], range_[1], dt)
+    elif method == 'exact':
+        rts = hddm.wfpt.gen_rts_exact(params['v'], params['sv'], params['a'], params['z'],
+                                      params['sz'], params['t'], params['st'], size)
     else:
         raise TypeError("Sampling method %s not found." % method)
     if not structured:
@@ -205,116 +219,119 @@ def gen_rts(size=1000, range_=(-6, 6), dt=1e-3,
         return data
 
 
-def _gen_rts_from_simulated_drift(params, samples=1000, dt=1e-4, intra_sv=1.):
+def _gen_rts_from_simulated_drift(params, samples=1000, dt=1e-4, intra_sv=1., keep_drifts=None,
+                                  max_chunk=10**6):
     """Returns simulated RTs from simulating the whole drift-process.
 
+    All trials are advanced together, a chunk of time steps at a time, and
+    retired once they cross a boundary. A chunk holds at most max_chunk
+    steps (trials times time steps), so memory does not grow with samples.
+
         :Arguments:
             params : dict
                 Parameter names and values.
 
         :Optional:
-            samlpes : int
+            samples : int
                 How many samples to generate.
             dt : float
                 How many steps/sec.
             intra_sv : float
                 Intra-trial variability.
+            keep_drifts : int
+                Return the trajectories of the first keep_drifts trials,
+                of all trials if None. Use 0 when only the RTs are needed.
+            max_chunk : int
+                Maximum number of steps simulated at once.
+
+        :Returns:
+            rts : array
+                Signed RTs.
+            drifts : list
+                Trajectories of the kept trials, starting with the
+                non-decision time at the starting point.
 
         :SeeAlso:
             gen_rts
     """
 
-    from numpy.random import rand
-
     if samples is None:
         samples = 1
-    nn = 1000
     a = params['a']
     v = params['v']
 
-    if 'v_switch' in params:
-        switch = True
-        t_switch = params['t_switch'] / dt
-        # Hack so that we will always step into a switch
-        nn = int(round(t_switch))
-    else:
-        switch = False
-
     # create delay
-    if 'st' in params:
-        start_delay = (uniform.rvs(loc=params['t'], scale=params['st'], size=samples)
-                       - params['st'] / 2.)
-    else:
-        start_delay = np.ones(samples) * params['t']
+    start_delay = params['t'] + params.get('st', 0) * (rand(samples) - .5)
 
     # create starting_points
-    if 'sz' in params:
-        starting_points = (uniform.rvs(loc=params['z'], scale=params['sz'], size=samples)
-                           - params['sz'] / 2.) * a
+    starting_points = (params['z'] + params.get('sz', 0) * (rand(samples) - .5)) * a
+
+    # drift rates, before and after the switch
+    if params.get('sv', 0) != 0:
+        drift_rates = norm.rvs(v, params['sv'], size=samples)
     else:
-        starting_points = np.ones(samples) * params['z'] * a
+        drift_rates = np.full(samples, v, dtype=float)
+    prob_up = 0.5 * (1 + np.sqrt(dt) / intra_sv * drift_rates)
+
+    switch = 'v_switch' in params
+    if switch:
+        n_switch = int(round(params['t_switch'] / dt))
+        if params.get('V_switch', 0) != 0:
+            drift_rates_switch = norm.rvs(params['v_switch'], params['V_switch'], size=samples)
+        else:
+            drift_rates_switch = np.full(samples, params['v_switch'], dtype=float)
+        prob_up_switch = 0.5 * (1 + np.sqrt(dt) / intra_sv * drift_rates_switch)
 
     rts = np.empty(samples)
     step_size = np.sqrt(dt) * intra_sv
-    drifts = []
-
-    for i_sample in range(samples):
-        drift = np.array([])
-        crossed = False
-        iter = 0
-        y_0 = starting_points[i_sample]
-        # drifting...
-        if 'sv' in params and params['sv'] != 0:
-            drift_rate = norm.rvs(v, params['sv'])
+    keep_drifts = samples if keep_drifts is None else min(keep_drifts, samples)
+    kept = [[] for i in range(keep_drifts)]
+
+    position = starting_points.copy()
+    active = np.arange(samples)
+    n_steps = 0
+    while active.shape[0] > 0:
+        n_active = active.shape[0]
+        chunk = max(1, max_chunk // n_active)
+        # step numbers of this chunk, the starting point is step 0
+        step_idx = np.arange(n_steps + 1, n_steps + chunk + 1)
+        if switch:
+            p = np.where(step_idx > n_switch, prob_up_switch[active, None], prob_up[active, None])
         else:
-            drift_rate = v
-
-        if 'v_switch' in params:
-            if 'V_switch' in params and params['V_switch'] != 0:
-                drift_rate_switch = norm.rvs(
-                    params['v_switch'], params['V_switch'])
-            else:
-                drift_rate_switch = params['v_switch']
-
-        prob_up = 0.5 * (1 + np.sqrt(dt) / intra_sv * drift_rate)
-
-        while (not crossed):
-            # Generate nn steps
-            iter += 1
-            if iter == 2 and switch:
-                prob_up = 0.5 * (1 + np.sqrt(dt) /
-                                 intra_sv * drift_rate_switch)
-            position = ((rand(nn) < prob_up) * 2 - 1) * step_size
-            position[0] += y_0
-            position = np.cumsum(position)
-            # Find boundary crossings
-            cross_idx = np.where((position < 0) | (position > a))[0]
-            drift = np.concatenate((drift, position))
-            if cross_idx.shape[0] > 0:
-                crossed = True
+            p = prob_up[active, None]
+        path = np.where(rand(n_active, chunk) < p, step_size, -step_size)
+        path[:, 0] += position[active]
+        np.cumsum(path, axis=1, out=path)
+
+        # find the first boundary crossing of each trial
+        outside = (path < 0) | (path > a)
+        crossed = outside.any(axis=1)
+        first = outside.argmax(axis=1)
+
+        rows = np.nonzero(crossed)[0]
+        cross_idx = first[rows]
+        y2 = path[rows, cross_idx]
+        y1 = np.where(cross_idx > 0, path[rows, cross_idx - 1], position[active[rows]])
+        bound = np.where(y2 < 0, 0., a)
+        # interpolate linearly between the last two positions
+        rt = (n_steps + cross_idx + (bound - y1) / (y2 - y1)) * dt
+        trials = active[rows]
+        rts[trials] = (rt + start_delay[trials]) * np.sign(y2)
+
+        for row in np.nonzero(active < keep_drifts)[0]:
+            if crossed[row]:
+                kept[active[row]].append(path[row, :first[row]])
             else:
-                # If not crossed, set last position as starting point
-                # for next nn steps to continue drift
-                y_0 = position[-1]
-
-        # find the boundary interception
-        y2 = position[cross_idx[0]]
-        if cross_idx[0] != 0:
-            y1 = position[cross_idx[0] - 1]
-        else:
-            y1 = y_0
-        m = (y2 - y1) / dt  # slope
-        # y = m*x + b
-        b = y2 - m * ((iter - 1) * nn + cross_idx[0]) * dt  # intercept
-        if y2 < 0:
-            rt = ((0 - b) / m)
-        else:
-            rt = ((a - b) / m)
-        rts[i_sample] = (rt + start_delay[i_sample]) * np.sign(y2)
+                kept[active[row]].append(path[row].copy())
+
+        position[active] = path[:, -1]
+        active = active[~crossed]
+        n_steps += chunk
 
+    drifts = []
+    for i_sample in range(keep_drifts):
         delay = start_delay[i_sample] / dt
-        drifts.append(np.concatenate(
-            (np.ones(int(delay)) * starting_points[i_sample], drift[:int(abs(rt) / dt)])))
+        drifts.append(np.concatenate([np.ones(int(delay)) * starting_points[i_sample]] + kept[i_sample]))
 
     return rts, drifts
 
@@ -360,7 +377,64 @@ def _gen_rts_from_cdf(params, samples=1000):
     return hddm.likelihoods.wfpt.ppf(np.random.rand(samples), args=(v, V, a, z, Z, t, T))
 
 
-def gen_rand_data(params=None, n_fast_outliers=0, n_slow_outliers=0, **kwargs):
+def parallel_map(func, tasks, n_jobs=1, seed=None):
+    """Returns [func(**task) for task in tasks], computed in a pool of processes.
+
+    Every task draws from the global numpy random state, seeded from its own
+    stream spawned from seed, so the results only depend on seed and the
+    tasks and not on n_jobs. The random state of the caller is restored.
+
+        :Arguments:
+            func : function
+                Module level function, it is pickled to the workers.
+                Workers are started with 'spawn' and import hddm anew,
+                so scripts calling this need an if __name__ == '__main__' guard.
+            tasks : list of dicts
+                Keyword arguments of func.
+
+        :Optional:
+            n_jobs : int
+                Number of processes, -1 uses all cores. With 1 the tasks
+                are run in this process.
+            seed : int
+                Root seed of the streams. If None it is drawn from the
+                global random state.
+    """
+    if seed is None:
+        seed = np.random.randint(2**31)
+    streams = np.random.SeedSequence(seed).spawn(len(tasks))
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
+    n_jobs = min(n_jobs, len(tasks))
+
+    if n_jobs <= 1:
+        return [_call_seeded(func, stream, task) for stream, task in zip(streams, tasks)]
+    # forked workers deadlock once OpenMP threads have been started by a prange kernel
+    with ProcessPoolExecutor(max_workers=n_jobs,
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        return list(executor.map(_call_seeded, repeat(func), streams, tasks,
+                                 chunksize=max(1, len(tasks) // (4 * n_jobs))))
+
+
+def _call_seeded(func, stream, task):
+    state = np.random.get_state()
+    np.random.seed(stream.generate_state(4))
+    try:
+        return func(**task)
+    finally:
+        np.random.set_state(state)
+
+
+def _map_subjects(func, tasks, seed, n_jobs):
+    """Run the tasks in order from the global random state, or with parallel_map if n_jobs is set."""
+    if n_jobs is None:
+        if seed is not None:
+            np.random.seed(seed)
+        return [func(**task) for task in tasks]
+    return parallel_map(func, tasks, n_jobs=n_jobs, seed=seed)
+
+
+def gen_rand_data(params=None, n_fast_outliers=0, n_slow_outliers=0, n_jobs=None, **kwargs):
     """Generate simulated RTs with random parameters.
 
        :Optional:
@@ -378,6 +452,11 @@ def gen_rand_data(params=None, n_fast_outliers=0, n_slow_outliers=0, **kwargs):
             n_slow_outliers : int <default=0>
                 How many late outliers to add.
 
+            n_jobs : int <default=None>
+                Simulate the RTs of all subjects and conditions in a pool
+                of n_jobs processes (see parallel_map). The data then only
+                depend on seed, not on n_jobs.
+
             The rest of the arguments are forwarded to kabuki.generate.gen_rand_data
 
        :Returns:
@@ -416,10 +495,34 @@ def gen_rand_data(params=None, n_fast_outliers=0, n_slow_outliers=0, **kwargs):
     if 'share_noise' not in kwargs:
         kwargs['share_noise'] = set(['a', 'v', 't', 'st', 'sz', 'sv', 'z'])
 
+    if n_jobs is None:
+        gen_func = gen_rts
+    else:
+        # only record the calls here, the RTs are simulated together below
+        tasks = []
+
+        def gen_func(size=1000, **task):
+            n = _gen_rts_size(size)
+            tasks.append(dict(task, size=n))
+            return pd.DataFrame({'rt': np.full(n, np.nan), 'response': np.full(n, np.nan),
+                                 '_task': len(tasks) - 1})
+
     # Create RT data
-    data, subj_params = kabuki.generate.gen_rand_data(gen_rts, params,
+    data, subj_params = kabuki.generate.gen_rand_data(gen_func, params,
                                                       check_valid_func=hddm.utils.check_params_valid,
                                                       bounds=bounds, **kwargs)
+    if n_jobs is not None:
+        results = parallel_map(gen_rts, tasks, n_jobs=n_jobs, seed=kwargs.get('seed', None))
+        task_idx = data.pop('_task').values
+        rt = data['rt'].values.copy()
+        response = data['response'].values.copy()
+        for i, result in enumerate(results):
+            rows = task_idx == i
+            rt[rows] = result['rt'].values
+            response[rows] = result['response'].values
+        data['rt'] = rt
+        data['response'] = response
+
     # add outliers
     seed = kwargs.get('seed', None)
     data = add_outliers(data, n_fast=n_fast_outliers,
@@ -427,180 +530,157 @@ def gen_rand_data(params=None, n_fast_outliers=0, n_slow_outliers=0, **kwargs):
 
     return data, subj_params
 
-def gen_rand_rlddm_data(a, t, scaler, alpha, size=1, p_upper=1, p_lower=0, z=0.5, q_init=0.5, pos_alpha=float('nan'), subjs=1, split_by=0, mu_upper=1, mu_lower=0, sd_upper=0.1, sd_lower=0.1, binary_outcome=True, uncertainty=False):
-    all_data = []
-    tg = t
-    ag = a
-    alphag = alpha
-    pos_alphag = pos_alpha
-    scalerg = scaler
-    for s in range(0, subjs):
-        t = np.maximum(0.05, np.random.normal(
-            loc=tg, scale=0.05, size=1)) if subjs > 1 else tg
-        a = np.maximum(0.05, np.random.normal(
-            loc=ag, scale=0.15, size=1)) if subjs > 1 else ag
-        alpha = np.minimum(np.minimum(np.maximum(0.001, np.random.normal(loc=alphag, scale=0.05, size=1)), alphag+alphag),1) if subjs > 1 else alphag
-        scaler = np.random.normal(
-            loc=scalerg, scale=0.25, size=1) if subjs > 1 else scalerg
-        if np.isnan(pos_alpha):
-            pos_alfa = alpha
-        else:
-            pos_alfa = np.maximum(0.001,np.random.normal(loc=pos_alphag, scale=0.05, size=1)) if subjs > 1 else pos_alphag
-        n = size
-        q_up = np.tile([q_init], n)
-        q_low = np.tile([q_init], n)
-        response = np.tile([0.5], n)
-        feedback = np.tile([0.5], n)
-        rt = np.tile([0], n)
-        if binary_outcome:
-            rew_up = np.random.binomial(1, p_upper, n).astype(float)
-            rew_low = np.random.binomial(1, p_lower, n).astype(float)
-        else:
-            rew_up = np.random.normal(mu_upper, sd_upper, n)
-            rew_low = np.random.normal(mu_lower, sd_lower, n)
-        sim_drift = np.tile([0], n)
-        subj_idx = np.tile([s], n)
-        d = {'q_up': q_up, 'q_low': q_low, 'sim_drift': sim_drift, 'rew_up': rew_up, 'rew_low': rew_low,
-             'response': response, 'rt': rt, 'feedback': feedback, 'subj_idx': subj_idx, 'split_by': split_by, 'trial': 1}
-        df = pd.DataFrame(data=d)
-        df = df[['q_up', 'q_low', 'sim_drift', 'rew_up', 'rew_low',
-                 'response', 'rt', 'feedback', 'subj_idx', 'split_by', 'trial']]
-
-        data, params = hddm.generate.gen_rand_data(
-            {'a': a, 't': t, 'v': df.loc[0, 'sim_drift'], 'z': z}, subjs=1, size=1)
-        df.loc[0, 'response'] = data.response[0]
-        df.loc[0, 'rt'] = data.rt[0]
-        if (data.response[0] == 1.0):
-            df.loc[0, 'feedback'] = df.loc[0, 'rew_up']
-            if (df.loc[0, 'feedback'] > df.loc[0, 'q_up']):
-                alfa = pos_alfa
-            else:
-                alfa = alpha
-        else:
-            df.loc[0, 'feedback'] = df.loc[0, 'rew_low']
-            if (df.loc[0, 'feedback'] > df.loc[0, 'q_low']):
-                alfa = pos_alfa
-            else:
-                alfa = alpha
+def gen_rand_rlddm_data(a, t, scaler, alpha, size=1, p_upper=1, p_lower=0, z=0.5, q_init=0.5, pos_alpha=float('nan'), subjs=1, split_by=0, mu_upper=1, mu_lower=0, sd_upper=0.1, sd_lower=0.1, binary_outcome=True, uncertainty=False, seed=None, n_jobs=None):
+    """Simulate the RLDDM for subjs subjects.
 
-        for i in range(1, n):
-            df.loc[i, 'trial'] = i + 1
-            df.loc[i, 'q_up'] = (df.loc[i - 1, 'q_up'] * (1 - df.loc[i - 1, 'response'])) + ((df.loc[i - 1, 'response'])
-                                                                                             * (df.loc[i - 1, 'q_up'] + (alfa * (df.loc[i - 1, 'rew_up'] - df.loc[i - 1, 'q_up']))))
-            df.loc[i, 'q_low'] = (df.loc[i - 1, 'q_low'] * (df.loc[i - 1, 'response'])) + ((1 - df.loc[i - 1, 'response'])
-                                                                                           * (df.loc[i - 1, 'q_low'] + (alfa * (df.loc[i - 1, 'rew_low'] - df.loc[i - 1, 'q_low']))))
-            df.loc[i, 'sim_drift'] = (
-                df.loc[i, 'q_up'] - df.loc[i, 'q_low']) * (scaler)
-            data, params = hddm.generate.gen_rand_data(
-                {'a': a, 't': t, 'v': df.loc[i, 'sim_drift'] , 'z': z}, subjs=1, size=1)
-            df.loc[i, 'response'] = data.response[0]
-            df.loc[i, 'rt'] = data.rt[0]
-            if (data.response[0] == 1.0):
-                df.loc[i, 'feedback'] = df.loc[i, 'rew_up']
-                if (df.loc[i, 'feedback'] > df.loc[i, 'q_up']):
-                    alfa = pos_alfa
-                else:
-                    alfa = alpha
-            else:
-                df.loc[i, 'feedback'] = df.loc[i, 'rew_low']
-                if (df.loc[i, 'feedback'] > df.loc[i, 'q_low']):
-                    alfa = pos_alfa
-                else:
-                    alfa = alpha
-
-        all_data.append(df)
-    all_data = pd.concat(all_data, axis=0)
-    all_data = all_data[['q_up', 'q_low', 'sim_drift', 'response',
-                         'rt', 'feedback', 'subj_idx', 'split_by', 'trial']]
-
-    return all_data
-
-
-def gen_rand_rl_data(scaler, alpha, size=1, p_upper=1, p_lower=0, z=0.5, q_init=0.5, pos_alpha=float('nan'), subjs=1, split_by=0, mu_upper=1, mu_lower=0, sd_upper=0.1, sd_lower=0.1, binary_outcome=True):
-    all_data = []
-    alphag = alpha
-    pos_alphag = pos_alpha
-    scalerg = scaler
-    for s in range(0, subjs):
-        alpha = np.minimum(np.minimum(np.maximum(0.001, np.random.normal(loc=alphag, scale=0.05, size=1)), alphag+alphag),1) if subjs > 1 else alphag
-        scaler = np.random.normal(
-            loc=scalerg, scale=0.25, size=1) if subjs > 1 else scalerg
-        if np.isnan(pos_alpha):
-            pos_alfa = alpha
-        else:
-            pos_alfa = np.maximum(0.001, np.random.normal(loc=pos_alphag, scale=0.05, size=1)) if subjs > 1 else pos_alphag
-        n = size
-        q_up = np.tile([q_init], n)  # initialize q
-        q_low = np.tile([q_init], n)  # initialize q
-        response = np.tile([0.5], n)
-        feedback = np.tile([0.5], n)
-        rt = np.tile([0], n)
-        if binary_outcome:
-            rew_up = np.random.binomial(1, p_upper, n).astype(float)
-            rew_low = np.random.binomial(1, p_lower, n).astype(float)
-        else:
-            rew_up = np.random.normal(mu_upper, sd_upper, n)
-            rew_low = np.random.normal(mu_lower, sd_lower, n)
-        sim_drift = np.tile([0], n)
-        p = np.tile([0.5], n)
-        subj_idx = np.tile([s], n)
-        d = {'q_up': q_up, 'q_low': q_low, 'p': p, 'sim_drift': sim_drift, 'rew_up': rew_up, 'rew_low': rew_low,
-             'response': response, 'feedback': feedback, 'subj_idx': subj_idx, 'split_by': split_by, 'trial': 1}
-        df = pd.DataFrame(data=d)
-        df = df[['q_up', 'q_low', 'p', 'sim_drift', 'rew_up', 'rew_low',
-                 'response', 'feedback', 'subj_idx', 'split_by', 'trial']]
-        if df.loc[0, 'sim_drift'] == 0:
-            df.loc[0, 'p'] = 0.5
-        else:
-            df.loc[0, 'p'] = (np.exp(-2 * z * df.loc[0, 'sim_drift']) -
-                              1) / (np.exp(-2 * df.loc[0, 'sim_drift']) - 1)
-        df.loc[0, 'response'] = np.random.binomial(1, df.loc[0, 'p'], 1)
-        if (df.loc[0, 'response'] == 1.0):
-            df.loc[0, 'feedback'] = df.loc[0, 'rew_up']
-            if (df.loc[0, 'feedback'] > df.loc[0, 'q_up']):
-                alfa = pos_alfa
-            else:
-                alfa = alpha
-        else:
-            df.loc[0, 'feedback'] = df.loc[0, 'rew_low']
-            if (df.loc[0, 'feedback'] > df.loc[0, 'q_low']):
-                alfa = pos_alfa
-            else:
-                alfa = alpha
+    With n_jobs set, subjects are simulated in a pool of n_jobs processes
+    (see parallel_map) and the result only depends on seed.
+    """
+    tasks = [dict(s=s, a=a, t=t, scaler=scaler, alpha=alpha, size=size, p_upper=p_upper, p_lower=p_lower, z=z,
+                  q_init=q_init, pos_alpha=pos_alpha, subjs=subjs, split_by=split_by, mu_upper=mu_upper,
+                  mu_lower=mu_lower, sd_upper=sd_upper, sd_lower=sd_lower, binary_outcome=binary_outcome)
+             for s in range(0, subjs)]
+    return _rl_frame(_map_subjects(_gen_rlddm_subject, tasks, seed, n_jobs),
+                     ['q_up', 'q_low', 'sim_drift', 'response', 'rt', 'feedback', 'subj_idx', 'split_by', 'trial'])
+
+
+def _gen_rlddm_subject(s, a, t, scaler, alpha, size, p_upper, p_lower, z, q_init, pos_alpha, subjs, split_by,
+                       mu_upper, mu_lower, sd_upper, sd_lower, binary_outcome):
+    """Simulate the RLDDM trials of subject s, see gen_rand_rlddm_data."""
+    t = float(np.maximum(0.05, np.random.normal(
+        loc=t, scale=0.05))) if subjs > 1 else t
+    a = float(np.maximum(0.05, np.random.normal(
+        loc=a, scale=0.15))) if subjs > 1 else a
+    alpha, pos_alpha, scaler = _rl_subject_params(alpha, pos_alpha, scaler, subjs)
+    rew_up, rew_low = _rl_rewards(size, p_upper, p_lower, mu_upper, mu_lower, sd_upper, sd_lower, binary_outcome)
+
+    return _rl_subject_columns(s, split_by,
+                               hddm.wfpt.gen_rl_trials(rew_up, rew_low, q_init, alpha, pos_alpha, scaler, a, t, z))
+
+
+def gen_rand_rl_data(scaler, alpha, size=1, p_upper=1, p_lower=0, z=0.5, q_init=0.5, pos_alpha=float('nan'), subjs=1, split_by=0, mu_upper=1, mu_lower=0, sd_upper=0.1, sd_lower=0.1, binary_outcome=True, seed=None, n_jobs=None):
+    """Simulate choices of the RL model without RTs for subjs subjects.
+
+    With n_jobs set, subjects are simulated in a pool of n_jobs processes
+    (see parallel_map) and the result only depends on seed.
+    """
+    tasks = [dict(s=s, scaler=scaler, alpha=alpha, size=size, p_upper=p_upper, p_lower=p_lower, z=z,
+                  q_init=q_init, pos_alpha=pos_alpha, subjs=subjs, split_by=split_by, mu_upper=mu_upper,
+                  mu_lower=mu_lower, sd_upper=sd_upper, sd_lower=sd_lower, binary_outcome=binary_outcome)
+             for s in range(0, subjs)]
+    return _rl_frame(_map_subjects(_gen_rl_subject, tasks, seed, n_jobs),
+                     ['q_up', 'q_low', 'p', 'sim_drift', 'response', 'feedback', 'subj_idx', 'split_by', 'trial'])
+
+
+def _gen_rl_subject(s, scaler, alpha, size, p_upper, p_lower, z, q_init, pos_alpha, subjs, split_by,
+                    mu_upper, mu_lower, sd_upper, sd_lower, binary_outcome):
+    """Simulate the RL choices of subject s, see gen_rand_rl_data."""
+    alpha, pos_alpha, scaler = _rl_subject_params(alpha, pos_alpha, scaler, subjs)
+    rew_up, rew_low = _rl_rewards(size, p_upper, p_lower, mu_upper, mu_lower, sd_upper, sd_lower, binary_outcome)
+
+    return _rl_subject_columns(s, split_by,
+                               hddm.wfpt.gen_rl_trials(rew_up, rew_low, q_init, alpha, pos_alpha, scaler, z=z))
+
+
+def _rl_subject_params(alpha, pos_alpha, scaler, subjs):
+    """Learning rates and scaler of a subject, drawn around the group values if subjs > 1."""
+    if subjs == 1:
+        return alpha, alpha if np.isnan(pos_alpha) else pos_alpha, scaler
+    subj_alpha = float(np.minimum(np.minimum(np.maximum(0.001, np.random.normal(loc=alpha, scale=0.05)), alpha+alpha),1))
+    subj_scaler = float(np.random.normal(loc=scaler, scale=0.25))
+    if np.isnan(pos_alpha):
+        subj_pos_alpha = subj_alpha
+    else:
+        subj_pos_alpha = float(np.maximum(0.001, np.random.normal(loc=pos_alpha, scale=0.05)))
+    return subj_alpha, subj_pos_alpha, subj_scaler
+
+
+def _rl_rewards(size, p_upper, p_lower, mu_upper, mu_lower, sd_upper, sd_lower, binary_outcome):
+    """Rewards of both options on every trial."""
+    if binary_outcome:
+        rew_up = np.random.binomial(1, p_upper, size).astype(float)
+        rew_low = np.random.binomial(1, p_lower, size).astype(float)
+    else:
+        rew_up = np.random.normal(mu_upper, sd_upper, size).astype(float)
+        rew_low = np.random.normal(mu_lower, sd_lower, size).astype(float)
+    return rew_up, rew_low
+
+
+def _rl_subject_columns(s, split_by, trials):
+    q_up, q_low, sim_drift, p, response, rt, feedback = trials
+    size = len(q_up)
+    return {'q_up': q_up, 'q_low': q_low, 'sim_drift': sim_drift, 'p': p, 'response': response, 'rt': rt,
+            'feedback': feedback, 'subj_idx': np.full(size, s), 'split_by': np.broadcast_to(split_by, size),
+            'trial': np.arange(1, size + 1)}
+
+
+def _rl_frame(subjects, columns):
+    """One DataFrame of the simulated subjects, indexed by trial within subject."""
+    index = np.concatenate([np.arange(len(subject['trial'])) for subject in subjects])
+    return pd.DataFrame(dict((column, np.concatenate([subject[column] for subject in subjects]))
+                             for column in columns), index=index, columns=columns)
+
+def simulate_rl_trials(data, params, n_jobs=None, seed=None, chunk_size=64):
+    """Closed-loop simulation of the RLDDM on the trials of data for many parameter sets.
+
+    The simulated choices determine the feedback on every trial, drawn
+    from the observed feedback of the same response in the same condition
+    (or of the whole condition if that response was never given), and the
+    Q-values are learned from it as in the likelihood.
+
+        :Arguments:
+            data : DataFrame
+                Observed data with 'split_by', 'feedback', 'response' and
+                'q_init' columns.
+            params : dict
+                Arrays (one value per parameter set) or scalars of v,
+                alpha and optionally pos_alpha, sv, a, z, sz, t and st.
+                Without a, only choices are simulated (the RL model).
+
+        :Optional:
+            n_jobs : int
+                Simulate chunks of chunk_size parameter sets in a pool of
+                n_jobs processes (see parallel_map).
+            seed : int
+                Seed of the parallel streams.
+
+        :Returns:
+            response, rt, feedback : arrays of shape (parameter sets, trials)
+    """
+    cache = hddm.likelihoods.rl_trials(data)
+    pools = hddm.likelihoods.value_cache(data, 'simulate_rl_trials')
+    if 'reward_pools' not in pools:
+        pools['reward_pools'] = _rl_reward_pools(cache['response'], cache['feedback'], cache['segments'])
+    rewards, reward_offsets = pools['reward_pools']
+
+    defaults = {'pos_alpha': 100., 'sv': 0, 'a': np.nan, 'z': .5, 'sz': 0, 't': 0, 'st': 0}
+    columns = [np.atleast_1d(np.asarray(params[name] if name in params else defaults[name], dtype=np.double))
+               for name in ('v', 'alpha', 'pos_alpha', 'sv', 'a', 'z', 'sz', 't', 'st')]
+    n_sets = max(len(column) for column in columns)
+    param_matrix = np.column_stack([np.broadcast_to(column, n_sets) for column in columns])
+
+    if n_jobs is None:
+        return hddm.wfpt.gen_rl_batch(param_matrix, cache['segments'], cache['q'], rewards, reward_offsets)
+
+    tasks = [dict(params=param_matrix[start:start + chunk_size], segments=cache['segments'], q=cache['q'],
+                  rewards=rewards, reward_offsets=reward_offsets)
+             for start in range(0, n_sets, chunk_size)]
+    results = parallel_map(hddm.wfpt.gen_rl_batch, tasks, n_jobs=n_jobs, seed=seed)
+    return tuple(np.concatenate(arrays) for arrays in zip(*results))
+
+
+def _rl_reward_pools(response, feedback, segments):
+    """Observed feedback by condition and response, as rewards and reward_offsets of wfpt.gen_rl_batch."""
+    order, offsets = segments
+    pools = []
+    for k in range(len(offsets) - 1):
+        trials = order[offsets[k]:offsets[k + 1]]
+        for option in (0, 1):
+            pool = feedback[trials][response[trials] == option]
+            pools.append(pool if len(pool) else feedback[trials])
+    reward_offsets = np.concatenate(([0], np.cumsum([len(pool) for pool in pools]))).astype(np.intp)
+    return np.ascontiguousarray(np.concatenate(pools), dtype=np.double), reward_offsets
 
-        for i in range(1, n):
-            df.loc[i, 'trial'] = i + 1
-            df.loc[i, 'q_up'] = (df.loc[i - 1, 'q_up'] * (1 - df.loc[i - 1, 'response'])) + ((df.loc[i - 1, 'response'])
-                                                                                             * (df.loc[i - 1, 'q_up'] + (alfa * (df.loc[i - 1, 'rew_up'] - df.loc[i - 1, 'q_up']))))
-            df.loc[i, 'q_low'] = (df.loc[i - 1, 'q_low'] * (df.loc[i - 1, 'response'])) + ((1 - df.loc[i - 1, 'response'])
-                                                                                           * (df.loc[i - 1, 'q_low'] + (alfa * (df.loc[i - 1, 'rew_low'] - df.loc[i - 1, 'q_low']))))
-            df.loc[i, 'sim_drift'] = (
-                df.loc[i, 'q_up'] - df.loc[i, 'q_low']) * (scaler)
-            if 0.01 > df.loc[i, 'sim_drift'] > -0.01:
-                df.loc[i, 'p'] = 0.5
-            else:
-                df.loc[i, 'p'] = (np.exp(-2 * z * df.loc[i, 'sim_drift']) -
-                                  1) / (np.exp(-2 * df.loc[i, 'sim_drift']) - 1)
-            df.loc[i, 'response'] = np.random.binomial(1, df.loc[i, 'p'], 1)
-            if (df.loc[i, 'response'] == 1.0):
-                df.loc[i, 'feedback'] = df.loc[i, 'rew_up']
-                if (df.loc[i, 'feedback'] > df.loc[i, 'q_up']):
-                    alfa = pos_alfa
-                else:
-                    alfa = alpha
-            else:
-                df.loc[i, 'feedback'] = df.loc[i, 'rew_low']
-                if (df.loc[i, 'feedback'] > df.loc[i, 'q_low']):
-                    alfa = pos_alfa
-                else:
-                    alfa = alpha
-
-        all_data.append(df)
-    all_data = pd.concat(all_data, axis=0)
-    all_data = all_data[['q_up', 'q_low', 'p', 'sim_drift',
-                         'response', 'feedback', 'subj_idx', 'split_by', 'trial']]
-
-    return all_data
 
 # function that takes the data as input to simulate the same trials that the subject received
 # the only difference from the simulation fit is that you update q-values not on the simulated choices but on the observed. but you still use the simulated rt and choices
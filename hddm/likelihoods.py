@@ -1,6 +1,9 @@
 
+import weakref
+
 import pymc as pm
 import numpy as np
+import pandas as pd
 from scipy import stats
 
 from kabuki.utils import stochastic_from_dist
@@ -9,6 +12,120 @@ np.seterr(divide='ignore')
 
 import hddm
 
+_value_caches = {}
+
+def value_cache(x, name):
+    """Return the dict of user name for data derived from the observed value x.
+
+    Observed values do not change, so whatever a likelihood derives from
+    them (typed arrays, series values, ...) can be kept across logp calls.
+    Every user gets its own dict so that their keys cannot collide. The
+    dicts are dropped together with x.
+    """
+    key = id(x)
+    caches = None
+    if key in _value_caches:
+        ref, caches = _value_caches[key]
+        if ref() is not x:
+            caches = None
+    if caches is None:
+        caches = {}
+        _value_caches[key] = (weakref.ref(x, lambda ref, key=key: _value_caches.pop(key, None)), caches)
+    return caches.setdefault(name, {})
+
+def unique_trials(x):
+    """Return the unique RTs of the observed value x and their counts.
+
+    RTs are often recorded with a limited resolution, so trials share
+    values and each unique RT only has to be evaluated once, weighted by
+    how often it occurs. Counts are None if all RTs are distinct.
+    """
+    cache = value_cache(x, 'unique_trials')
+    if 'rt' not in cache:
+        rt, counts = np.unique(x['rt'].values, return_counts=True)
+        cache['rt'] = np.ascontiguousarray(rt, dtype=np.double)
+        cache['counts'] = counts.astype(np.double) if len(rt) < len(x) else None
+    return cache['rt'], cache['counts']
+
+def regressor_values(value, params, reg_outcomes):
+    """Replace the regressed entries of params by arrays aligned with the trials of value.
+
+    Regressor nodes return series indexed by the data they were created
+    from. The index object is rebuilt on every evaluation but its labels
+    do not change, so the positions of the trials of value in it are
+    looked up once per regressed parameter and reused while the labels
+    stay equal.
+    """
+    positions = value_cache(value, 'regressor_values')
+    for reg_outcome in reg_outcomes:
+        index = params[reg_outcome].index
+        cached = positions.get(reg_outcome)
+        if cached is None or not cached[0].equals(index):
+            idx = index.get_indexer(value.index)
+            assert (idx >= 0).all(), "regressor %s misses trials of the data" % reg_outcome
+            cached = (index, idx)
+            positions[reg_outcome] = cached
+        params[reg_outcome] = np.asarray(params[reg_outcome].values).reshape(-1)[cached[1]]
+    return params
+
+def rl_trials(x):
+    """Return the cache of the observed RL data x with typed arrays.
+
+    Holds the 'response', 'feedback' and 'split_by' columns as contiguous
+    arrays of the dtypes the RL kernels take, the initial q value 'q' and
+    the condition 'segments' from wfpt.rl_segments.
+    """
+    cache = value_cache(x, 'rl_trials')
+    if 'segments' not in cache:
+        cache['response'] = np.ascontiguousarray(x['response'].values, dtype=int)
+        cache['feedback'] = np.ascontiguousarray(x['feedback'].values, dtype=np.double)
+        cache['split_by'] = np.ascontiguousarray(x['split_by'].values, dtype=int)
+        cache['q'] = float(x['q_init'].iloc[0])
+        cache['segments'] = hddm.wfpt.rl_segments(cache['split_by'])
+    return cache
+
+def rl_random(self):
+    """Simulate the observed RL data of this node anew for the current parent values.
+
+    The learning process is rerun closed-loop, see generate.simulate_rl_trials.
+    """
+    return rl_random_posterior(self, samples=None)
+
+def rl_random_posterior(self, samples=500, n_jobs=None, seed=None):
+    """Simulate the observed RL data of this node for samples posterior draws at once.
+
+    The parents are taken jointly from the same randomly drawn steps of
+    their traces and the draws are simulated in chunks, in a pool of n_jobs
+    processes if n_jobs is set. With seed the result does not depend on
+    n_jobs. Returns the data with the simulated
+    'response', 'feedback' and (for the RLDDM) 'rt', indexed by sample and
+    trial. With samples=None the current parent values are used and the
+    data is returned with its own index.
+    """
+    if samples is None:
+        params = self.parents.value
+    else:
+        traced = [parent for parent in self.parents.values() if isinstance(parent, pm.Node)]
+        random_state = np.random if seed is None else np.random.RandomState(seed)
+        steps = random_state.randint(0, len(traced[0].trace()), samples) if traced else np.zeros(samples, dtype=int)
+        params = dict((name, parent.trace()[steps] if isinstance(parent, pm.Node) else parent)
+                      for name, parent in self.parents.items())
+
+    response, rt, feedback = hddm.generate.simulate_rl_trials(self.value, params, n_jobs=n_jobs, seed=seed)
+
+    n_sets = response.shape[0]
+    sampled = pd.DataFrame(dict((column, np.tile(self.value[column].values, n_sets))
+                                for column in self.value.columns), columns=self.value.columns)
+    sampled['response'] = response.ravel().astype(self.value['response'].dtype)
+    sampled['feedback'] = feedback.ravel()
+    if 'rt' in sampled and not np.isnan(rt).all():
+        sampled['rt'] = rt.ravel()
+    if samples is None:
+        sampled.index = self.value.index
+    else:
+        sampled.index = pd.MultiIndex.from_product([range(n_sets), self.value.index], names=['sample', None])
+    return sampled
+
 def wiener_like_contaminant(value, cont_x, v, sv, a, z, sz, t, st, t_min, t_max,
                             err, n_st, n_sz, use_adaptive, simps_err):
     """Log-likelihood for the simple DDM including contaminants"""
@@ -47,17 +164,59 @@ def generate_wfpt_stochastic_class(wiener_params=None, sampling_method='cdf', cd
                          'w_outlier': 0.1,
                          }
     wp = wiener_params
+    integration = wp.get('integration', 'simpson')
+    if integration not in ('simpson', 'gauss'):
+        raise ValueError("Unknown integration '%s', use 'simpson' or 'gauss'." % integration)
+    cdf_engine = wp.get('cdf_engine', 'dmat')
+    if cdf_engine not in ('dmat', 'series'):
+        raise ValueError("Unknown cdf_engine '%s', use 'dmat' or 'series'." % cdf_engine)
+    # n_st and n_sz are Simpson depths, the Gauss-Legendre rules of integration='gauss'
+    # and of cdf_engine='series' have their own node counts
+    n_gauss_sz = wp.get('n_gauss_sz', 5)
+    n_gauss_st = wp.get('n_gauss_st', 5)
+    # settings that are not arguments of wiener_like
+    like_wp = dict((k, v) for (k, v) in wp.items()
+                   if k not in ('integration', 'cdf_engine', 'n_gauss_sz', 'n_gauss_st'))
+    # gen_cdf_using_pdf only takes the integration settings, not the likelihood-only ones
+    cdf_wp = dict((k, v) for (k, v) in wp.items()
+                  if k in ('err', 'n_st', 'n_sz', 'use_adaptive', 'simps_err', 'w_outlier', 'st_exact'))
+
+    def ftt_like(x, v, sv, a, z, t, p_outlier):
+        # Without sz and st the series part of the density does not depend on v
+        # and sv. Keep it for the current (a, z, t) so that steps changing only
+        # the drift (the most frequent ones) skip the series evaluation. The
+        # cache belongs to the data, which classes with other settings share.
+        rt, counts = unique_trials(x)
+        cache = value_cache(x, 'ftt_like')
+        key = (float(a), float(z), float(t), wp['err'])
+        if cache.get('ftt_key') != key:
+            cache['log_ftt'] = hddm.wfpt.log_ftt_01w_array(rt, a, z, t, wp['err'])
+            cache['ftt_key'] = key
+        return hddm.wfpt.wiener_like_ftt(rt, cache['log_ftt'], v, sv, a, z, t,
+                                         p_outlier=p_outlier, w_outlier=wp.get('w_outlier', 0.1),
+                                         weights=counts)
+
+    def full_like(rt, v, sv, a, z, sz, t, st, p_outlier, weights=None):
+        if integration == 'gauss':
+            return hddm.wfpt.wiener_like_gauss(rt, v, sv, a, z, sz, t, st, wp['err'],
+                                               n_st=n_gauss_st, n_sz=n_gauss_sz,
+                                               p_outlier=p_outlier, w_outlier=wp.get('w_outlier', 0.1),
+                                               weights=weights)
+        return hddm.wfpt.wiener_like(rt, v, sv, a, z, sz, t, st, p_outlier=p_outlier,
+                                     weights=weights, **like_wp)
 
     #create likelihood function
     def wfpt_like(x, v, sv, a, z, sz, t, st, p_outlier=0):
         if x['rt'].abs().max() < 998:
-            return hddm.wfpt.wiener_like(x['rt'].values, v, sv, a, z, sz, t, st,
-                                         p_outlier=p_outlier, **wp)
+            if sz == 0 and st == 0 and not wp.get('deterministic', False):
+                return ftt_like(x, v, sv, a, z, t, p_outlier)
+            rt, counts = unique_trials(x)
+            return full_like(rt, v, sv, a, z, sz, t, st, p_outlier, weights=counts)
         else:  # for missing RTs. Currently undocumented.
             noresponse = x['rt'].abs() >= 999
             ## get sum of log p for trials with RTs as usual ##
-            logp_resp = hddm.wfpt.wiener_like(x.loc[~noresponse, 'rt'].values,
-                                             v, sv, a, z, sz, t, st, p_outlier=p_outlier, **wp)
+            logp_resp = full_like(x.loc[~noresponse, 'rt'].values,
+                                  v, sv, a, z, sz, t, st, p_outlier)
 
             # get number of no-response trials
             n_noresponse = sum(noresponse)
@@ -88,6 +247,9 @@ def generate_wfpt_stochastic_class(wiener_params=None, sampling_method='cdf', cd
 
     #create cdf function
     def cdf(self, x):
+        if cdf_engine == 'series':
+            return hddm.wfpt.cdf_array(x, err=wp['err'], n_st=n_gauss_st, n_sz=n_gauss_sz,
+                                       w_outlier=wp['w_outlier'], **self.parents)
         return hddm.cdfdif.dmat_cdf_array(x, w_outlier=wp['w_outlier'], **self.parents)
 
     #create wfpt class
@@ -95,7 +257,14 @@ def generate_wfpt_stochastic_class(wiener_params=None, sampling_method='cdf', cd
 
     #add pdf and cdf_vec to the class
     wfpt.pdf = pdf
-    wfpt.cdf_vec = lambda self: hddm.wfpt.gen_cdf_using_pdf(time=cdf_range[1], **dict(list(self.parents.items()) + list(wp.items())))
+    wfpt.cdf_vec = lambda self: hddm.wfpt.gen_cdf_using_pdf(time=cdf_range[1], **dict(list(self.parents.items()) + list(cdf_wp.items())))
+    if cdf_engine == 'series':
+        # quantiles solved for directly from the same CDF as cdf
+        wfpt.quantiles_vec = lambda self, quantiles: hddm.wfpt.cdf_quantiles(quantiles, err=wp['err'],
+                                                                             n_st=n_gauss_st,
+                                                                             n_sz=n_gauss_sz,
+                                                                             w_outlier=wp['w_outlier'],
+                                                                             **self.parents)
     wfpt.cdf = cdf
     wfpt.random = random
 
@@ -260,6 +429,10 @@ def add_quantiles_functions_to_pymc_class(pymc_class):
         """
 
         quantiles = np.asarray(quantiles)
+        if hasattr(self, 'quantiles_vec'):
+            # solved for directly from the series CDF
+            return self.quantiles_vec(quantiles)
+
         # generate CDF
         x_lower, cdf_lower, x_upper, cdf_upper = hddm.wfpt.split_cdf(*self.cdf_vec())
 
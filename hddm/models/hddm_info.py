@@ -91,6 +91,19 @@ class HDDM(HDDMBase):
              * n_sz: Maximum depth for numerical integration for Z (default 2)
              * use_adaptive: Whether to use adaptive numerical integration (default True)
              * simps_err: Error bound for Simpson integration (default 1e-3)
+             * integration: 'simpson' (default) or 'gauss'. 'gauss' integrates
+               sz and st with fixed Gauss-Legendre rules, evaluated for all
+               trials at once.
+             * n_gauss_sz, n_gauss_st: Number of Gauss-Legendre nodes for sz
+               and st of integration='gauss' and cdf_engine='series'
+               (default 5 each). n_sz and n_st only set the Simpson depths.
+             * st_exact: Integrate over st exactly as a difference of two first
+               passage CDFs instead of numerically (default False)
+             * cdf_engine: 'dmat' (default) or 'series'. 'series' computes the
+               CDF used by the quantile statistics from the small-time and
+               large-time series with error err, sz and st by Gauss-Legendre
+               rules. It bounds the series error explicitly, but with sz and
+               st it takes about twice as long as 'dmat'.
 
     :Example:
         >>> data, params = hddm.generate.gen_rand_data() # gen data
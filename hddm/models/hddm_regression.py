@@ -12,7 +12,7 @@ from kabuki import Knode
 from kabuki.utils import stochastic_from_dist
 import kabuki.step_methods as steps
 
-def generate_wfpt_reg_stochastic_class(wiener_params=None, sampling_method='cdf', cdf_range=(-5,5), sampling_dt=1e-4):
+def generate_wfpt_reg_stochastic_class(wiener_params=None, sampling_method='exact', cdf_range=(-5,5), sampling_dt=1e-4):
 
     #set wiener_params
     if wiener_params is None:
@@ -26,8 +26,7 @@ def generate_wfpt_reg_stochastic_class(wiener_params=None, sampling_method='cdf'
     def wiener_multi_like(value, v, sv, a, z, sz, t, st, reg_outcomes, p_outlier=0.05):
         """Log-likelihood for the full DDM using the interpolation method"""
         params = {'v': v, 'sv': sv, 'a': a, 'z': z, 'sz': sz, 't': t, 'st': st}
-        for reg_outcome in reg_outcomes:
-            params[reg_outcome] = params[reg_outcome].loc[value['rt'].index].values
+        params = hddm.likelihoods.regressor_values(value, params, reg_outcomes)
         return hddm.wfpt.wiener_like_multi(value['rt'].values,
                                            params['v'], params['sv'], params['a'], params['z'],
                                            params['sz'], params['t'], params['st'], 1e-4,
@@ -37,19 +36,30 @@ def generate_wfpt_reg_stochastic_class(wiener_params=None, sampling_method='cdf'
 
 
     def random(self):
-        param_dict = deepcopy(self.parents.value)
-        del param_dict['reg_outcomes']
+        param_dict = dict(self.parents.value)
+        reg_outcomes = param_dict.pop('reg_outcomes')
+        param_dict = hddm.likelihoods.regressor_values(self.value, param_dict, reg_outcomes)
         sampled_rts = self.value.copy()
 
-        for i in self.value.index:
+        if sampling_method == 'exact':
+            # all trials at once from their own parameters
+            sampled_rts['rt'] = hddm.wfpt.gen_rts_exact(param_dict['v'], param_dict['sv'], param_dict['a'],
+                                                        param_dict['z'], param_dict['sz'], param_dict['t'],
+                                                        param_dict['st'], len(self.value))
+            return sampled_rts
+
+        rts = np.empty(len(self.value))
+        for i in range(len(self.value)):
             #get current params
-            for p in self.parents['reg_outcomes']:
-                param_dict[p] = np.asscalar(self.parents.value[p].loc[i])
+            trial_params = dict(param_dict)
+            for p in reg_outcomes:
+                trial_params[p] = param_dict[p][i]
             #sample
             samples = hddm.generate.gen_rts(method=sampling_method,
-                                            size=1, dt=sampling_dt, **param_dict)
+                                            size=1, dt=sampling_dt, **trial_params)
 
-            sampled_rts.loc[i, 'rt'] = hddm.utils.flip_errors(samples).rt.iloc[0]
+            rts[i] = hddm.utils.flip_errors(samples).rt.iloc[0]
+        sampled_rts['rt'] = rts
 
         return sampled_rts
 
@@ -59,7 +69,7 @@ def generate_wfpt_reg_stochastic_class(wiener_params=None, sampling_method='cdf'
     return stoch
 
 
-wfpt_reg_like = generate_wfpt_reg_stochastic_class(sampling_method='drift')
+wfpt_reg_like = generate_wfpt_reg_stochastic_class()
 
 
 ################################################################################################
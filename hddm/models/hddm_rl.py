@@ -10,6 +10,7 @@ import wfpt
 from kabuki.hierarchical import Knode
 from kabuki.utils import stochastic_from_dist
 from hddm.models import HDDM
+from hddm.likelihoods import value_cache, rl_trials, rl_random, rl_random_posterior
 from wfpt import wiener_like_rlddm
 
 
@@ -65,9 +66,23 @@ def wienerRL_like(x, v, alpha, pos_alpha, sv, a, z, sz, t, st, p_outlier=0):
                      'simps_err': 1e-3,
                      'w_outlier': 0.1}
     wp = wiener_params
-    response = x['response'].values.astype(int)
-    q = x['q_init'].iloc[0]
-    feedback = x['feedback'].values.astype(float)
-    split_by = x['split_by'].values.astype(int)
-    return wiener_like_rlddm(x['rt'].values, response, feedback, split_by, q, alpha, pos_alpha, v, sv, a, z, sz, t, st, p_outlier=p_outlier, **wp)
+    trials = rl_trials(x)
+    cache = value_cache(x, 'wienerRL_like')
+    if 'scored' not in cache:
+        order, offsets = trials['segments']
+        # the first trial of each condition only updates the q values
+        cache['scored'] = np.delete(order, offsets[:-1])
+        cache['rt'] = np.ascontiguousarray(x['rt'].values[cache['scored']], dtype=np.double)
+    # the q values only depend on the learning rates, steps changing the
+    # DDM parameters reuse them
+    key = (float(alpha), float(pos_alpha))
+    if cache.get('q_key') != key:
+        q_diff = wfpt.rl_q_diff(trials['response'], trials['feedback'], trials['q'], alpha, pos_alpha,
+                                trials['segments'])
+        cache['q_diff'] = q_diff[cache['scored']]
+        cache['q_key'] = key
+    return wfpt.wiener_like_trials(cache['rt'], cache['q_diff'] * v, sv, a, z, sz, t, st,
+                                   p_outlier=p_outlier, **wp)
 WienerRL = stochastic_from_dist('wienerRL', wienerRL_like)
+WienerRL.random = rl_random
+WienerRL.random_posterior = rl_random_posterior
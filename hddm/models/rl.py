@@ -10,6 +10,7 @@ import wfpt
 from kabuki.hierarchical import Knode
 from kabuki.utils import stochastic_from_dist
 from hddm.models import HDDM
+from hddm.likelihoods import rl_trials, rl_random, rl_random_posterior
 from wfpt import wiener_like_rl
 from collections import OrderedDict
 
@@ -77,9 +78,9 @@ def RL_like(x, v, alpha, pos_alpha, z=0.5, p_outlier=0):
                      'w_outlier': 0.1}
     sum_logp = 0
     wp = wiener_params
-    response = x['response'].values.astype(int)
-    q = x['q_init'].iloc[0]
-    feedback = x['feedback'].values.astype(float)
-    split_by = x['split_by'].values.astype(int)
-    return wiener_like_rl(response, feedback, split_by, q, alpha, pos_alpha, v, z, p_outlier=p_outlier, **wp)
+    cache = rl_trials(x)
+    return wiener_like_rl(cache['response'], cache['feedback'], cache['split_by'], cache['q'], alpha, pos_alpha,
+                          v, z, p_outlier=p_outlier, segments=cache['segments'], **wp)
 RL = stochastic_from_dist('RL', RL_like)
+RL.random = rl_random
+RL.random_posterior = rl_random_posterior
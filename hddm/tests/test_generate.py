@@ -33,3 +33,111 @@ class TestGenerate(unittest.TestCase):
         hddm.generate.gen_rand_data(subjs=1)
         hddm.generate.gen_rand_data(n_fast_outliers=5, n_slow_outliers=5)
         hddm.generate.gen_rand_data(size=100)
+
+    def test_gen_rts_from_cdf(self):
+        np.random.seed(31)
+        params = {'v': 1., 'sv': .5, 'a': 1.5, 'z': .45, 'sz': .1, 't': .3, 'st': .1}
+        rts = hddm.wfpt.gen_rts_from_cdf(samples=20000, **params)
+        [D, p_value] = kstest(rts, lambda x: hddm.wfpt.cdf_array(x, **params))
+        self.assertTrue(p_value > 0.05)
+
+        hits = hddm.wfpt.gen_cdf_table.cache_info().hits
+        hddm.wfpt.gen_rts_from_cdf(samples=10, **params)
+        self.assertEqual(hddm.wfpt.gen_cdf_table.cache_info().hits, hits + 1)
+
+    def test_exact_samples_to_cdf(self):
+        np.random.seed(20)
+        includes = [[],['z', 'sv'],['z', 'st'],['z', 'sz'], ['z', 'sz','st'], ['z', 'sz','st','sv']]
+        for include in includes:
+            params = hddm.generate.gen_rand_params(include=include)
+            data = hddm.generate.gen_rts(method='exact', size=5000, **params)
+            rts = np.where(data.response == 1, data.rt, -data.rt)
+            cdf_params = dict((name, params.get(name, 0)) for name in ('v', 'sv', 'a', 'z', 'sz', 't', 'st'))
+            [D, p_value] = kstest(rts, lambda x: hddm.wfpt.cdf_array(x, **cdf_params))
+            print('p_value: %f' % p_value)
+            self.assertTrue(p_value > 0.05)
+
+    def test_simulated_drift_chunks(self):
+        """Test that simulating the drift process in many small chunks gives the same RT distribution"""
+        params = {'v': 1., 'a': 1.5, 'z': .5, 't': .3, 'sv': .5, 'sz': .1, 'st': .1}
+        np.random.seed(21)
+        # 5 steps per trial and chunk at first, against one chunk of 20s for all trials
+        rts_chunked, drifts = hddm.generate._gen_rts_from_simulated_drift(params, samples=1000, dt=5e-3,
+                                                                          max_chunk=5000)
+        rts_whole, _ = hddm.generate._gen_rts_from_simulated_drift(params, samples=1000, dt=5e-3, keep_drifts=0,
+                                                                   max_chunk=4*10**6)
+        [D, p_value] = ks_2samp(rts_chunked, rts_whole)
+        self.assertTrue(p_value > 0.05)
+        # all trajectories are kept by default, and stay within the boundaries
+        self.assertEqual(len(drifts), 1000)
+        self.assertTrue(all(((drift >= 0) & (drift <= params['a'])).all() for drift in drifts))
+
+    def test_parallel_reproducible(self):
+        params = {'cond1': {'v': 0, 'a': 2, 't': .3}, 'cond2': {'v': 1, 'a': 2, 't': .3}}
+        # start the OpenMP thread pool first, forked workers would hang on it
+        hddm.wfpt.wiener_like(np.linspace(.5, 2., 100), 1., 0., 2., .5, 0., .3, 0., 1e-4)
+        data_serial, _ = hddm.generate.gen_rand_data(params, size=20, subjs=3, seed=4, n_jobs=1)
+        data_parallel, _ = hddm.generate.gen_rand_data(params, size=20, subjs=3, seed=4, n_jobs=2)
+        self.assertTrue(data_serial.equals(data_parallel))
+
+        rl_serial = hddm.generate.gen_rand_rl_data(2., .2, size=10, subjs=3, seed=3, n_jobs=1)
+        rl_parallel = hddm.generate.gen_rand_rl_data(2., .2, size=10, subjs=3, seed=3, n_jobs=2)
+        self.assertTrue(rl_serial.equals(rl_parallel))
+
+    def test_exact_per_trial_params(self):
+        np.random.seed(23)
+        params = [{'v': 1., 'sv': .5, 'a': 1.5, 'z': .45, 'sz': .1, 't': .3, 'st': .1},
+                  {'v': -1.5, 'sv': 0., 'a': 2., 'z': .6, 'sz': 0., 't': .2, 'st': 0.}]
+        trial_params = dict((name, np.tile([params[0][name], params[1][name]], 5000)) for name in params[0])
+        rts = hddm.wfpt.gen_rts_exact(samples=10000, **trial_params)
+        for i in range(2):
+            [D, p_value] = kstest(rts[i::2], lambda x: hddm.wfpt.cdf_array(x, **params[i]))
+            self.assertTrue(p_value > 0.05)
+
+    def test_gen_rl_trials(self):
+        np.random.seed(24)
+        # with alpha=1 both Q-values settle on their rewards and the drift on the scaler
+        n = 20000
+        q_up, q_low, drift, p, response, rt, feedback = hddm.wfpt.gen_rl_trials(np.ones(n), np.zeros(n), .5, 1., 1.,
+                                                                               1.2, 1.3, .25, .4)
+        settled = drift == 1.2
+        rts = np.where(response[settled] == 1, rt[settled], -rt[settled])
+        [D, p_value] = kstest(rts, lambda x: hddm.wfpt.cdf_array(x, 1.2, 0, 1.3, .4, 0, .25, 0))
+        self.assertTrue(p_value > 0.05)
+
+        # draws come from the given Generator or BitGenerator, or one seeded from np.random
+        args = (np.ones(100), np.zeros(100), .5, .3, .3, 2., 1.3, .25, .4)
+        np.testing.assert_array_equal(hddm.wfpt.gen_rl_trials(*args, rng=np.random.default_rng(3)),
+                                      hddm.wfpt.gen_rl_trials(*args, rng=np.random.PCG64(3)))
+        np.random.seed(3)
+        trials = hddm.wfpt.gen_rl_trials(*args)
+        np.random.seed(3)
+        np.testing.assert_array_equal(trials, hddm.wfpt.gen_rl_trials(*args))
+        self.assertRaises(TypeError, hddm.wfpt.gen_rl_trials, *args, rng=np.random.RandomState(3))
+
+        data = hddm.generate.gen_rand_rlddm_data(a=1.5, t=.3, scaler=2., alpha=.2, size=50, subjs=3,
+                                                 p_upper=.8, p_lower=.2, seed=5)
+        self.assertEqual(data.shape, (150, 9))
+        self.assertTrue(data.equals(hddm.generate.gen_rand_rlddm_data(a=1.5, t=.3, scaler=2., alpha=.2, size=50,
+                                                                      subjs=3, p_upper=.8, p_lower=.2, seed=5)))
+
+    def test_simulate_rl_trials(self):
+        np.random.seed(25)
+        data = hddm.generate.gen_rand_rlddm_data(a=1.5, t=.3, scaler=3., alpha=.3, size=100, p_upper=.8, p_lower=.2)
+        data['q_init'] = .5
+        params = {'v': np.array([0., 3.]), 'alpha': -.8, 'a': 1.5, 't': .3}
+        response, rt, feedback = hddm.generate.simulate_rl_trials(data, params)
+        self.assertEqual(response.shape, (2, 100))
+        # without drift the learning does not matter
+        rts = np.where(response[0] == 1, rt[0], -rt[0])
+        [D, p_value] = kstest(rts, lambda x: hddm.wfpt.cdf_array(x, 0, 0, 1.5, .5, 0, .3, 0))
+        self.assertTrue(p_value > 0.05)
+        # feedback is resampled from the observed feedback of the simulated choice
+        self.assertTrue(np.isin(feedback[response == 1], data.feedback[data.response == 1]).all())
+
+        params = {'v': np.linspace(0, 3, 100), 'alpha': -.8}
+        choices_serial = hddm.generate.simulate_rl_trials(data, params, n_jobs=1, seed=1, chunk_size=16)
+        choices_parallel = hddm.generate.simulate_rl_trials(data, params, n_jobs=2, seed=1, chunk_size=16)
+        self.assertTrue(np.isnan(choices_serial[1]).all())
+        for serial, parallel in zip(choices_serial, choices_parallel):
+            np.testing.assert_array_equal(serial, parallel)
@@ -1,7 +1,11 @@
 import numpy as np
 from numpy.random import rand
+import pandas as pd
 import scipy as sp
 
+import os
+import subprocess
+import sys
 import unittest
 
 import pymc as pm
@@ -96,6 +100,320 @@ class TestWfpt(unittest.TestCase):
 
         self.assertTrue(-np.Inf == hddm.wfpt.wiener_like(np.array([1.,2.,3.,0.]), 1, 0, 2, .5, 0, 0, 0, 1e-4)), "wiener_like_simple should have returned -np.Inf"
 
+    def test_wiener_like_batch(self):
+        np.random.seed(123)
+        rts = rand(100)*2 + 0.7
+        rts[::3] *= -1
+        params = []
+        for i in range(20):
+            p = hddm.generate.gen_rand_params(include=('sv','sz','st'))
+            params.append([p['v'], p['sv'], p['a'], p['z'], p['sz'], p['t'], p['st'], rand()*0.1])
+        params = np.array(params)
+        # out of range p_outlier yields -inf for that row only
+        params[0, 7] = 1.5
+
+        batch_logp = hddm.wfpt.wiener_like_batch(rts, params, 1e-4, n_st=2, n_sz=2, simps_err=1e-3)
+        for i in range(params.shape[0]):
+            logp = hddm.wfpt.wiener_like(rts, *params[i, :7], err=1e-4, n_st=2, n_sz=2,
+                                         simps_err=1e-3, p_outlier=params[i, 7])
+            np.testing.assert_equal(batch_logp[i], logp)
+        self.assertTrue(batch_logp[0] == -np.inf)
+
+    def test_wiener_like_deterministic(self):
+        np.random.seed(123)
+        params = hddm.generate.gen_rand_params(include=('sv','sz','st'))
+        rts = params['t'] + params['st'] + rand(2000)*2
+        rts[::4] *= -1
+        args = (rts, params['v'], params['sv'], params['a'], params['z'], params['sz'],
+                params['t'], params['st'], 1e-4)
+
+        logp = hddm.wfpt.wiener_like(*args)
+        logp_det = hddm.wfpt.wiener_like(*args, deterministic=True)
+        np.testing.assert_almost_equal(logp, logp_det, 6)
+        self.assertEqual(logp_det, hddm.wfpt.wiener_like(*args, deterministic=True))
+
+        cont_x = np.zeros(len(rts), dtype=np.int32)
+        cont_x[::7] = 1
+        cont_args = args[:-1] + (0., 5., 1e-4)
+        logp = hddm.wfpt.wiener_like_contaminant(rts, cont_x, *cont_args[1:])
+        logp_det = hddm.wfpt.wiener_like_contaminant(rts, cont_x, *cont_args[1:], deterministic=True)
+        np.testing.assert_almost_equal(logp, logp_det, 6)
+
+        self.assertTrue(-np.inf == hddm.wfpt.wiener_like(np.array([1.,2.,3.,0.]), 1, 0, 2, .5, 0, 0, 0, 1e-4, deterministic=True))
+
+    def test_wiener_like_ftt(self):
+        np.random.seed(123)
+        rts = rand(500)*2 + 0.2
+        rts[::3] *= -1
+        for sv in (0, 0.5):
+            params = hddm.generate.gen_rand_params(include=('z',))
+            log_ftt = hddm.wfpt.log_ftt_01w_array(rts, params['a'], params['z'], params['t'], 1e-4)
+            # only the drift changes, the series values are reused
+            for v in (-1., 0., params['v']):
+                logp = hddm.wfpt.wiener_like(rts, v, sv, params['a'], params['z'], 0,
+                                             params['t'], 0, 1e-4, p_outlier=0.05)
+                logp_ftt = hddm.wfpt.wiener_like_ftt(rts, log_ftt, v, sv, params['a'], params['z'],
+                                                     params['t'], p_outlier=0.05)
+                np.testing.assert_almost_equal(logp, logp_ftt, 8)
+
+    def test_log_pdf_tails(self):
+        """Log densities stay finite in tails where the density underflows"""
+        rts = np.array([-1.2, .8, -30., 60., 200.])
+        for v, sv, a, z, sz, t, st in ((3., 0, 1., .5, 0, .3, 0), (1., .5, 1.5, .5, 0, .3, 0),
+                                       (3., .5, 1., .5, .2, .3, .2)):
+            logp = hddm.wfpt.pdf_array(rts, v, sv, a, z, sz, t, st, 1e-4, logp=True)
+            p = hddm.wfpt.pdf_array(rts, v, sv, a, z, sz, t, st, 1e-4)
+            self.assertTrue(np.all(np.isfinite(logp)))
+            normal = p >= np.finfo(float).tiny
+            np.testing.assert_allclose(logp[normal], np.log(p[normal]), rtol=1e-10)
+            self.assertTrue(np.isfinite(hddm.wfpt.wiener_like(rts, v, sv, a, z, sz, t, st, 1e-4)))
+        self.assertEqual(hddm.wfpt.pdf_array(rts, 3., 0, 1., .5, 0, .3, 0, 1e-4)[-1], 0)
+        # the tail decays exponentially, also where the density is denormal (rt 76 to 80) or zero
+        logp = hddm.wfpt.pdf_array(np.arange(72., 86., 2.), 3., 0, 1., .5, .2, .3, .2, 1e-4, logp=True)
+        np.testing.assert_allclose(np.diff(logp), np.diff(logp)[0], rtol=1e-5)
+
+    def test_wiener_like_gauss(self):
+        rng = np.random.RandomState(123)
+        rts = rng.rand(500)*2 + 0.5
+        rts[::3] *= -1
+        for v, sv, a, z, sz, t, st in ((1., .3, 1.5, .5, .2, .3, .15), (-.5, 0, 2., .4, .3, .35, 0),
+                                       (.5, 0, 1.8, .6, 0, .3, .2)):
+            logp = hddm.wfpt.wiener_like(rts, v, sv, a, z, sz, t, st, 1e-8, n_st=10, n_sz=10,
+                                         simps_err=1e-10, p_outlier=0.05)
+            logp_gauss = hddm.wfpt.wiener_like_gauss(rts, v, sv, a, z, sz, t, st, 1e-8, n_st=8, n_sz=8,
+                                                     p_outlier=0.05)
+            np.testing.assert_allclose(logp, logp_gauss, rtol=1e-7)
+            np.testing.assert_allclose(hddm.wfpt.pdf_gauss_array(rts, v, sv, a, z, sz, t, st, 1e-8, 8, 8),
+                                       hddm.wfpt.pdf_array(rts, v, sv, a, z, sz, t, st, 1e-8, n_st=10, n_sz=10,
+                                                           simps_err=1e-10), rtol=1e-5)
+
+        # RTs just above t - st/2, where most of the st interval has no density
+        v, sv, a, z, sz, t, st = 1., .3, 1.5, .5, .2, .3, .15
+        rts = t - st/2 + np.array([.01, .03, .05, .1])
+        rts = np.concatenate([rts, -rts])
+        exact = hddm.wfpt.pdf_array(rts, v, sv, a, z, sz, t, st, 1e-10, n_st=12, n_sz=12, simps_err=1e-12,
+                                    st_exact=True)
+        np.testing.assert_allclose(hddm.wfpt.pdf_gauss_array(rts, v, sv, a, z, sz, t, st, 1e-10, 8, 8), exact,
+                                   rtol=1e-3)
+        self.assertTrue(np.isfinite(hddm.wfpt.wiener_like_gauss(rts, v, sv, a, z, sz, t, st, 1e-10, 8, 8)))
+
+    def test_full_pdf_st_exact(self):
+        """Test the CDF difference over st against numerical integration"""
+        rng = np.random.RandomState(123)
+        for i in range(200):
+            sv = rng.rand()*0.8*(i % 2)
+            v = (rng.rand() - .5)*6
+            a = .6 + rng.rand()*2.5
+            z = .2 + rng.rand()*.6
+            st = rng.rand()*.3 + .01
+            t = st/2 + rng.rand()*.3
+            sz = rng.rand()*min(z, 1 - z)*(i % 3 == 0)
+            rt = (rng.rand()*4 + t - st/2) * np.sign(rng.rand() - .5)
+            res = hddm.wfpt.full_pdf(rt, v, sv, a, z, sz, t, st, 1e-10, n_st=12, n_sz=12, simps_err=1e-12)
+            exact = hddm.wfpt.full_pdf(rt, v, sv, a, z, sz, t, st, 1e-10, n_st=12, n_sz=12, simps_err=1e-12,
+                                       st_exact=True)
+            np.testing.assert_allclose(exact, res, rtol=1e-6, atol=1e-10)
+
+    def test_wiener_like_grad(self):
+        """Test the analytic gradient against central finite differences"""
+        np.random.seed(123)
+        rts = rand(200)*2 + 0.4
+        rts[::3] *= -1
+        names = ('v', 'a', 'z', 't', 'sv')
+        for sz, st in ((0, 0), (0.2, 0.1)):
+            params = {'v': 1.2, 'sv': 0.5, 'a': 2., 'z': 0.55, 'sz': sz, 't': 0.25, 'st': st}
+            logp, grad = hddm.wfpt.wiener_like_grad(rts, err=1e-10, p_outlier=0.05, **params)
+            logp_simpson = hddm.wfpt.wiener_like(rts, err=1e-10, n_st=10, n_sz=10, use_adaptive=0,
+                                                 p_outlier=0.05, **params)
+            np.testing.assert_almost_equal(logp, logp_simpson, 8)
+            h = 1e-6
+            for i, name in enumerate(names):
+                up, down = dict(params), dict(params)
+                up[name] += h
+                down[name] -= h
+                fd = (hddm.wfpt.wiener_like_grad(rts, err=1e-10, p_outlier=0.05, **up)[0] -
+                      hddm.wfpt.wiener_like_grad(rts, err=1e-10, p_outlier=0.05, **down)[0]) / (2*h)
+                np.testing.assert_allclose(grad[i], fd, rtol=1e-5, atol=1e-5)
+
+    def test_wiener_like_grad_threads(self):
+        """Test that the gradient is deterministic and correct with several OpenMP threads"""
+        code = ("import numpy as np, hddm\n"
+                "rts = np.linspace(0.4, 2.4, 2000)\n"
+                "rts[::3] *= -1\n"
+                "params = {'v': 1.2, 'sv': 0.5, 'a': 2., 'z': 0.55, 'sz': 0.2, 't': 0.25, 'st': 0.1}\n"
+                "print(repr([list(hddm.wfpt.wiener_like_grad(rts, err=1e-10, **params)[1]) for i in range(5)]))\n")
+        env = dict(os.environ, OMP_NUM_THREADS='4')
+        out = subprocess.check_output([sys.executable, '-c', code], env=env)
+        grads = np.array(eval(out))
+        for grad in grads[1:]:
+            np.testing.assert_allclose(grad, grads[0], rtol=1e-10)
+
+        rts = np.linspace(0.4, 2.4, 2000)
+        rts[::3] *= -1
+        params = {'v': 1.2, 'sv': 0.5, 'a': 2., 'z': 0.55, 'sz': 0.2, 't': 0.25, 'st': 0.1}
+        h = 1e-6
+        for i, name in enumerate(('v', 'a', 'z', 't', 'sv')):
+            up, down = dict(params), dict(params)
+            up[name] += h
+            down[name] -= h
+            fd = (hddm.wfpt.wiener_like_grad(rts, err=1e-10, **up)[0] -
+                  hddm.wfpt.wiener_like_grad(rts, err=1e-10, **down)[0]) / (2*h)
+            np.testing.assert_allclose(grads[0][i], fd, rtol=1e-5, atol=1e-5)
+
+    def test_wiener_like_trials(self):
+        """Test per-trial parameters against a loop over full_pdf"""
+        rs = np.random.RandomState(10)
+        rts = rs.rand(300)*2 + 0.5
+        rts[::3] *= -1
+        rts[[5, 7]] = 999., -999.
+        v = rs.randn(300)
+        a = 1.5 + rs.rand(300)*.5
+        logp = 0
+        for i in range(len(rts)):
+            if rts[i] == 999.:
+                p = (np.exp(-2*a[i]*.5*v[i]) - 1) / (np.exp(-2*a[i]*v[i]) - 1)
+            elif rts[i] == -999.:
+                p = 1 - (np.exp(-2*a[i]*.5*v[i]) - 1) / (np.exp(-2*a[i]*v[i]) - 1)
+            else:
+                p = hddm.wfpt.full_pdf(rts[i], v[i], .2, a[i], .5, .1, .3, .1, 1e-4, 10, 10) * .95 + .005
+            logp += np.log(p)
+        np.testing.assert_allclose(hddm.wfpt.wiener_like_multi(rts, v, .2, a, .5, .1, .3, .1, 1e-4, ['v', 'a'],
+                                                               p_outlier=.05, w_outlier=.1),
+                                   logp, rtol=1e-12)
+        self.assertRaises(ValueError, hddm.wfpt.wiener_like_trials, rts, v[1:], .2, a, .5, .1, .3, .1, 1e-4)
+
+    def test_rl_segments(self):
+        """Test that the RL likelihoods sum the conditions given by rl_segments"""
+        rs = np.random.RandomState(11)
+        split_by = rs.randint(0, 4, 400)
+        response = rs.randint(0, 2, 400)
+        feedback = rs.rand(400)
+        rts = (rs.rand(400)*1.5 + .4) * np.where(response == 1, 1, -1)
+        order, offsets = hddm.wfpt.rl_segments(split_by)
+        for k in range(4):
+            np.testing.assert_array_equal(order[offsets[k]:offsets[k+1]], np.flatnonzero(split_by == k))
+
+        segments = (order, offsets)
+        logp = hddm.wfpt.wiener_like_rlddm(rts, response, feedback, split_by, .5, .2, -.3, 2., 0, 1.5, .5,
+                                           0, .3, 0, 1e-4, segments=segments)
+        logp_rl = hddm.wfpt.wiener_like_rl(response, feedback, split_by, .5, .2, -.3, 2., .5, segments=segments)
+        conditions = [split_by == k for k in range(4)]
+        np.testing.assert_allclose(logp, sum(hddm.wfpt.wiener_like_rlddm(rts[c], response[c], feedback[c], split_by[c],
+                                                                         .5, .2, -.3, 2., 0, 1.5, .5, 0, .3, 0, 1e-4)
+                                             for c in conditions), rtol=1e-12)
+        np.testing.assert_allclose(logp_rl, sum(hddm.wfpt.wiener_like_rl(response[c], feedback[c], split_by[c],
+                                                                         .5, .2, -.3, 2., .5)
+                                                for c in conditions), rtol=1e-12)
+
+    def test_rl_q_diff(self):
+        """Test the RLDDM likelihood from cached q value differences"""
+        rs = np.random.RandomState(12)
+        split_by = rs.randint(0, 3, 300)
+        response = rs.randint(0, 2, 300)
+        feedback = rs.rand(300)
+        rts = (rs.rand(300)*1.5 + .4) * np.where(response == 1, 1, -1)
+        segments = hddm.wfpt.rl_segments(split_by)
+        scored = np.delete(segments[0], segments[1][:-1])
+        for alpha, pos_alpha in ((.2, 100.), (.2, -.5)):
+            q_diff = hddm.wfpt.rl_q_diff(response, feedback, .5, alpha, pos_alpha, segments)
+            for v in (1., 3.):
+                logp = hddm.wfpt.wiener_like_rlddm(rts, response, feedback, split_by, .5, alpha, pos_alpha, v,
+                                                   .1, 1.5, .5, .1, .3, .1, 1e-4, p_outlier=.05, w_outlier=.1)
+                np.testing.assert_allclose(hddm.wfpt.wiener_like_trials(rts[scored], q_diff[scored] * v, .1, 1.5,
+                                                                        .5, .1, .3, .1, 1e-4, simps_err=1e-8,
+                                                                        p_outlier=.05, w_outlier=.1),
+                                           logp, rtol=1e-12)
+
+    def test_wiener_like_multi_rlddm(self):
+        """Test the RLDDM with per-trial parameters against a loop over full_pdf"""
+        rs = np.random.RandomState(15)
+        split_by = np.sort(rs.randint(0, 3, 200))
+        response = rs.randint(0, 2, 200)
+        feedback = rs.rand(200)
+        rts = (rs.rand(200)*1.5 + .4) * np.where(response == 1, 1, -1)
+        v = rs.rand(200)*3
+        alpha = rs.randn(200)
+        logp = 0
+        for i in range(200):
+            if i == 0 or split_by[i] != split_by[i-1]:
+                qs = [.5, .5]
+            p = hddm.wfpt.full_pdf(rts[i], v[i] * (qs[1] - qs[0]), .1, 1.5, .5, .1, .3, .1, 1e-4, 2, 2)
+            logp += np.log(p * .95 + .005)
+            lr = np.exp(alpha[i]) / (1 + np.exp(alpha[i]))
+            qs[response[i]] += lr * (feedback[i] - qs[response[i]])
+        np.testing.assert_allclose(hddm.wfpt.wiener_like_multi_rlddm(rts, response, feedback, split_by, .5, v,
+                                                                     .1, 1.5, .5, .1, .3, .1, alpha, 1e-4,
+                                                                     ['v', 'alpha'], n_st=2, n_sz=2,
+                                                                     p_outlier=.05, w_outlier=.1),
+                                   logp, rtol=1e-9)
+
+    def test_dmat_cdf_array(self):
+        """Test the dmat CDF against the integrated density"""
+        for params in ((1., .5, 2., .4, .2, .3, .2), (-.5, 0., 1.5, .6, 0, .4, 0)):
+            x, cdf = hddm.wfpt.gen_cdf_using_pdf(*params, time=5, err=1e-8, n_st=10, n_sz=10, simps_err=1e-8,
+                                                 N=1000)
+            np.testing.assert_allclose(hddm.cdfdif.dmat_cdf_array(x, *params, p_outlier=0, w_outlier=.1), cdf,
+                                       atol=2e-3)
+
+    def test_cdf_array(self):
+        """Test the series CDF against the integrated density"""
+        for params in ((1., 0, 2., .4, 0, .3, 0), (1., .5, 2., .4, .2, .3, .2), (-.5, 0., 1.5, .6, 0, .4, 0),
+                       (2., 1., 1., .5, .1, .2, .1)):
+            x, cdf = hddm.wfpt.gen_cdf_using_pdf(*params, time=8, err=1e-8, n_st=10, n_sz=10, simps_err=1e-8,
+                                                 N=2000)
+            np.testing.assert_allclose(hddm.wfpt.cdf_array(x, *params, err=1e-8), cdf, atol=1e-4)
+        x = np.linspace(-4, 4, 21)
+        params = (1., .5, 2., .4, .2, .3, .2)
+        # the default sz and st nodes against a dense rule, also for RTs inside the st interval
+        x_dense = np.linspace(-1, 1, 1001)
+        np.testing.assert_allclose(hddm.wfpt.cdf_array(x_dense, *params),
+                                   hddm.wfpt.cdf_array(x_dense, *params, n_st=40, n_sz=40), atol=1e-5)
+        np.testing.assert_allclose(hddm.wfpt.cdf_array(x, *params, p_outlier=.05, w_outlier=.1),
+                                   hddm.cdfdif.dmat_cdf_array(x, *params, p_outlier=.05, w_outlier=.1), atol=1e-4)
+
+    def test_cdf_quantiles(self):
+        """Test that the solved quantiles invert the series CDF and agree with a dense CDF"""
+        quantiles = np.array([.1, .3, .5, .7, .9])
+        for params in ((1., 0, 2., .4, 0, .3, 0), (1., .5, 2., .4, .2, .3, .2)):
+            q_lower, q_upper, p_upper = hddm.wfpt.cdf_quantiles(quantiles, *params)
+            p_lower = hddm.wfpt.cdf_array(np.zeros(1), *params)[0]
+            np.testing.assert_almost_equal(p_upper, 1 - p_lower)
+            np.testing.assert_allclose((p_lower - hddm.wfpt.cdf_array(-q_lower, *params)) / p_lower, quantiles,
+                                       atol=1e-6)
+            np.testing.assert_allclose((hddm.wfpt.cdf_array(q_upper, *params) - p_lower) / p_upper, quantiles,
+                                       atol=1e-6)
+
+            x, cdf = hddm.wfpt.gen_cdf_using_pdf(*params, err=1e-8, N=10000, time=15)
+            x_lower, cdf_lower, x_upper, cdf_upper = hddm.wfpt.split_cdf(x, cdf)
+            np.testing.assert_allclose(q_lower, x_lower[np.searchsorted(cdf_lower, quantiles*cdf_lower[-1])],
+                                       atol=2e-3)
+            np.testing.assert_allclose(q_upper, x_upper[np.searchsorted(cdf_upper, quantiles*cdf_upper[-1])],
+                                       atol=2e-3)
+
+    def test_wiener_like_weights(self):
+        """Test that unique RTs weighted by their counts give the likelihood of all RTs"""
+        rs = np.random.RandomState(9)
+        rts = np.round(rs.rand(500)*2 + 0.3, 2)
+        rts[::3] *= -1
+        rts[::50] = 0.1  # below t, zero weights must not turn these into -inf
+        unique, counts = np.unique(rts, return_counts=True)
+        counts = counts.astype(np.double)
+        for sz, st in ((0, 0), (0.2, 0.1)):
+            params = {'v': 1., 'sv': 0.2, 'a': 2., 'z': 0.5, 'sz': sz, 't': 0.2, 'st': st, 'err': 1e-4}
+            all_trials = hddm.wfpt.wiener_like(rts, **params)
+            self.assertEqual(all_trials, -np.inf)
+            w = counts.copy()
+            w[unique == 0.1] = 0
+            for deterministic in (0, 1):
+                np.testing.assert_allclose(
+                    hddm.wfpt.wiener_like(unique, weights=w, deterministic=deterministic, **params),
+                    hddm.wfpt.wiener_like(rts[rts != 0.1], **params), rtol=1e-12)
+            np.testing.assert_allclose(hddm.wfpt.pdf_array(unique, logp=1, weights=w, **params).sum(),
+                                       hddm.wfpt.pdf_array(rts[rts != 0.1], logp=1, **params).sum(),
+                                       rtol=1e-12)
+        self.assertRaises(ValueError, hddm.wfpt.wiener_like, unique, 1., .2, 2., .5, 0, .2, 0, 1e-4,
+                          weights=counts[1:])
+
     def test_pdf_sv(self, samples=50):
         """Test if our wfpt pdf_sv implementation produces the same value as numerical integration over v"""
         func = lambda v_i,value,err,v,sv,z,a: hddm.wfpt.full_pdf(value, v_i, 0, a, z, 0, 0, 0, err) * norm.pdf(v_i,v,sv)
@@ -262,5 +580,148 @@ class TestWfptFull(unittest.TestCase):
             t = 0.2
             st = 0.1
 
+
+class TestLikelihoodFunctions(unittest.TestCase):
+    """Test the logp functions of the stochastic classes on data frames against the wfpt kernels"""
+
+    wp = {'err': 1e-4, 'n_st': 2, 'n_sz': 2, 'use_adaptive': 1, 'simps_err': 1e-3, 'w_outlier': 0.1}
+
+    def rt_data(self, seed, size=400):
+        rs = np.random.RandomState(seed)
+        rts = np.round(rs.rand(size)*2 + 0.4, 2)
+        rts[::3] *= -1
+        # a non-default index, as the data of a single subject or condition has
+        return pd.DataFrame({'rt': rts}, index=rs.permutation(size*2)[:size])
+
+    def rl_data(self, seed, size=300):
+        rs = np.random.RandomState(seed)
+        response = rs.randint(0, 2, size)
+        return pd.DataFrame({'split_by': rs.randint(0, 3, size), 'feedback': rs.rand(size), 'response': response,
+                             'rt': (np.round(rs.rand(size)*1.5, 2) + .4) * np.where(response == 1, 1, -1),
+                             'q_init': .5}, index=rs.permutation(size*2)[:size])
+
+    def test_wfpt_like_routing(self):
+        """Test that every path of wfpt_like gives the likelihood of all trials"""
+        data = self.rt_data(20)
+        rts = data['rt'].values
+        wfpt_like = generate_wfpt_stochastic_class(dict(self.wp)).raw_fns['logp']
+        det_like = generate_wfpt_stochastic_class(dict(self.wp, deterministic=True)).raw_fns['logp']
+        params = {'v': 1., 'sv': .3, 'a': 2., 'z': .4, 't': .3, 'p_outlier': .05}
+
+        # without sz and st the series values are taken from the ftt cache
+        np.testing.assert_allclose(wfpt_like(data, sz=0, st=0, **params),
+                                   hddm.wfpt.wiener_like(rts, sz=0, st=0, **dict(params, **self.wp)), rtol=1e-10)
+        self.assertIn('ftt_key', value_cache(data, 'ftt_like'))
+
+        other = self.rt_data(20)
+        for sz, st in ((.2, 0), (0, .1), (.2, .1)):
+            np.testing.assert_allclose(wfpt_like(other, sz=sz, st=st, **params),
+                                       hddm.wfpt.wiener_like(rts, sz=sz, st=st, **dict(params, **self.wp)),
+                                       rtol=1e-10)
+        np.testing.assert_allclose(det_like(other, sz=0, st=0, **params),
+                                   hddm.wfpt.wiener_like(rts, sz=0, st=0, deterministic=True,
+                                                         **dict(params, **self.wp)), rtol=1e-10)
+        self.assertNotIn('ftt_key', value_cache(other, 'ftt_like'))
+
+        # missing RTs only count the boundary they were assigned to
+        missing = data.copy()
+        missing.iloc[:10, 0] = 999.
+        missing.iloc[:3, 0] = -999.
+        p_upper = (np.exp(-2*2.*.4*1.) - 1) / (np.exp(-2*2.*1.) - 1)
+        np.testing.assert_allclose(wfpt_like(missing, sz=.2, st=0, **params),
+                                   hddm.wfpt.wiener_like(rts[10:], sz=.2, st=0, **dict(params, **self.wp)) +
+                                   sp.stats.binom.logpmf(7, 10, p_upper), rtol=1e-10)
+
+    def test_wfpt_like_cache(self):
+        """Test that the ftt cache follows changes of a, z, t and err"""
+        data = self.rt_data(21)
+        rts = data['rt'].values
+        wfpt_like = generate_wfpt_stochastic_class(dict(self.wp)).raw_fns['logp']
+        coarse_wp = dict(self.wp, err=1e-2)
+        coarse_like = generate_wfpt_stochastic_class(dict(coarse_wp)).raw_fns['logp']
+        steps = [{'v': 1.}, {'v': -.5}, {'a': 1.6}, {'v': .7}, {'z': .6}, {'t': .2}, {'sv': .5}, {'t': .25},
+                 {'a': 2.2, 'v': 1.}]
+        params = {'v': 1., 'sv': 0, 'a': 2., 'z': .5, 'sz': 0, 't': .3, 'st': 0}
+        for step in steps:
+            params.update(step)
+            np.testing.assert_allclose(wfpt_like(data, **params),
+                                       hddm.wfpt.wiener_like(rts, **dict(params, **self.wp)), rtol=1e-10)
+            # a class with another err shares the data but must not reuse the series values
+            np.testing.assert_allclose(coarse_like(data, **params),
+                                       hddm.wfpt.wiener_like(rts, **dict(params, **coarse_wp)), rtol=1e-10)
+            self.assertEqual(value_cache(data, 'ftt_like')['ftt_key'],
+                             (params['a'], params['z'], params['t'], coarse_wp['err']))
+
+    def test_unique_trials(self):
+        """Test that unique_trials gives the RTs of the data with their counts"""
+        data = self.rt_data(22)
+        rt, counts = unique_trials(data)
+        np.testing.assert_array_equal(np.repeat(rt, counts.astype(int)), np.sort(data['rt'].values))
+        self.assertIs(unique_trials(data)[0], rt)
+        distinct = pd.DataFrame({'rt': np.arange(1., 11.)})
+        self.assertIsNone(unique_trials(distinct)[1])
+
+    def test_rl_trials(self):
+        """Test the typed arrays and segments of rl_trials against the pandas columns"""
+        data = self.rl_data(23)
+        cache = rl_trials(data)
+        for column in ('response', 'feedback', 'split_by'):
+            np.testing.assert_array_equal(cache[column], data[column].values)
+        self.assertEqual(cache['response'].dtype, np.dtype(int))
+        self.assertEqual(cache['split_by'].dtype, np.dtype(int))
+        self.assertEqual(cache['feedback'].dtype, np.double)
+        self.assertEqual(cache['q'], .5)
+        order, offsets = cache['segments']
+        for k, (condition, trials) in enumerate(data.reset_index(drop=True).groupby('split_by')):
+            np.testing.assert_array_equal(order[offsets[k]:offsets[k+1]], trials.index.values)
+        self.assertIs(rl_trials(data), cache)
+
+    def test_wienerRL_like(self):
+        """Test the RLDDM likelihood and its q value cache against wiener_like_rlddm"""
+        from hddm.models.hddm_rl import wienerRL_like
+        data = self.rl_data(24)
+        cache = rl_trials(data)
+        wfpt_like = generate_wfpt_stochastic_class(dict(self.wp)).raw_fns['logp']
+        params = {'v': 2., 'alpha': .2, 'pos_alpha': 100., 'sv': 0, 'a': 1.5, 'z': .5, 'sz': 0, 't': .3, 'st': 0}
+        steps = [{}, {'v': 3.}, {'alpha': -.5}, {'a': 2.}, {'pos_alpha': .4}, {'v': 1., 'sz': .1, 'st': .1},
+                 {'alpha': .2, 'pos_alpha': 100.}]
+        for step in steps:
+            params.update(step)
+            logp = hddm.wfpt.wiener_like_rlddm(data['rt'].values, cache['response'], cache['feedback'],
+                                               cache['split_by'], .5, params['alpha'], params['pos_alpha'],
+                                               params['v'], params['sv'], params['a'], params['z'], params['sz'],
+                                               params['t'], params['st'], 1e-4, n_st=2, n_sz=2, use_adaptive=1,
+                                               simps_err=1e-3, p_outlier=.05, w_outlier=.1)
+            np.testing.assert_allclose(wienerRL_like(data, p_outlier=.05, **params), logp, rtol=1e-10)
+            # the DDM likelihood of the same frame keeps its own cache entries
+            ddm_params = dict((k, params[k]) for k in ('v', 'sv', 'a', 'z', 'sz', 't', 'st'))
+            np.testing.assert_allclose(wfpt_like(data, **ddm_params),
+                                       hddm.wfpt.wiener_like(data['rt'].values, **dict(ddm_params, **self.wp)),
+                                       rtol=1e-10)
+
+    def test_regressor_values(self):
+        """Test that regressed parameters are aligned with the trials of the data"""
+        from hddm.models.hddm_regression import generate_wfpt_reg_stochastic_class
+        data = self.rt_data(25, size=200)
+        rts = data['rt'].values
+        wiener_multi_like = generate_wfpt_reg_stochastic_class(dict(self.wp)).raw_fns['logp']
+        rs = np.random.RandomState(25)
+        # regressor nodes are indexed by the data of the whole model, value only holds some of its trials
+        full_index = np.union1d(data.index.values, rs.permutation(1000)[:300])
+        for step in range(3):
+            labels = rs.permutation(full_index)
+            v = pd.Series(rs.randn(len(labels)), index=labels)
+            a = pd.Series(1.5 + rs.rand(len(labels)), index=labels)
+            logp = wiener_multi_like(data, v, .1, a, .5, 0, .3, 0, ['v', 'a'], p_outlier=.05)
+            np.testing.assert_allclose(logp, hddm.wfpt.wiener_like_multi(rts, v[data.index].values, .1,
+                                                                         a[data.index].values, .5, 0, .3, 0,
+                                                                         1e-4, ['v', 'a'], p_outlier=.05,
+                                                                         w_outlier=.1),
+                                       rtol=1e-12)
+        params = regressor_values(data, {'v': pd.Series(np.arange(len(data)), index=data.index[::-1])}, ['v'])
+        np.testing.assert_array_equal(params['v'], np.arange(len(data))[::-1])
+        self.assertRaises(AssertionError, regressor_values, data,
+                          {'v': pd.Series(np.zeros(10), index=data.index[:10])}, ['v'])
+
 if __name__=='__main__':
     print("Run nosetest.")
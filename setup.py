@@ -1,16 +1,22 @@
+import sys
 from setuptools import setup
 from setuptools import Extension
 
-try:
-    from Cython.Build import cythonize
-    ext_modules = cythonize([Extension('wfpt', ['src/wfpt.pyx'], language='c++'), # uncomment for OSX: , extra_compile_args=['-stdlib=libc++'], extra_link_args=['-stdlib=libc++', "-mmacosx-version-min=10.9"]),
-                             Extension('cdfdif_wrapper', ['src/cdfdif_wrapper.pyx', 'src/cdfdif.c'])
-    ])
+# The prange loops in wfpt and cdfdif_wrapper only run multi-threaded when compiled with OpenMP.
+# Apple's clang does not ship OpenMP, so OSX builds stay single-threaded.
+if sys.platform.startswith('linux'):
+    openmp_args = ['-fopenmp']
+else:
+    openmp_args = []
 
-except ImportError:
-    ext_modules = [Extension('wfpt', ['src/wfpt.cpp'], language='c++'),
-                   Extension('cdfdif_wrapper', ['src/cdfdif_wrapper.c', 'src/cdfdif.c'])
-    ]
+# wfpt and cdfdif_wrapper are always compiled from their Cython sources, generated
+# C/C++ files are not kept in the repository as they go stale with every .pyx change.
+from Cython.Build import cythonize
+ext_modules = cythonize([Extension('wfpt', ['src/wfpt.pyx'], language='c++',
+                                   extra_compile_args=openmp_args, extra_link_args=openmp_args), # uncomment for OSX: , extra_compile_args=['-stdlib=libc++'], extra_link_args=['-stdlib=libc++', "-mmacosx-version-min=10.9"]),
+                         Extension('cdfdif_wrapper', ['src/cdfdif_wrapper.pyx', 'src/cdfdif.c'],
+                                   extra_compile_args=openmp_args, extra_link_args=openmp_args)
+])
 
 import numpy as np
 
@@ -24,8 +30,8 @@ setup(
     package_data={'hddm':['examples/*.csv', 'examples/*.conf']},
     scripts=['scripts/hddm_demo.py'],
     description='HDDM is a python module that implements Hierarchical Bayesian estimation of Drift Diffusion Models.',
-    install_requires=['NumPy >=1.6.0', 'SciPy >= 0.6.0', 'kabuki >= 0.6.0', 'PyMC>=2.3.3', 'pandas >= 0.12.0', 'patsy'],
-    setup_requires=['NumPy >=1.6.0', 'SciPy >= 0.6.0', 'kabuki >= 0.6.0', 'PyMC>=2.3.3', 'pandas >= 0.12.0', 'patsy'],
+    install_requires=['NumPy >= 1.19', 'SciPy >= 0.6.0', 'kabuki >= 0.6.0', 'PyMC>=2.3.3', 'pandas >= 0.12.0', 'patsy'],
+    setup_requires=['Cython >= 0.29', 'NumPy >= 1.19', 'SciPy >= 0.6.0', 'kabuki >= 0.6.0', 'PyMC>=2.3.3', 'pandas >= 0.12.0', 'patsy'],
     include_dirs = [np.get_include()],
     classifiers=[
                 'Development Status :: 5 - Production/Stable',
@@ -0,0 +1,147 @@
+#cython: embedsignature=True
+#cython: cdivision=True
+#cython: wraparound=False
+#cython: boundscheck=False
+
+# Series for the defective first passage time CDF at the lower boundary.
+#
+# All functions work in normalized time u = t/a**2 with a = 1, drift
+# m = v*a and drift std s = sv*a. Upper boundary responses are handled by
+# the caller with the usual v -> -v, w -> 1-w transformation.
+
+cdef extern from "math.h" nogil:
+    double erfc(double)
+    double expm1(double)
+    double log1p(double)
+    double M_SQRT1_2
+
+cdef inline double log_norm_cdf(double x) nogil:
+    """log of the standard normal CDF, stable far in the lower tail."""
+    if x > -30:
+        return log(.5*erfc(-x/sqrt(2)))
+    # asymptotic expansion of erfc
+    return -x*x/2 - log(-x) - .5*log(2*M_PI) + log1p(-1/(x*x) + 3/(x*x*x*x))
+
+cdef double prob_lb_01(double m, double w) nogil:
+    """Probability of hitting the lower boundary (a = 1, drift m, start w)."""
+    if m == 0:
+        return 1 - w
+    if m < 0:
+        return 1 - prob_lb_01(-m, 1 - w)
+    return exp(-2*m*w) * expm1(-2*m*(1 - w)) / expm1(-2*m)
+
+cdef inline double expected_exp_norm_cdf(double c, double alpha, double beta, double m, double s) nogil:
+    """E[exp(c*mu) * Phi(alpha + beta*mu)] for mu ~ N(m, s**2)."""
+    cdef double e = c*m + (c*s)**2/2
+    cdef double y = alpha + beta*(m + c*s*s)
+
+    if s != 0:
+        y /= sqrt(1 + (beta*s)**2)
+    # the product only needs log space when one factor over- or underflows
+    if e < 700 and y > -30:
+        return exp(e)*.5*erfc(-y*M_SQRT1_2)
+    return exp(e + log_norm_cdf(y))
+
+cdef double cdf_lower_small(double u, double m, double s, double w, double err) nogil:
+    """Small time (method of images) series of the lower boundary CDF.
+
+    Every image term is a combination of normal CDFs, so the average over
+    a normally distributed drift (std s) stays in closed form.
+    """
+    cdef double F = 0
+    cdef double term, y, sgn, size
+    cdef double su = sqrt(u)
+    cdef int n, k, j
+
+    # images ordered by distance: w, 2-w, 2+w, 4-w, ...
+    for n in range(100):
+        size = 0
+        for j in range(2):
+            k = n if j == 0 else -n - 1
+            y = w + 2*k
+            sgn = 1 if y > 0 else -1
+            term = sgn * (expected_exp_norm_cdf(2*k, -fabs(y)/su, -sgn*su, m, s) +
+                          expected_exp_norm_cdf(-2*(w + k), -fabs(y)/su, sgn*su, m, s))
+            F += term
+            size += fabs(term)
+        if size < err*1e-2 and n >= su:
+            break
+
+    return F
+
+cdef inline int cdf_terms_large(double u, double err) nogil:
+    return <int>ceil(sqrt(max(-2*log(err*1e-2)/(M_PI**2*u), 1.)))
+
+cdef double survivor_lower_large(double u, double m, double w, double err) nogil:
+    """P_lower - F(u), from the large time series (constant drift)."""
+    cdef double Q = 0
+    cdef double lambda_k
+    cdef int k
+    cdef int K = cdf_terms_large(u, err)
+
+    for k in range(1, K + 1):
+        lambda_k = (m*m + (k*M_PI)**2)/2
+        Q += k*sin(k*M_PI*w)*exp(-lambda_k*u)/lambda_k
+
+    return M_PI*exp(-m*w)*Q
+
+cdef inline bint use_large_time(double u, double s, double err) nogil:
+    # the large time series has no closed form for a variable drift
+    return (s == 0) and (cdf_terms_large(u, err) < sqrt(u) + 2)
+
+cdef double cdf_lower(double u, double m, double s, double w, double err) nogil:
+    """Defective CDF of lower boundary hits at normalized time u."""
+    if u <= 0:
+        return 0
+    if use_large_time(u, s, err):
+        return prob_lb_01(m, w) - survivor_lower_large(u, m, w, err)
+    return cdf_lower_small(u, m, s, w, err)
+
+cdef double cdf_lower_window(double x_lo, double x_hi, double v, double sv, double a, double w,
+                             double err) nogil:
+    """F(x_hi) - F(x_lo) of the lower boundary CDF with decision times x_lo < x_hi."""
+    cdef double u_lo = x_lo/a**2
+    cdef double u_hi = x_hi/a**2
+
+    if u_hi <= 0:
+        return 0
+    # both ends in the tail: difference of the survivor functions, P_lower cancels exactly
+    if u_lo > 0 and use_large_time(u_lo, sv*a, err):
+        return survivor_lower_large(u_lo, v*a, w, err) - survivor_lower_large(u_hi, v*a, w, err)
+
+    return cdf_lower(u_hi, v*a, sv*a, w, err) - cdf_lower(u_lo, v*a, sv*a, w, err)
+
+cdef inline double pdf_st_exact(double x, double v, double sv, double a, double z, double t,
+                                double st, double err) nogil:
+    """Density averaged over a uniform non-decision time in [t-st/2, t+st/2]."""
+    return cdf_lower_window(x - t - st/2, x - t + st/2, v, sv, a, z, err)/st
+
+cdef double prob_lb_sv(double m, double s, double w, double[:] gh_nodes, double[:] gh_weights) nogil:
+    """Probability of hitting the lower boundary averaged over a drift ~ N(m, s**2).
+
+    gh_nodes and gh_weights are a Gauss-Hermite rule for the standard normal.
+    """
+    cdef double p = 0
+    cdef Py_ssize_t k
+
+    if s == 0:
+        return prob_lb_01(m, w)
+    for k in range(gh_nodes.shape[0]):
+        p += gh_weights[k] * prob_lb_01(m + s*gh_nodes[k], w)
+    return p
+
+cdef double cdf_signed(double x, double v, double sv, double a, double z, double t, double err,
+                       double p_lower) nogil:
+    """CDF of the signed RT x (lower boundary responses negative).
+
+    It runs from 0 at -inf through p_lower at 0, the probability of a
+    lower boundary response, to 1 at +inf.
+    """
+    cdef double u = (fabs(x) - t)/a**2
+
+    if x > 0:
+        return p_lower + cdf_lower(u, -v*a, sv*a, 1 - z, err)
+    if u > 0 and use_large_time(u, sv*a, err):
+        # P(lower, rt > |x|) directly, without cancellation against p_lower
+        return survivor_lower_large(u, v*a, z, err)
+    return p_lower - cdf_lower(u, v*a, sv*a, z, err)
@@ -21,6 +21,7 @@
 
 #include <stdlib.h>
 #include <math.h>
+#include "cdfdif.h"
 //#include <matrix.h>
 //#include <tmwtypes.h>
 
@@ -55,31 +56,23 @@
 /*     for (i=0;i<nt;i++) y[i] = cdfdif(t[i],*x,nwp,pr); */
 /* } */
 
-/* The main function for the seven-parameter diffusion model */
-double cdfdif(double t, int x, double *par, double *prob)
+/* Scales the quadrature nodes and computes the boundary probability for the
+   parameters par. Both only depend on the parameters, not on the RT. */
+void cdfdif_setup(double *par, cdfdif_params *p)
 {
-    double a = par[0], Ter = par[1], eta = par[2], z = par[3], sZ = par[4],
-    st = par[5], nu = par[6], a2 = a*a,
-    Z_U = (1-x)*z+x*(a-z)+sZ/2, /* upper boundary of z distribution */
-    Z_L = (1-x)*z+x*(a-z)-sZ/2, /* lower boundary of z distribution */
-    lower_t = Ter-st/2, /* lower boundary of Ter distribution */
-    upper_t, /* upper boundary of Ter distribution */
-    delta = 1e-29, /* convergence values for terms added to partial sum */
+    double a = par[0], eta = par[2], z = par[3], sZ = par[4], nu = par[6],
     epsilon = 1e-7, /* value to check deviation from zero */
-    min_RT=0.001; /* realistic minimum rt to complete decision process */
-
-    int v_max = 5000; /* maximum number of terms in a partial sum */
-    /* approximating infinite series */
-
-    double Fnew, sum_z=0, sum_nu=0, p1, p0, sum_hist[3]={0,0,0},
-    denom, sifa, upp, low, fact, exdif, su, sl, zzz, ser;
+    sum_z=0, sum_nu=0;
     double nr_nu = 6, nr_z = 6;
 
     double gk[6]={-2.3506049736744922818,-1.3358490740136970132,-.43607741192761650950,.43607741192761650950,1.3358490740136970132,2.3506049736744922818},
            w_gh[6]={.45300099055088421593e-2,.15706732032114842368,.72462959522439207571,.72462959522439207571,.15706732032114842368,.45300099055088421593e-2},
            gz[6]={-.93246951420315193904,-.66120938646626381541,-.23861918608319693247,.23861918608319712676,.66120938646626459256,.93246951420315160597},
            w_g[6]={.17132449237917049545,.36076157304813916138,.46791393457269092604,.46791393457269092604,.36076157304813843973,.17132449237917132812};
-    int i,m,v;
+    int i,m;
+
+    for(i=0; i<7; i++)
+        p->par[i] = par[i];
 
     for(i=0; i<nr_nu; i++)
     {
@@ -110,14 +103,55 @@ double cdfdif(double t, int x, double *par, double *prob)
         }
         sum_z+=sum_nu*w_g[i]/2;
     }
-    *prob=sum_z;
+    p->prob=sum_z;
     /* end of prob */
 
+    for(i=0; i<6; i++)
+    {
+        p->gk[i] = gk[i];
+        p->w_gh[i] = w_gh[i];
+        p->gz[i] = gz[i];
+        p->w_g[i] = w_g[i];
+    }
+}
+
+/* The main function for the seven-parameter diffusion model */
+double cdfdif(double t, int x, double *par, double *prob)
+{
+    cdfdif_params p;
+
+    cdfdif_setup(par, &p);
+    *prob = p.prob;
+    return cdfdif_eval(t, x, &p);
+}
+
+/* CDF of RT t at boundary x for parameters prepared by cdfdif_setup */
+double cdfdif_eval(double t, int x, const cdfdif_params *p)
+{
+    const double *par = p->par, *gk = p->gk, *w_gh = p->w_gh, *gz = p->gz, *w_g = p->w_g;
+    double a = par[0], Ter = par[1], z = par[3], sZ = par[4],
+    st = par[5], a2 = a*a,
+    Z_U = (1-x)*z+x*(a-z)+sZ/2, /* upper boundary of z distribution */
+    Z_L = (1-x)*z+x*(a-z)-sZ/2, /* lower boundary of z distribution */
+    lower_t = Ter-st/2, /* lower boundary of Ter distribution */
+    upper_t, /* upper boundary of Ter distribution */
+    delta = 1e-29, /* convergence values for terms added to partial sum */
+    epsilon = 1e-7, /* value to check deviation from zero */
+    min_RT=0.001; /* realistic minimum rt to complete decision process */
+
+    int v_max = 5000; /* maximum number of terms in a partial sum */
+    /* approximating infinite series */
+
+    double Fnew, sum_z=0, sum_nu=0, p1, p0, sum_hist[3]={0,0,0},
+    denom, sifa, upp, low, fact, exdif, su, sl, zzz, ser;
+    double nr_nu = 6, nr_z = 6;
+    int i,m,v;
+
     if (t-Ter+st/2>min_RT)/* is t larger than lower boundary Ter distribution? */
     {
         upper_t = t<Ter+st/2 ? t : Ter+st/2;
-        p1=*prob*(upper_t-lower_t)/st; /* integrate probability with respect to t */
-        p0=(1-*prob)*(upper_t-lower_t)/st;
+        p1=p->prob*(upper_t-lower_t)/st; /* integrate probability with respect to t */
+        p0=(1-p->prob)*(upper_t-lower_t)/st;
         if (t>Ter+st/2) /* is t larger than upper boundary Ter distribution? */
         {
             sum_hist[0] = 0;
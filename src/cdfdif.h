@@ -1 +1,11 @@
+typedef struct {
+    double par[7];
+    /* quadrature nodes and weights scaled to the parameters */
+    double gk[6], w_gh[6], gz[6], w_g[6];
+    /* probability of the boundary given by cdfdif's prob */
+    double prob;
+} cdfdif_params;
+
+void cdfdif_setup(double *par, cdfdif_params *p);
+double cdfdif_eval(double t, int x, const cdfdif_params *p);
 double cdfdif(double t, int x, double *par, double *prob);
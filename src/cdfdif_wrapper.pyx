@@ -1,14 +1,23 @@
 
+# cython: boundscheck=False
+# cython: wraparound=False
+
 cimport numpy as np
 import numpy as np
 
-cdef extern from "cdfdif.h":
+from cython.parallel import prange
+
+cdef extern from "cdfdif.h" nogil:
+    ctypedef struct cdfdif_params:
+        double prob
+    void cdfdif_setup(double *par, cdfdif_params *p)
+    double cdfdif_eval(double t, int x, const cdfdif_params *p)
     double cdfdif(double t, int x, double *par, double *prob)
 
-cdef extern from "math.h":
+cdef extern from "math.h" nogil:
     double fabs(double)
 
-cdef inline double add_outlier_cdf(double y, double x, double p_outlier, double w_outlier):
+cdef inline double add_outlier_cdf(double y, double x, double p_outlier, double w_outlier) nogil:
     return y * (1 - p_outlier) + (x + (1. / (2 * w_outlier))) * w_outlier * p_outlier
 
 cdef inline bint p_outlier_in_range(double p_outlier): return (p_outlier >= 0) & (p_outlier <= 1)
@@ -26,10 +35,12 @@ def dmat_cdf_array(np.ndarray[double, ndim=1] x, double v, double sv,
 
 
     cdef Py_ssize_t size = x.shape[0]
+    cdef Py_ssize_t i
     cdef np.ndarray[double, ndim=1] y = np.empty(size, dtype=np.double)
-    cdef int boundary
-    cdef double p_boundary
+    cdef double[:] xs = x
+    cdef double[:] ys = y
     cdef double params[7]
+    cdef cdfdif_params setup
     cdef double epsi = 1e-10
 
     #transform parameters
@@ -41,13 +52,14 @@ def dmat_cdf_array(np.ndarray[double, ndim=1] x, double v, double sv,
     params[5] = st + epsi
     params[6] = v/10.
 
+    # quadrature nodes and the boundary probability do not depend on the RT
+    cdfdif_setup(params, &setup)
 
-    for i in range(size):
-        boundary = (int) (x[i] > 0)
-        y[i] = cdfdif(fabs(x[i]), boundary, params, &p_boundary)
-        y[i] = (1 - p_boundary) + np.sign(x[i])*y[i]
+    for i in prange(size, nogil=True):
+        ys[i] = cdfdif_eval(fabs(xs[i]), xs[i] > 0, &setup)
+        ys[i] = (1 - setup.prob) + ((xs[i] > 0) - (xs[i] < 0)) * ys[i]
 
         #add p_outlier probability
-        y[i] = add_outlier_cdf(y[i], x[i], p_outlier, w_outlier)
+        ys[i] = add_outlier_cdf(ys[i], xs[i], p_outlier, w_outlier)
 
     return y
@@ -8,6 +8,7 @@ cimport numpy as np
 cimport cython
 
 include 'pdf.pxi'
+include 'cdf.pxi'
 
 cdef double simpson_1D(double x, double v, double sv, double a, double z, double t, double err,
                         double lb_z, double ub_z, int n_sz, double lb_t, double ub_t, int n_st) nogil:
@@ -204,3 +205,118 @@ cdef double adaptiveSimpsons_2D(double x, double v, double sv, double a, double
                                  lb_z, ub_z, lb_t, ub_t, st, err_2d,
                                  S, f_beg, f_end, f_mid, maxRecursionDepth_sz, maxRecursionDepth_st)
     return res
+
+
+cdef inline double simpson_weight(int i, int n) nogil:
+    """Weight of node i of the composite Simpson rule with n intervals, normalized
+    so that the weights sum to one (n=0 is a single node)."""
+    if n == 0:
+        return 1
+    if i == 0 or i == n:
+        return 1./(3*n)
+    if i&1:
+        return 4./(3*n)
+    return 2./(3*n)
+
+cdef double full_pdf_grad(double x, double v, double sv, double a, double z, double sz, double t,
+                          double st, double err, int n_st, int n_sz, double *grad) nogil:
+    """full pdf and its partial derivatives with respect to v, a, z, t and sv
+    (written into grad in that order).
+
+    sz and st are integrated with the composite Simpson rule over n_sz and n_st
+    intervals, the rule full_pdf uses when use_adaptive=0.
+    """
+    cdef double g[5]
+    cdef double p = 0
+    cdef double sign = 1
+    cdef double w, z_tag, t_tag, hz, ht
+    cdef int i_z, i_t, k
+
+    for k in range(5):
+        grad[k] = 0
+
+    # Check if parpameters are valid
+    if (z<0) or (z>1) or (a<0) or (t<0) or (st<0) or (sv<0) or (sz<0) or (sz>1) or \
+       ((fabs(x)-(t-st/2.))<0) or (z+sz/2.>1) or (z-sz/2.<0) or (t-st/2.<0):
+        return 0
+
+    # transform x,v,z if x is upper bound response
+    if x > 0:
+        v = -v
+        z = 1.-z
+        sign = -1
+
+    x = fabs(x)
+
+    if st<1e-3:
+        st = 0
+        n_st = 0
+    if sz <1e-3:
+        sz = 0
+        n_sz = 0
+    # Simpson needs an even number of intervals
+    n_st += n_st&1
+    n_sz += n_sz&1
+
+    hz = sz/n_sz if n_sz > 0 else 0
+    ht = st/n_st if n_st > 0 else 0
+
+    for i_z in range(n_sz+1):
+        z_tag = z - sz/2. + hz*i_z
+        for i_t in range(n_st+1):
+            t_tag = t - st/2. + ht*i_t
+            w = simpson_weight(i_z, n_sz) * simpson_weight(i_t, n_st)
+            p += w * pdf_sv_grad(x - t_tag, v, sv, a, z_tag, err, g)
+            for k in range(5):
+                grad[k] += w * g[k]
+
+    # back to the untransformed parameters; the decision time is x - t
+    grad[0] *= sign
+    grad[2] *= sign
+    grad[3] = -grad[3]
+
+    return p
+
+
+cdef double adaptiveSimpsonsAux_st_exact(double x, double v, double sv, double a, double t, double st,
+                                         double pdf_err, double lb_z, double ub_z, double ZT, double simps_err,
+                                         double S, double f_beg, double f_end, double f_mid, int bottom) nogil:
+
+    cdef double h = ub_z - lb_z
+    cdef double z_c = (ub_z + lb_z)/2.
+    cdef double fd = pdf_st_exact(x, v, sv, a, (lb_z + z_c)/2., t, st, pdf_err)/ZT
+    cdef double fe = pdf_st_exact(x, v, sv, a, (z_c + ub_z)/2., t, st, pdf_err)/ZT
+
+    cdef double Sleft = (h/12)*(f_beg + 4*fd + f_mid)
+    cdef double Sright = (h/12)*(f_mid + 4*fe + f_end)
+    cdef double S2 = Sleft + Sright
+    if (bottom <= 0 or fabs(S2 - S) <= 15*simps_err):
+        return S2 + (S2 - S)/15
+    return adaptiveSimpsonsAux_st_exact(x, v, sv, a, t, st, pdf_err, lb_z, z_c, ZT, simps_err/2,
+                                        Sleft, f_beg, f_mid, fd, bottom-1) + \
+           adaptiveSimpsonsAux_st_exact(x, v, sv, a, t, st, pdf_err, z_c, ub_z, ZT, simps_err/2,
+                                        Sright, f_mid, f_end, fe, bottom-1)
+
+cdef double integrate_z_st_exact(double x, double v, double sv, double a, double z, double sz, double t,
+                                 double st, double err, int n_sz, bint use_adaptive, double simps_err) nogil:
+    """Integral of pdf_st_exact over z in [z-sz/2, z+sz/2] divided by sz, with the same
+    adaptive or composite Simpson rule full_pdf uses for sz."""
+    cdef double lb_z = z - sz/2.
+    cdef double ub_z = z + sz/2.
+    cdef double f_beg, f_end, f_mid, S
+    cdef int i
+
+    if use_adaptive:
+        f_beg = pdf_st_exact(x, v, sv, a, lb_z, t, st, err)/sz
+        f_end = pdf_st_exact(x, v, sv, a, ub_z, t, st, err)/sz
+        f_mid = pdf_st_exact(x, v, sv, a, z, t, st, err)/sz
+        S = (sz/6)*(f_beg + 4*f_mid + f_end)
+        return adaptiveSimpsonsAux_st_exact(x, v, sv, a, t, st, err, lb_z, ub_z, sz, simps_err,
+                                            S, f_beg, f_end, f_mid, n_sz)
+
+    n_sz += n_sz&1
+    S = 0
+    for i in range(n_sz + 1):
+        S += simpson_weight(i, n_sz) * pdf_st_exact(x, v, sv, a, lb_z + sz*i/n_sz, t, st, err)
+    return S
+
@@ -20,8 +20,12 @@ cdef extern from "math.h" nogil:
     double ceil(double)
     double floor(double)
     double fabs(double)
+    double log1p(double)
     double M_PI
 
+cdef extern from "float.h" nogil:
+    double DBL_MIN
+
 cdef extern from "<algorithm>" namespace "std" nogil:
     T max[T](T a, T b)
 
@@ -64,6 +68,102 @@ cdef double ftt_01w(double tt, double w, double err) nogil:
 
     return p
 
+cdef double log_ftt_01w(double tt, double w, double err) nogil:
+    """Compute log f(t|0,1,w) like ftt_01w. The series is summed relative to its
+    dominant term, so the result stays finite where f itself underflows.
+    """
+    cdef double kl, ks, S, y
+    cdef int k, K, lower, upper
+
+    if w <= 0 or w >= 1:
+        return -INFINITY
+
+    # number of terms, same bounds as in ftt_01w
+    if M_PI*tt*err<1:
+        kl=sqrt(-2*log(M_PI*tt*err)/(M_PI**2*tt))
+        kl=max(kl,1./(M_PI*sqrt(tt)))
+    else:
+        kl=1./(M_PI*sqrt(tt))
+
+    if 2*sqrt(2*M_PI*tt)*err<1:
+        ks=2+sqrt(-2*tt*log(2*sqrt(2*M_PI*tt)*err))
+        ks=max(ks,sqrt(tt)+1)
+    else:
+        ks=2
+
+    if ks<kl: # small t, dominant term k=0
+        K=<int>(ceil(ks))
+        lower = <int>(-floor((K-1)/2.))
+        upper = <int>(ceil((K-1)/2.))
+        S=0
+        for k from lower <= k <= upper:
+            y=w+2*k
+            S+=(y/w)*exp(-(y*y - w*w)/2/tt)
+        if S <= 0:
+            return -INFINITY
+        return log(w) - w*w/2/tt - .5*log(2*M_PI*pow(tt,3)) + log(S)
+
+    else: # large t, dominant term k=1
+        K=<int>(ceil(kl))
+        S=0
+        for k from 1 <= k <= K:
+            S+=k*exp(-(k*k - 1)*(M_PI**2)*tt/2)*sin(k*M_PI*w)
+        if S <= 0:
+            return -INFINITY
+        return log(M_PI) - (M_PI**2)*tt/2 + log(S)
+
+cdef double ftt_01w_grad(double tt, double w, double err, double *dp_dtt, double *dp_dw) nogil:
+    """Compute f(t|0,1,w) like ftt_01w and its partial derivatives with respect to
+    the normalized time tt and w. The derivative series converge a little slower,
+    so two more terms are summed than for f itself.
+    """
+    cdef double kl, ks, p, y, e, s_w, s_t, c
+    cdef int k, K, lower, upper
+
+    # number of terms, same bounds as in ftt_01w
+    if M_PI*tt*err<1:
+        kl=sqrt(-2*log(M_PI*tt*err)/(M_PI**2*tt))
+        kl=max(kl,1./(M_PI*sqrt(tt)))
+    else:
+        kl=1./(M_PI*sqrt(tt))
+
+    if 2*sqrt(2*M_PI*tt)*err<1:
+        ks=2+sqrt(-2*tt*log(2*sqrt(2*M_PI*tt)*err))
+        ks=max(ks,sqrt(tt)+1)
+    else:
+        ks=2
+
+    p=0
+    s_w=0
+    s_t=0
+    if ks<kl: # small t
+        K=<int>(ceil(ks))
+        lower = <int>(-floor((K-1)/2.)) - 1
+        upper = <int>(ceil((K-1)/2.)) + 1
+        for k from lower <= k <= upper:
+            y=w+2*k
+            e=exp(-(pow(y,2))/2/tt)
+            p+=y*e
+            s_w+=(1-pow(y,2)/tt)*e
+            s_t+=pow(y,3)*e
+        c=1./sqrt(2*M_PI*pow(tt,3))
+        p*=c
+        dp_dw[0]=c*s_w
+        dp_dtt[0]=c*s_t/(2*pow(tt,2)) - 1.5*p/tt
+
+    else: # large t
+        K=<int>(ceil(kl)) + 2
+        for k from 1 <= k <= K:
+            e=exp(-(pow(k,2))*(M_PI**2)*tt/2)
+            p+=k*e*sin(k*M_PI*w)
+            s_w+=pow(k,2)*e*cos(k*M_PI*w)
+            s_t+=pow(k,3)*e*sin(k*M_PI*w)
+        p*=M_PI
+        dp_dw[0]=(M_PI**2)*s_w
+        dp_dtt[0]=-(M_PI**3)*s_t/2
+
+    return p
+
 cdef inline double prob_ub(double v, double a, double z) nogil:
     """Probability of hitting upper boundary."""
     if v == 0:
@@ -84,6 +184,44 @@ cdef double pdf(double x, double v, double a, double w, double err) nogil:
     # convert to f(t|v,a,w)
     return p*exp(-v*a*w -(pow(v,2))*x/2.)/(pow(a,2))
 
+cdef inline double pdf_from_ftt(double p, double x, double v, double sv, double a, double z) nogil:
+    """Convert f(t|0,1,w) at normalized time x/a**2 into f(t|v,a,w,sv).
+
+    This is the only part of the likelihood that depends on v and sv, the
+    series value p only depends on x, a and z.
+    """
+    if sv==0:
+        return p*exp(-v*a*z -(pow(v,2))*x/2.)/(pow(a,2))
+
+    return exp(log(p) + ((a*z*sv)**2 - 2*a*v*z - (v**2)*x)/(2*(sv**2)*x+2))/sqrt((sv**2)*x+1)/(a**2)
+
+cdef inline double log_pdf_from_ftt(double log_p, double x, double v, double sv, double a, double z) nogil:
+    """log of pdf_from_ftt, from log f(t|0,1,w)."""
+    if sv==0:
+        return log_p - v*a*z - (v**2)*x/2. - 2*log(a)
+
+    return log_p + ((a*z*sv)**2 - 2*a*v*z - (v**2)*x)/(2*(sv**2)*x+2) - .5*log((sv**2)*x+1) - 2*log(a)
+
+cdef double log_pdf_sv(double x, double v, double sv, double a, double z, double err) nogil:
+    """log f(t|v,a,z,sv), see pdf_sv."""
+    if x <= 0:
+        return -INFINITY
+
+    return log_pdf_from_ftt(log_ftt_01w(x/(pow(a,2)), z, err), x, v, sv, a, z)
+
+cdef inline double log_outlier_mixture(double log_p, double p_outlier, double w_outlier) nogil:
+    """log(p*(1-p_outlier) + w_outlier*p_outlier) from log p."""
+    cdef double l_p, l_outlier, m
+
+    if p_outlier == 0:
+        return log_p
+    l_p = log1p(-p_outlier) + log_p
+    l_outlier = log(w_outlier*p_outlier)
+    m = max(l_p, l_outlier)
+    if m == -INFINITY:
+        return m
+    return m + log1p(exp(-fabs(l_p - l_outlier)))
+
 cdef double pdf_sv(double x, double v, double sv, double a, double z, double err) nogil:
     """Compute the likelihood of the drift diffusion model f(t|v,a,z,sv) using the method
     and implementation of Navarro & Fuss, 2009.
@@ -99,13 +237,51 @@ cdef double pdf_sv(double x, double v, double sv, double a, double z, double err
     cdef double p  = ftt_01w(tt, z, err) #get f(t|0,1,w)
 
     # convert to f(t|v,a,w)
-    return exp(log(p) + ((a*z*sv)**2 - 2*a*v*z - (v**2)*x)/(2*(sv**2)*x+2))/sqrt((sv**2)*x+1)/(a**2)
+    return pdf_from_ftt(p, x, v, sv, a, z)
+
+cdef double pdf_sv_grad(double x, double v, double sv, double a, double z, double err,
+                        double *grad) nogil:
+    """Compute f(t|v,a,z,sv) and write its partial derivatives with respect to
+    v, a, z, x and sv into grad (in that order). x is the decision time.
+    """
+    cdef int k
+    for k in range(5):
+        grad[k] = 0
+
+    if x <= 0:
+        return 0
+
+    cdef double tt = x/(pow(a,2))
+    cdef double f_tt, f_w
+    cdef double f = ftt_01w_grad(tt, z, err, &f_tt, &f_w)
+    cdef double p = pdf_from_ftt(f, x, v, sv, a, z)
+    if p == 0 or f <= 0:
+        return p
+
+    # derivatives of log p = log f(x/a**2, z) - 2*log(a) + N/(2*D) - log(D)/2
+    cdef double D = (sv**2)*x + 1
+    cdef double N = (a*z*sv)**2 - 2*a*v*z - (v**2)*x
+    f_tt = f_tt/f
+    f_w = f_w/f
+
+    grad[0] = p * (-(a*z + v*x)/D)
+    grad[1] = p * (-2*x*f_tt/pow(a,3) - 2/a + (a*(z*sv)**2 - v*z)/D)
+    grad[2] = p * (f_w + ((a*sv)**2*z - a*v)/D)
+    grad[3] = p * (f_tt/pow(a,2) - (v**2)/(2*D) - N*(sv**2)/(2*D**2) - (sv**2)/(2*D))
+    grad[4] = p * ((a*z)**2*sv/D - N*sv*x/(D**2) - sv*x/D)
+
+    return p
 
 cpdef double full_pdf(double x, double v, double sv, double a, double
                       z, double sz, double t, double st, double err, int
                       n_st=2, int n_sz=2, bint use_adaptive=1, double
-                      simps_err=1e-3) nogil:
-    """full pdf"""
+                      simps_err=1e-3, bint st_exact=0) nogil:
+    """full pdf
+
+    With st_exact the integral over the non-decision time is computed
+    exactly as a difference of two first passage CDFs instead of by
+    numerical integration over t.
+    """
 
     # Check if parpameters are valid
     if (z<0) or (z>1) or (a<0) or (t<0) or (st<0) or (sv<0) or (sz<0) or (sz>1) or \
@@ -124,6 +300,11 @@ cpdef double full_pdf(double x, double v, double sv, double a, double
     if sz <1e-3:
         sz = 0
 
+    if st_exact and (st!=0):
+        if (sz==0):
+            return pdf_st_exact(x, v, sv, a, z, t, st, err)
+        return integrate_z_st_exact(x, v, sv, a, z, sz, t, st, err, n_sz, use_adaptive, simps_err)
+
     if (sz==0):
         if (st==0): #sv=0,sz=0,st=0
             return pdf_sv(x - t, v, sv, a, z, err)
@@ -144,3 +325,77 @@ cpdef double full_pdf(double x, double v, double sv, double a, double
                 return adaptiveSimpsons_2D(x, v, sv, a, z, t, err, z-sz/2., z+sz/2., t-st/2., t+st/2., simps_err, n_sz, n_st)
             else:
                 return simpson_2D(x, v, sv, a, z, t, err, z-sz/2., z+sz/2., n_sz, t-st/2., t+st/2., n_st)
+
+cdef double log_full_pdf(double x, double v, double sv, double a, double z, double sz, double t,
+                         double st, double err, int n_st=2, int n_sz=2, bint use_adaptive=1,
+                         double simps_err=1e-3, bint st_exact=0) nogil:
+    """log of full_pdf computed in log space, for densities below DBL_MIN.
+
+    Denormal densities have lost their relative precision and far tails
+    underflow to 0. Without sz and st the log density is computed
+    directly, otherwise the integral is taken with a composite Simpson
+    rule over the log densities (log-sum-exp). See log_like_trial.
+    """
+    cdef double log_f, m, S, z_tag, t_tag
+    cdef int i_z, i_t, n
+
+    # Check if parpameters are valid
+    if (z<0) or (z>1) or (a<0) or (t<0) or (st<0) or (sv<0) or (sz<0) or (sz>1) or \
+       ((fabs(x)-(t-st/2.))<0) or (z+sz/2.>1) or (z-sz/2.<0) or (t-st/2.<0):
+        return -INFINITY
+
+    if st<1e-3:
+        st = 0
+    if sz <1e-3:
+        sz = 0
+
+    if sz==0 and st==0:
+        if x > 0:
+            return log_pdf_sv(x - t, -v, sv, a, 1.-z, err)
+        return log_pdf_sv(-x - t, v, sv, a, z, err)
+
+    # transform x,v,z if x is upper bound response
+    if x > 0:
+        v = -v
+        z = 1.-z
+    x = fabs(x)
+
+    # only reached in far tails, so afford a finer rule than the Simpson default
+    n_sz = max(n_sz + (n_sz&1), 16) if sz != 0 else 0
+    n_st = max(n_st + (n_st&1), 16) if st != 0 else 0
+    # two passes: find the largest term, then sum relative to it
+    m = -INFINITY
+    S = 0
+    for n in range(2):
+        for i_z in range(n_sz+1):
+            z_tag = z - sz/2. + (sz*i_z/n_sz if n_sz else 0)
+            for i_t in range(n_st+1):
+                t_tag = t - st/2. + (st*i_t/n_st if n_st else 0)
+                log_f = log(simpson_weight(i_z, n_sz) * simpson_weight(i_t, n_st)) + \
+                        log_pdf_sv(x - t_tag, v, sv, a, z_tag, err)
+                if n == 0:
+                    m = max(m, log_f)
+                elif m > -INFINITY:
+                    S += exp(log_f - m)
+    if m == -INFINITY:
+        return m
+    return m + log(S)
+
+cdef inline double log_like_trial(double x, double v, double sv, double a, double z, double sz, double t,
+                                  double st, double err, int n_st, int n_sz, bint use_adaptive,
+                                  double simps_err, bint st_exact, double p_outlier, double w_outlier) nogil:
+    """log of the outlier mixture of full_pdf at x.
+
+    The mixture is computed from the linear density and logged. Only
+    where it drops below DBL_MIN is it taken from log_full_pdf, so the
+    log series are not paid for in the bulk of the distribution.
+    """
+    cdef double p = full_pdf(x, v, sv, a, z, sz, t, st, err, n_st, n_sz, use_adaptive, simps_err, st_exact)
+
+    if p_outlier != 0:
+        p = p * (1 - p_outlier) + w_outlier * p_outlier
+    if p >= DBL_MIN:
+        return log(p)
+    return log_outlier_mixture(log_full_pdf(x, v, sv, a, z, sz, t, st, err, n_st, n_sz, use_adaptive,
+                                            simps_err, st_exact),
+                               p_outlier, w_outlier)
@@ -16,13 +16,16 @@
 import hddm
 
 import scipy.integrate as integrate
-from copy import copy
 import numpy as np
+from functools import lru_cache
 
 cimport numpy as np
 cimport cython
 
 from cython.parallel import *
+from libc.math cimport INFINITY, NAN, expm1, cos
+from cpython.pycapsule cimport PyCapsule_GetPointer
+from numpy.random cimport bitgen_t
 # cimport openmp
 
 # include "pdf.pxi"
@@ -31,51 +34,662 @@ include 'integrate.pxi'
 
 def pdf_array(np.ndarray[double, ndim=1] x, double v, double sv, double a, double z, double sz,
               double t, double st, double err=1e-4, bint logp=0, int n_st=2, int n_sz=2, bint use_adaptive=1,
-              double simps_err=1e-3, double p_outlier=0, double w_outlier=0):
+              double simps_err=1e-3, double p_outlier=0, double w_outlier=0, bint st_exact=0,
+              weights=None):
+    """Densities of x, or log densities with logp=1.
 
+    With per-trial weights the log densities are multiplied by (and the
+    densities raised to the power of) the weights.
+    """
     cdef Py_ssize_t size = x.shape[0]
     cdef Py_ssize_t i
+    cdef double[:] ws = trial_weights(weights, size)
     cdef np.ndarray[double, ndim = 1] y = np.empty(size, dtype=np.double)
 
+    if logp == 1:
+        # computed in log space, so densities too small for a double stay finite
+        for i in prange(size, nogil=True):
+            y[i] = weighted(ws, i, log_like_trial(x[i], v, sv, a, z, sz, t, st, err, n_st, n_sz,
+                                                  use_adaptive, simps_err, st_exact, p_outlier, w_outlier))
+        return y
+
     for i in prange(size, nogil=True):
         y[i] = full_pdf(x[i], v, sv, a, z, sz, t, st, err,
-                        n_st, n_sz, use_adaptive, simps_err)
+                        n_st, n_sz, use_adaptive, simps_err, st_exact)
 
     y = y * (1 - p_outlier) + (w_outlier * p_outlier)
-    if logp == 1:
-        return np.log(y)
-    else:
-        return y
+    if weights is not None:
+        return y ** np.asarray(ws)
+    return y
 
-cdef inline bint p_outlier_in_range(double p_outlier):
+cdef inline bint p_outlier_in_range(double p_outlier) nogil:
     return (p_outlier >= 0) & (p_outlier <= 1)
 
+def trial_weights(weights, Py_ssize_t size):
+    """Per-trial weights as a contiguous double array, empty for None (all ones)."""
+    if weights is None:
+        return np.empty(0, dtype=np.double)
+    weights = np.ascontiguousarray(weights, dtype=np.double)
+    if weights.shape != (size,):
+        raise ValueError("weights must have one entry per trial")
+    return weights
+
+cdef inline double weighted(double[:] weights, Py_ssize_t i, double logp) nogil:
+    """logp of trial i times its weight; trials with weight 0 contribute 0."""
+    if weights.shape[0] == 0:
+        return logp
+    if weights[i] == 0:
+        return 0
+    return weights[i] * logp
+
+# number of trials per block when summing log-likelihoods in deterministic mode
+cdef Py_ssize_t sum_block_size = 256
+
 
 def wiener_like(np.ndarray[double, ndim=1] x, double v, double sv, double a, double z, double sz, double t,
                 double st, double err, int n_st=10, int n_sz=10, bint use_adaptive=1, double simps_err=1e-8,
-                double p_outlier=0, double w_outlier=0.1):
+                double p_outlier=0, double w_outlier=0.1, bint deterministic=0, bint st_exact=0,
+                weights=None):
+    """Summed log-likelihood of the RTs in x.
+
+    Densities below DBL_MIN and their outlier mixture are evaluated in
+    log space (log_like_trial), so slow tails give finite log-likelihoods
+    instead of underflowing to -inf. Trials are reduced in parallel. The order in which the per-thread
+    partial sums are combined is up to OpenMP, so the last bits of the
+    result can vary between calls. With deterministic=1 the trials are
+    summed in fixed blocks of sum_block_size trials and the block sums are
+    added in order, which makes the result bit-for-bit reproducible.
+
+    weights are optional per-trial weights, e.g. the counts of duplicate
+    RTs collapsed into unique values; each log density is multiplied by
+    its weight.
+    """
     cdef Py_ssize_t size = x.shape[0]
-    cdef Py_ssize_t i
-    cdef double p
+    cdef Py_ssize_t i, b
+    cdef Py_ssize_t n_blocks = (size + sum_block_size - 1) // sum_block_size
     cdef double sum_logp = 0
-    cdef double wp_outlier = w_outlier * p_outlier
+    cdef double[:] xs = x
+    cdef double[:] ws = trial_weights(weights, size)
+    cdef double[:] partial
 
     if not p_outlier_in_range(p_outlier):
         return -np.inf
 
-    for i in range(size):
-        p = full_pdf(x[i], v, sv, a, z, sz, t, st, err,
-                     n_st, n_sz, use_adaptive, simps_err)
+    if deterministic:
+        partial = np.empty(n_blocks, dtype=np.double)
+        for b in prange(n_blocks, nogil=True, schedule='dynamic'):
+            partial[b] = _wiener_like_sum(xs[b * sum_block_size:min((b + 1) * sum_block_size, size)],
+                                          ws[b * sum_block_size:min((b + 1) * sum_block_size, ws.shape[0])],
+                                          v, sv, a, z, sz, t, st, err, n_st, n_sz, use_adaptive,
+                                          simps_err, p_outlier, w_outlier, st_exact)
+        for b in range(n_blocks):
+            sum_logp += partial[b]
+        return sum_logp
+
+    for i in prange(size, nogil=True, schedule='dynamic', chunksize=64):
         # If one probability = 0, the log sum will be -Inf
-        p = p * (1 - p_outlier) + wp_outlier
-        if p == 0:
-            return -np.inf
+        sum_logp += weighted(ws, i, log_like_trial(xs[i], v, sv, a, z, sz, t, st, err, n_st, n_sz,
+                                                   use_adaptive, simps_err, st_exact, p_outlier, w_outlier))
+
+    return sum_logp
+
+
+_gauss_legendre_rules = {}
+
+def gauss_legendre(int n):
+    """Gauss-Legendre nodes on [-1/2, 1/2] and weights summing to one."""
+    if n not in _gauss_legendre_rules:
+        nodes, weights = np.polynomial.legendre.leggauss(n)
+        _gauss_legendre_rules[n] = (nodes/2, weights/2)
+    return _gauss_legendre_rules[n]
+
+
+def pdf_gauss_array(np.ndarray[double, ndim=1] x, double v, double sv, double a, double z, double sz,
+                    double t, double st, double err, int n_st=10, int n_sz=10):
+    """Densities of x with sz and st integrated by fixed Gauss-Legendre rules.
+
+    n_sz and n_st are the number of nodes. pdf_sv is evaluated for all
+    trials x nodes as one dense batch, so the cost per trial is fixed.
+    The density is zero for non-decision times above |x|, so the t nodes
+    of each trial only cover [t - st/2, min(t + st/2, |x|)].
+    """
+    cdef Py_ssize_t size = x.shape[0]
+    cdef Py_ssize_t i, k, n_nodes
+    cdef double rt, v_i, z_i, t_hi, t_c, h, frac
+    cdef double t_lo = t - st/2
+    cdef double[:] xs = x
+    cdef np.ndarray[double, ndim=1] y = np.zeros(size, dtype=np.double)
+
+    # Check if parpameters are valid
+    if (z<0) or (z>1) or (a<0) or (t<0) or (st<0) or (sv<0) or (sz<0) or (sz>1) or \
+       (z+sz/2.>1) or (z-sz/2.<0) or (t-st/2.<0):
+        return y
+
+    if st < 1e-3:
+        st = 0
+        n_st = 1
+    if sz < 1e-3:
+        sz = 0
+        n_sz = 1
+
+    nodes_z, weights_z = gauss_legendre(n_sz)
+    nodes_t, weights_t = gauss_legendre(n_st)
+    # all (z, t) nodes with their product weights, t nodes on [-1/2, 1/2]
+    cdef double[:] zs = np.repeat(z + sz*nodes_z, n_st)
+    cdef double[:] nts = np.tile(nodes_t, n_sz)
+    cdef np.ndarray[double, ndim=1] weights = np.outer(weights_z, weights_t).ravel()
+    n_nodes = n_sz * n_st
+
+    cdef np.ndarray[double, ndim=2] dens = np.zeros((size, n_nodes), dtype=np.double)
+    cdef double[:, :] d = dens
+
+    for i in prange(size, nogil=True, schedule='static'):
+        rt = fabs(xs[i])
+        if st == 0:
+            t_c = t
+            h = 0
+            frac = 1
+        else:
+            t_hi = min(t + st/2, rt)
+            if t_hi <= t_lo:
+                continue
+            t_c = (t_lo + t_hi)/2
+            h = t_hi - t_lo
+            frac = h/st
+        # transform v and z if x is an upper bound response
+        if xs[i] > 0:
+            v_i = -v
+        else:
+            v_i = v
+        for k in range(n_nodes):
+            z_i = 1 - zs[k] if xs[i] > 0 else zs[k]
+            d[i, k] = frac*pdf_sv(rt - t_c - h*nts[k], v_i, sv, a, z_i, err)
+
+    return dens.dot(weights)
+
+
+_gauss_hermite_rules = {}
+
+def gauss_hermite(int n):
+    """Gauss-Hermite nodes and weights for expectations over a standard normal."""
+    if n not in _gauss_hermite_rules:
+        nodes, weights = np.polynomial.hermite.hermgauss(n)
+        _gauss_hermite_rules[n] = (nodes*np.sqrt(2), weights/np.sqrt(np.pi))
+    return _gauss_hermite_rules[n]
+
+
+cdef class SignedCdf:
+    """CDF and density of the signed RT for one parameter set.
+
+    Holds the Gauss-Legendre nodes over sz and st and the lower boundary
+    probability at each z node, see cdf_array.
+    """
+    cdef double v, sv, a, t, st, err, p_outlier, w_outlier
+    cdef double[:] zs, wz, nt, wt, p_lower
+
+    def __init__(self, double v, double sv, double a, double z, double sz, double t, double st,
+                 double err=1e-6, int n_st=5, int n_sz=5, double p_outlier=0, double w_outlier=0,
+                 int n_sv=40):
+        cdef Py_ssize_t j
+
+        if (z<0) or (z>1) or (a<=0) or (t<0) or (st<0) or (sv<0) or (sz<0) or (sz>1) or \
+           (z+sz/2.>1) or (z-sz/2.<0) or (t-st/2.<0) or not p_outlier_in_range(p_outlier):
+            raise ValueError("at least one of the parameters is out of the support")
+
+        if st == 0:
+            n_st = 1
+        if sz == 0:
+            n_sz = 1
+
+        self.v = v
+        self.sv = sv
+        self.a = a
+        self.t = t
+        self.st = st
+        self.err = err
+        self.p_outlier = p_outlier
+        self.w_outlier = w_outlier
+        nodes_z, weights_z = gauss_legendre(n_sz)
+        self.zs = z + sz*nodes_z
+        self.wz = weights_z
+        self.nt, self.wt = gauss_legendre(n_st)
+        nodes_v, weights_v = gauss_hermite(n_sv)
+        # the lower boundary probability only depends on the z node
+        self.p_lower = np.empty(n_sz, dtype=np.double)
+        for j in range(n_sz):
+            self.p_lower[j] = prob_lb_sv(v*a, sv*a, self.zs[j], nodes_v, weights_v)
+
+    cdef inline double st_window(self, double x, double *t_c, double *h) nogil:
+        """Part of the st interval with a positive decision time at x.
+
+        Non-decision times above |x| add nothing to the density and the
+        boundary probability to the CDF, so the t nodes are only spread over
+        [t - st/2, min(t + st/2, |x|)], where the integrand is smooth. Sets
+        its center and width and returns the fraction of st it covers.
+        """
+        cdef double t_lo = self.t - self.st/2
+        cdef double t_hi = min(self.t + self.st/2, fabs(x))
+
+        if t_hi <= t_lo and not (self.st == 0 and fabs(x) > self.t):
+            return 0
+        t_c[0] = (t_lo + t_hi)/2
+        h[0] = t_hi - t_lo
+        if self.st == 0:
+            return 1
+        return h[0]/self.st
+
+    cdef double cdf(self, double x) nogil:
+        cdef Py_ssize_t j, k
+        cdef double y = 0
+        cdef double y_t, t_c, h
+        cdef double frac = self.st_window(x, &t_c, &h)
+
+        for j in range(self.zs.shape[0]):
+            y_t = 0
+            if frac > 0:
+                for k in range(self.nt.shape[0]):
+                    y_t += self.wt[k]*cdf_signed(x, self.v, self.sv, self.a, self.zs[j], t_c + h*self.nt[k],
+                                                 self.err, self.p_lower[j])
+            # with a non-decision time above |x| the CDF is the lower boundary probability
+            y += self.wz[j]*(frac*y_t + (1 - frac)*self.p_lower[j])
+        if self.p_outlier != 0:
+            y = y * (1 - self.p_outlier) + (x + (1. / (2 * self.w_outlier))) * self.w_outlier * self.p_outlier
+        return y
+
+    cdef double pdf(self, double x) nogil:
+        cdef Py_ssize_t j, k
+        cdef double y = 0
+        cdef double t_c, h
+        cdef double frac = self.st_window(x, &t_c, &h)
+
+        if frac > 0:
+            for j in range(self.zs.shape[0]):
+                for k in range(self.nt.shape[0]):
+                    if x > 0:
+                        y += self.wz[j]*self.wt[k]*pdf_sv(x - t_c - h*self.nt[k], -self.v, self.sv, self.a,
+                                                          1 - self.zs[j], self.err)
+                    else:
+                        y += self.wz[j]*self.wt[k]*pdf_sv(-x - t_c - h*self.nt[k], self.v, self.sv, self.a,
+                                                          self.zs[j], self.err)
+        return frac * y * (1 - self.p_outlier) + self.w_outlier * self.p_outlier
+
+    cdef double quantile(self, double q, bint upper, double tol, int max_iter) nogil:
+        """RT at which the CDF of one boundary, conditional on that boundary, reaches q.
+
+        Newton steps with the density as derivative, falling back to
+        bisection whenever a step leaves the bracket of the root.
+        """
+        cdef double sgn = 1 if upper else -1
+        cdef double p_0 = self.cdf(0)
+        cdef double p_boundary = 1 - p_0 if upper else p_0
+        cdef double target = q * p_boundary
+        cdef double lo = 0
+        cdef double hi = self.t + self.st/2 + self.a**2
+        cdef double r, r_new, f, d
+        cdef int i
+
+        if p_boundary <= 0 or q < 0 or q > 1:
+            return NAN
+
+        # defective CDF of the boundary at rt r is sgn*(cdf(sgn*r) - p_0)
+        for i in range(60):
+            if sgn*(self.cdf(sgn*hi) - p_0) >= target:
+                break
+            lo = hi
+            hi *= 2
+
+        r = (lo + hi)/2
+        for i in range(max_iter):
+            f = sgn*(self.cdf(sgn*r) - p_0) - target
+            if f > 0:
+                hi = r
+            else:
+                lo = r
+            d = self.pdf(sgn*r)
+            if d > 0:
+                r_new = r - f/d
+            if d <= 0 or r_new <= lo or r_new >= hi:
+                r_new = (lo + hi)/2
+            if fabs(r_new - r) < tol:
+                return r_new
+            r = r_new
+        return r
+
+
+def cdf_array(np.ndarray[double, ndim=1] x, double v, double sv, double a, double z, double sz,
+              double t, double st, double err=1e-6, int n_st=5, int n_sz=5, double p_outlier=0,
+              double w_outlier=0, int n_sv=40):
+    """CDF of the signed RTs x from the small-time and large-time series.
+
+    Same convention as cdfdif.dmat_cdf_array: lower boundary responses are
+    negative and the CDF runs from 0 to 1 over the real line. Each series
+    is truncated once its terms are below err/100; sv is integrated in
+    closed form, sz and st with n_sz and n_st Gauss-Legendre nodes. The
+    boundary probability under sv uses n_sv Gauss-Hermite nodes.
+
+    The st nodes only cover non-decision times below |x| (see
+    SignedCdf.st_window), with five nodes each the CDF is within 1e-5 of
+    the converged one for sz, st <= .2. Without sz and st this is about
+    five times faster than dmat_cdf_array, with them (25 nodes) about twice
+    as slow: 14ms for 1000 RTs on one thread, against 7ms for dmat and 4ms
+    for pdf_array. So dmat stays the default cdf_engine of the wfpt
+    stochastics.
+    """
+    cdef Py_ssize_t size = x.shape[0]
+    cdef Py_ssize_t i
+    cdef double[:] xs = x
+    cdef np.ndarray[double, ndim=1] y = np.empty(size, dtype=np.double)
+    cdef double[:] ys = y
+    cdef SignedCdf F = SignedCdf(v, sv, a, z, sz, t, st, err, n_st, n_sz, p_outlier, w_outlier, n_sv)
+
+    for i in prange(size, nogil=True):
+        ys[i] = F.cdf(xs[i])
+
+    return y
+
+
+def cdf_quantiles(quantiles, double v, double sv, double a, double z, double sz, double t, double st,
+                  double err=1e-6, int n_st=5, int n_sz=5, double p_outlier=0, double w_outlier=0,
+                  double tol=1e-6, int max_iter=50):
+    """Quantiles of the RTs at each boundary from the series CDF of cdf_array.
+
+    Each quantile is solved for directly to within tol (in seconds), which
+    typically takes fewer than ten CDF and density evaluations.
+    Returns (q_lower, q_upper, p_upper) like the quantiles of the wfpt
+    stochastic, p_upper being the probability of an upper boundary response.
+    """
+    cdef np.ndarray[double, ndim=1] qs = np.ascontiguousarray(quantiles, dtype=np.double)
+    cdef Py_ssize_t n = qs.shape[0]
+    cdef Py_ssize_t i
+    cdef np.ndarray[double, ndim=1] q_lower = np.empty(n, dtype=np.double)
+    cdef np.ndarray[double, ndim=1] q_upper = np.empty(n, dtype=np.double)
+    cdef SignedCdf F = SignedCdf(v, sv, a, z, sz, t, st, err, n_st, n_sz, p_outlier, w_outlier)
+
+    for i in range(n):
+        q_lower[i] = F.quantile(qs[i], 0, tol, max_iter)
+        q_upper[i] = F.quantile(qs[i], 1, tol, max_iter)
+
+    return q_lower, q_upper, 1 - F.cdf(0)
+
+
+def wiener_like_gauss(np.ndarray[double, ndim=1] x, double v, double sv, double a, double z, double sz,
+                      double t, double st, double err, int n_st=10, int n_sz=10,
+                      double p_outlier=0, double w_outlier=0.1, weights=None):
+    """Summed log-likelihood of x with sz and st integrated by pdf_gauss_array.
+    weights as in wiener_like."""
+    if not p_outlier_in_range(p_outlier):
+        return -np.inf
+
+    cdef np.ndarray[double, ndim=1] p = pdf_gauss_array(x, v, sv, a, z, sz, t, st, err, n_st, n_sz)
+    cdef np.ndarray[double, ndim=1] logp = np.log(p * (1 - p_outlier) + w_outlier * p_outlier)
 
-        sum_logp += log(p)
+    if weights is not None:
+        weights = trial_weights(weights, x.shape[0])
+        logp = np.where(weights == 0, 0, weights * logp)
+
+    return logp.sum()
+
+
+cdef inline double logp_grad_trial(double x, double v, double sv, double a, double z, double sz, double t,
+                                   double st, double err, int n_st, int n_sz, double p_outlier,
+                                   double wp_outlier, double *grad) nogil:
+    """Log-likelihood of one trial, its gradient is written into grad.
+
+    The scratch array lives on the stack of the calling thread.
+    """
+    cdef double g[5]
+    cdef double p
+    cdef int k
+
+    p = full_pdf_grad(x, v, sv, a, z, sz, t, st, err, n_st, n_sz, g)
+    p = p * (1 - p_outlier) + wp_outlier
+    for k in range(5):
+        grad[k] = (1 - p_outlier) * g[k] / p
+    return log(p)
+
+def wiener_like_grad(np.ndarray[double, ndim=1] x, double v, double sv, double a, double z, double sz,
+                     double t, double st, double err, int n_st=10, int n_sz=10,
+                     double p_outlier=0, double w_outlier=0.1):
+    """Summed log-likelihood of x and its gradient.
+
+    Returns (logp, grad) where grad holds the partial derivatives of logp
+    with respect to v, a, z, t and sv. Without sz and st the derivatives
+    are analytic. Otherwise density and derivatives are integrated over sz
+    and st with the composite Simpson rule (n_sz, n_st intervals), so logp
+    matches wiener_like with use_adaptive=0.
+    """
+    cdef Py_ssize_t size = x.shape[0]
+    cdef Py_ssize_t i
+    cdef double wp_outlier = w_outlier * p_outlier
+    cdef double sum_logp = 0, d_v = 0, d_a = 0, d_z = 0, d_t = 0, d_sv = 0
+    cdef double[:] xs = x
+    cdef np.ndarray[double, ndim=2] grad = np.empty((size, 5), dtype=np.double)
+    cdef double[:, :] grad_view = grad
+
+    if not p_outlier_in_range(p_outlier):
+        return -np.inf, np.zeros(5)
+
+    for i in prange(size, nogil=True, schedule='dynamic', chunksize=64):
+        # each trial writes its own row of grad
+        sum_logp += logp_grad_trial(xs[i], v, sv, a, z, sz, t, st, err, n_st, n_sz, p_outlier,
+                                    wp_outlier, &grad_view[i, 0])
+        d_v += grad_view[i, 0]
+        d_a += grad_view[i, 1]
+        d_z += grad_view[i, 2]
+        d_t += grad_view[i, 3]
+        d_sv += grad_view[i, 4]
+
+    if np.isinf(sum_logp) or np.isnan(sum_logp):
+        return -np.inf, np.zeros(5)
+
+    return sum_logp, np.array([d_v, d_a, d_z, d_t, d_sv])
+
+
+cdef double _wiener_like_sum(double[:] x, double[:] weights, double v, double sv, double a, double z, double sz,
+                             double t, double st, double err, int n_st, int n_sz, bint use_adaptive,
+                             double simps_err, double p_outlier, double w_outlier, bint st_exact) nogil:
+    """Summed log-likelihood of x for a single parameter set, serial over trials.
+    weights is empty or holds one weight per trial."""
+    cdef Py_ssize_t i
+    cdef double logp
+    cdef double sum_logp = 0
+
+    if not p_outlier_in_range(p_outlier):
+        return -INFINITY
+
+    for i in range(x.shape[0]):
+        logp = weighted(weights, i, log_like_trial(x[i], v, sv, a, z, sz, t, st, err, n_st, n_sz,
+                                                   use_adaptive, simps_err, st_exact, p_outlier, w_outlier))
+        if logp == -INFINITY:
+            return -INFINITY
+        sum_logp += logp
 
     return sum_logp
 
 
+def wiener_like_batch(np.ndarray[double, ndim=1] x, np.ndarray[double, ndim=2] params, double err,
+                      int n_st=10, int n_sz=10, bint use_adaptive=1, double simps_err=1e-8,
+                      double w_outlier=0.1, bint st_exact=0):
+    """Summed log-likelihood of x under K parameter sets at once.
+
+    params is a (K, 8) array with columns v, sv, a, z, sz, t, st and
+    p_outlier. The parameter sets are evaluated in parallel with the GIL
+    released; the i-th entry of the returned array equals
+    wiener_like(x, *params[i, :7], err, ..., p_outlier=params[i, 7]).
+    """
+    cdef Py_ssize_t n_sets = params.shape[0]
+    cdef Py_ssize_t k
+    cdef double[:] xs = x
+    cdef double[:] no_weights = trial_weights(None, 0)
+    cdef double[:, :] ps = params
+    cdef np.ndarray[double, ndim=1] logp = np.empty(n_sets, dtype=np.double)
+    cdef double[:] out = logp
+
+    if params.shape[1] != 8:
+        raise ValueError("params must have 8 columns: v, sv, a, z, sz, t, st, p_outlier")
+
+    for k in prange(n_sets, nogil=True, schedule='dynamic'):
+        out[k] = _wiener_like_sum(xs, no_weights, ps[k, 0], ps[k, 1], ps[k, 2], ps[k, 3], ps[k, 4],
+                                  ps[k, 5], ps[k, 6], err, n_st, n_sz, use_adaptive,
+                                  simps_err, ps[k, 7], w_outlier, st_exact)
+
+    return logp
+
+
+def log_ftt_01w_array(np.ndarray[double, ndim=1] x, double a, double z, double t, double err):
+    """Series values log f(tt|0,1,w) of every RT in x.
+
+    They depend on a, z and t but not on v or sv, so they can be reused
+    by wiener_like_ftt while only the drift parameters change. Trials with
+    |x| <= t get -inf.
+    """
+    cdef Py_ssize_t size = x.shape[0]
+    cdef Py_ssize_t i
+    cdef double rt
+    cdef double[:] xs = x
+    cdef np.ndarray[double, ndim=1] log_ftt = np.full(size, -np.inf, dtype=np.double)
+    cdef double[:] out = log_ftt
+
+    if (z<0) or (z>1) or (a<=0) or (t<0):
+        return log_ftt
+
+    for i in prange(size, nogil=True):
+        rt = fabs(xs[i]) - t
+        if rt > 0:
+            # upper boundary responses use the mirrored starting point
+            if xs[i] > 0:
+                out[i] = log_ftt_01w(rt/a**2, 1-z, err)
+            else:
+                out[i] = log_ftt_01w(rt/a**2, z, err)
+
+    return log_ftt
+
+
+def wiener_like_ftt(np.ndarray[double, ndim=1] x, np.ndarray[double, ndim=1] log_ftt, double v, double sv,
+                    double a, double z, double t, double p_outlier=0, double w_outlier=0.1,
+                    weights=None):
+    """Summed log-likelihood of x (sz = st = 0) from precomputed series values.
+
+    log_ftt has to come from log_ftt_01w_array(x, a, z, t, err) for the
+    same a, z and t; only the closed-form factor depending on v and sv is
+    evaluated. weights as in wiener_like.
+    """
+    cdef Py_ssize_t size = x.shape[0]
+    cdef Py_ssize_t i
+    cdef double rt
+    cdef double sum_logp = 0
+    cdef double[:] xs = x
+    cdef double[:] fs = log_ftt
+    cdef double[:] ws = trial_weights(weights, size)
+
+    if (not p_outlier_in_range(p_outlier)) or (sv<0):
+        return -np.inf
+
+    for i in prange(size, nogil=True, schedule='static'):
+        rt = fabs(xs[i]) - t
+        if xs[i] > 0:
+            sum_logp += weighted(ws, i, log_outlier_mixture(log_pdf_from_ftt(fs[i], rt, -v, sv, a, 1-z),
+                                                            p_outlier, w_outlier))
+        else:
+            sum_logp += weighted(ws, i, log_outlier_mixture(log_pdf_from_ftt(fs[i], rt, v, sv, a, z),
+                                                            p_outlier, w_outlier))
+
+    return sum_logp
+
+
+def rl_segments(split_by):
+    """Group the trials of each split_by condition for the RL likelihoods.
+
+    Returns (order, offsets): order lists the trial indices sorted by
+    condition, keeping the trial order within each condition, and the
+    trials of the k-th condition are order[offsets[k]:offsets[k+1]].
+    The result only depends on the data and can be computed once per node.
+    """
+    split_by = np.asarray(split_by)
+    cdef Py_ssize_t n = len(split_by)
+    cdef np.ndarray[Py_ssize_t, ndim=1] order = np.argsort(split_by, kind='stable').astype(np.intp)
+    sorted_split_by = split_by[order]
+    starts = np.flatnonzero(sorted_split_by[1:] != sorted_split_by[:n - 1]) + 1
+    cdef np.ndarray[Py_ssize_t, ndim=1] offsets = np.concatenate(([0], starts, [n])).astype(np.intp)
+    return order, offsets
+
+cdef inline double rl_learning_rate(double feedback, double q, double alpha, double pos_alpha) nogil:
+    """Learning rate (inverse logit of alpha or pos_alpha) for a trial with the given feedback."""
+    if feedback > q:
+        return (2.718281828459**pos_alpha) / (1 + 2.718281828459**pos_alpha)
+    return (2.718281828459**alpha) / (1 + 2.718281828459**alpha)
+
+cdef inline double rl_update(double *qs, long response, double feedback, double alpha, double pos_alpha) nogil:
+    """Update and return the q value of the chosen response."""
+    # qs[1] is upper bound, qs[0] is lower bound. feedback is reward
+    # received on current trial.
+    qs[response] = qs[response] + \
+        rl_learning_rate(feedback, qs[response], alpha, pos_alpha) * (feedback - qs[response])
+    return qs[response]
+
+def rl_q_diff(np.ndarray[long, ndim=1] response, np.ndarray[double, ndim=1] feedback,
+              double q, double alpha, double pos_alpha, segments):
+    """Difference qs[1] - qs[0] of the q values before each trial.
+
+    The q values do not depend on the DDM parameters, so the drift of
+    trial i in wiener_like_rlddm is q_diff[i] * v for any v. segments is
+    the (order, offsets) pair from rl_segments.
+    """
+    cdef Py_ssize_t i, j, k
+    cdef double pos_alfa = alpha if pos_alpha == 100.00 else pos_alpha
+    cdef double qs[2]
+    cdef long[:] responses = response
+    cdef double[:] feedbacks = feedback
+    cdef Py_ssize_t[:] order = segments[0]
+    cdef Py_ssize_t[:] offsets = segments[1]
+    cdef np.ndarray[double, ndim=1] q_diff = np.empty(response.shape[0], dtype=np.double)
+    cdef double[:] q_diffs = q_diff
+
+    with nogil:
+        for k in range(offsets.shape[0] - 1):
+            qs[0] = q
+            qs[1] = q
+            for j in range(offsets[k], offsets[k + 1]):
+                i = order[j]
+                q_diffs[i] = qs[1] - qs[0]
+                rl_update(qs, responses[i], feedbacks[i], alpha, pos_alfa)
+
+    return q_diff
+
+cdef double _rlddm_sum(double[:] x, long[:] response, double[:] feedback, Py_ssize_t[:] order,
+                       Py_ssize_t[:] offsets, double q, double alpha, double pos_alpha, double v,
+                       double sv, double a, double z, double sz, double t, double st, double err,
+                       int n_st, int n_sz, bint use_adaptive, double simps_err,
+                       double p_outlier, double w_outlier) nogil:
+    """Summed RLDDM log-likelihood over the conditions given by order and offsets."""
+    cdef Py_ssize_t i, j, k
+    cdef double p
+    cdef double sum_logp = 0
+    cdef double qs[2]
+
+    for k in range(offsets.shape[0] - 1):
+        if offsets[k] == offsets[k + 1]:
+            continue
+        qs[0] = q
+        qs[1] = q
+
+        # don't calculate pdf for first trial but still update q
+        i = order[offsets[k]]
+        rl_update(qs, response[i], feedback[i], alpha, pos_alpha)
+
+        # loop through all trials in current condition
+        for j in range(offsets[k] + 1, offsets[k + 1]):
+            i = order[j]
+            p = log_like_trial(x[i], ((qs[1] - qs[0]) * v), sv, a, z, sz, t, st, err, n_st, n_sz,
+                               use_adaptive, simps_err, 0, p_outlier, w_outlier)
+            # If one probability = 0, the log sum will be -Inf
+            if p == -INFINITY:
+                return -INFINITY
+            sum_logp += p
+            rl_update(qs, response[i], feedback[i], alpha, pos_alpha)
+
+    return sum_logp
+
 def wiener_like_rlddm(np.ndarray[double, ndim=1] x,
                       np.ndarray[long, ndim=1] response,
                       np.ndarray[double, ndim=1] feedback,
@@ -83,21 +697,14 @@ def wiener_like_rlddm(np.ndarray[double, ndim=1] x,
                       double q, double alpha, double pos_alpha, double v, 
                       double sv, double a, double z, double sz, double t,
                       double st, double err, int n_st=10, int n_sz=10, bint use_adaptive=1, double simps_err=1e-8,
-                      double p_outlier=0, double w_outlier=0):
-    cdef Py_ssize_t size = x.shape[0]
-    cdef Py_ssize_t i, j
-    cdef Py_ssize_t s_size
-    cdef int s
-    cdef double p
-    cdef double sum_logp = 0
-    cdef double wp_outlier = w_outlier * p_outlier
-    cdef double alfa
+                      double p_outlier=0, double w_outlier=0, segments=None):
+    """Summed log-likelihood of the RLDDM.
+
+    segments is the (order, offsets) pair returned by rl_segments(split_by),
+    pass it to avoid regrouping the trials on every call.
+    """
     cdef double pos_alfa
-    cdef np.ndarray[double, ndim=1] qs = np.array([q, q])
-    cdef np.ndarray[double, ndim=1] xs
-    cdef np.ndarray[double, ndim=1] feedbacks
-    cdef np.ndarray[long, ndim=1] responses
-    cdef np.ndarray[long, ndim=1] unique = np.unique(split_by)
+    cdef double sum_logp
 
     if not p_outlier_in_range(p_outlier):
         return -np.inf
@@ -107,50 +714,18 @@ def wiener_like_rlddm(np.ndarray[double, ndim=1] x,
     else:
         pos_alfa = pos_alpha
 
-    # unique represent # of conditions
-    for j in range(unique.shape[0]):
-        s = unique[j]
-        # select trials for current condition, identified by the split_by-array
-        feedbacks = feedback[split_by == s]
-        responses = response[split_by == s]
-        xs = x[split_by == s]
-        s_size = xs.shape[0]
-        qs[0] = q
-        qs[1] = q
-
-        # don't calculate pdf for first trial but still update q
-        if feedbacks[0] > qs[responses[0]]:
-            alfa = (2.718281828459**pos_alfa) / (1 + 2.718281828459**pos_alfa)
-        else:
-            alfa = (2.718281828459**alpha) / (1 + 2.718281828459**alpha)
-
-        # qs[1] is upper bound, qs[0] is lower bound. feedbacks is reward
-        # received on current trial.
-        qs[responses[0]] = qs[responses[0]] + \
-            alfa * (feedbacks[0] - qs[responses[0]])
-
-        # loop through all trials in current condition
-        for i in range(1, s_size):
-            p = full_pdf(xs[i], ((qs[1] - qs[0]) * v), sv, a, z,
-                         sz, t, st, err, n_st, n_sz, use_adaptive, simps_err)
-            # If one probability = 0, the log sum will be -Inf
-            p = p * (1 - p_outlier) + wp_outlier
-            if p == 0:
-                return -np.inf
-            sum_logp += log(p)
-
-            # get learning rate for current trial. if pos_alpha is not in
-            # include it will be same as alpha so can still use this
-            # calculation:
-            if feedbacks[i] > qs[responses[i]]:
-                alfa = (2.718281828459**pos_alfa) / (1 + 2.718281828459**pos_alfa)
-            else:
-                alfa = (2.718281828459**alpha) / (1 + 2.718281828459**alpha)
-
-            # qs[1] is upper bound, qs[0] is lower bound. feedbacks is reward
-            # received on current trial.
-            qs[responses[i]] = qs[responses[i]] + \
-                alfa * (feedbacks[i] - qs[responses[i]])
+    if segments is None:
+        segments = rl_segments(split_by)
+    cdef Py_ssize_t[:] order = segments[0]
+    cdef Py_ssize_t[:] offsets = segments[1]
+    cdef double[:] xs = x
+    cdef long[:] responses = response
+    cdef double[:] feedbacks = feedback
+
+    with nogil:
+        sum_logp = _rlddm_sum(xs, responses, feedbacks, order, offsets, q, alpha, pos_alfa, v,
+                              sv, a, z, sz, t, st, err, n_st, n_sz, use_adaptive, simps_err,
+                              p_outlier, w_outlier)
     return sum_logp
 
 
@@ -159,21 +734,17 @@ def wiener_like_rl(np.ndarray[long, ndim=1] response,
                    np.ndarray[long, ndim=1] split_by,
                    double q, double alpha, double pos_alpha, double v, double z,
                    double err=1e-4, int n_st=10, int n_sz=10, bint use_adaptive=1, double simps_err=1e-8,
-                   double p_outlier=0, double w_outlier=0):
-    cdef Py_ssize_t size = response.shape[0]
-    cdef Py_ssize_t i, j
-    cdef Py_ssize_t s_size
-    cdef int s
+                   double p_outlier=0, double w_outlier=0, segments=None):
+    """Summed log-likelihood of the choices of the RL model, see wiener_like_rlddm for segments."""
+    cdef Py_ssize_t i, j, k
     cdef double drift
     cdef double p
     cdef double sum_logp = 0
     cdef double wp_outlier = w_outlier * p_outlier
-    cdef double alfa
     cdef double pos_alfa
-    cdef np.ndarray[double, ndim=1] qs = np.array([q, q])
-    cdef np.ndarray[double, ndim=1] feedbacks
-    cdef np.ndarray[long, ndim=1] responses
-    cdef np.ndarray[long, ndim=1] unique = np.unique(split_by)
+    cdef double qs[2]
+    cdef long[:] responses = response
+    cdef double[:] feedbacks = feedback
 
     if not p_outlier_in_range(p_outlier):
         return -np.inf
@@ -182,96 +753,108 @@ def wiener_like_rl(np.ndarray[long, ndim=1] response,
         pos_alfa = alpha
     else:
         pos_alfa = pos_alpha
-        
-    # unique represent # of conditions
-    for j in range(unique.shape[0]):
-        s = unique[j]
-        # select trials for current condition, identified by the split_by-array
-        feedbacks = feedback[split_by == s]
-        responses = response[split_by == s]
-        s_size = responses.shape[0]
-        qs[0] = q
-        qs[1] = q
 
-        # don't calculate pdf for first trial but still update q
-        if feedbacks[0] > qs[responses[0]]:
-            alfa = (2.718281828459**pos_alfa) / (1 + 2.718281828459**pos_alfa)
-        else:
-            alfa = (2.718281828459**alpha) / (1 + 2.718281828459**alpha)
+    if segments is None:
+        segments = rl_segments(split_by)
+    cdef Py_ssize_t[:] order = segments[0]
+    cdef Py_ssize_t[:] offsets = segments[1]
+
+    with nogil:
+        for k in range(offsets.shape[0] - 1):
+            if offsets[k] == offsets[k + 1]:
+                continue
+            qs[0] = q
+            qs[1] = q
+
+            # don't calculate pdf for first trial but still update q
+            i = order[offsets[k]]
+            rl_update(qs, responses[i], feedbacks[i], alpha, pos_alfa)
+
+            # loop through all trials in current condition
+            for j in range(offsets[k] + 1, offsets[k + 1]):
+                i = order[j]
+                drift = (qs[1] - qs[0]) * v
+
+                if drift == 0:
+                    p = 0.5
+                else:
+                    if responses[i] == 1:
+                        p = (2.718281828459**(-2 * z * drift) - 1) / \
+                            (2.718281828459**(-2 * drift) - 1)
+                    else:
+                        p = 1 - (2.718281828459**(-2 * z * drift) - 1) / \
+                            (2.718281828459**(-2 * drift) - 1)
+
+                # If one probability = 0, the log sum will be -Inf
+                p = p * (1 - p_outlier) + wp_outlier
+                if p == 0:
+                    sum_logp = -INFINITY
+                    break
 
-        # qs[1] is upper bound, qs[0] is lower bound. feedbacks is reward
-        # received on current trial.
-        qs[responses[0]] = qs[responses[0]] + \
-            alfa * (feedbacks[0] - qs[responses[0]])
+                sum_logp += log(p)
+                rl_update(qs, responses[i], feedbacks[i], alpha, pos_alfa)
 
-        # loop through all trials in current condition
-        for i in range(1, s_size):
+            if sum_logp == -INFINITY:
+                break
 
-            drift = (qs[1] - qs[0]) * v
+    return sum_logp
 
-            if drift == 0:
-                p = 0.5
-            else:
-                if responses[i] == 1:
-                    p = (2.718281828459**(-2 * z * drift) - 1) / \
-                        (2.718281828459**(-2 * drift) - 1)
-                else:
-                    p = 1 - (2.718281828459**(-2 * z * drift) - 1) / \
-                        (2.718281828459**(-2 * drift) - 1)
 
-            # If one probability = 0, the log sum will be -Inf
-            p = p * (1 - p_outlier) + wp_outlier
-            if p == 0:
-                return -np.inf
+def trial_params(param, Py_ssize_t size):
+    """Per-trial values of a parameter as a contiguous double array, scalars are broadcast."""
+    param = np.asarray(param, dtype=np.double)
+    if param.ndim == 0:
+        return np.full(size, param, dtype=np.double)
+    # regressor outputs come as single column frames
+    if param.size != size or param.shape[0] != size:
+        raise ValueError("per-trial parameters must have one entry per trial")
+    return np.ascontiguousarray(param.reshape(size))
+
+def wiener_like_trials(np.ndarray[double, ndim=1] x, v, sv, a, z, sz, t, st, double err,
+                       int n_st=10, int n_sz=10, bint use_adaptive=1, double simps_err=1e-3,
+                       double p_outlier=0, double w_outlier=0, bint st_exact=0):
+    """Summed log-likelihood of x with per-trial parameters.
+
+    Every parameter is either a scalar or an array with one value per
+    trial. RTs of 999 and -999 code trials without a response at the
+    upper and lower boundary; they contribute the probability of hitting
+    that boundary.
+    """
+    cdef Py_ssize_t size = x.shape[0]
+    cdef Py_ssize_t i
+    cdef double sum_logp = 0
+    cdef double[:] xs = x
+    cdef double[:] vs = trial_params(v, size)
+    cdef double[:] svs = trial_params(sv, size)
+    cdef double[:] as_ = trial_params(a, size)
+    cdef double[:] zs = trial_params(z, size)
+    cdef double[:] szs = trial_params(sz, size)
+    cdef double[:] ts = trial_params(t, size)
+    cdef double[:] sts = trial_params(st, size)
 
-            sum_logp += log(p)
+    if not p_outlier_in_range(p_outlier):
+        return -np.inf
 
-            # get learning rate for current trial. if pos_alpha is not in
-            # include it will be same as alpha so can still use this
-            # calculation:
-            if feedbacks[i] > qs[responses[i]]:
-                alfa = (2.718281828459**pos_alfa) / (1 + 2.718281828459**pos_alfa)
-            else:
-                alfa = (2.718281828459**alpha) / (1 + 2.718281828459**alpha)
+    for i in prange(size, nogil=True, schedule='dynamic', chunksize=64):
+        if xs[i] == 999.:
+            sum_logp += log(prob_ub(vs[i], as_[i], zs[i]))
+        elif xs[i] == -999.:
+            sum_logp += log(1 - prob_ub(vs[i], as_[i], zs[i]))
+        else:
+            sum_logp += log_like_trial(xs[i], vs[i], svs[i], as_[i], zs[i], szs[i], ts[i], sts[i], err,
+                                       n_st, n_sz, use_adaptive, simps_err, st_exact, p_outlier, w_outlier)
 
-            # qs[1] is upper bound, qs[0] is lower bound. feedbacks is reward
-            # received on current trial.
-            qs[responses[i]] = qs[responses[i]] + \
-                alfa * (feedbacks[i] - qs[responses[i]])
     return sum_logp
 
-
 def wiener_like_multi(np.ndarray[double, ndim=1] x, v, sv, a, z, sz, t, st, double err, multi=None,
                       int n_st=10, int n_sz=10, bint use_adaptive=1, double simps_err=1e-3,
                       double p_outlier=0, double w_outlier=0):
-    cdef Py_ssize_t size = x.shape[0]
-    cdef Py_ssize_t i
-    cdef double p = 0
-    cdef double sum_logp = 0
-    cdef double wp_outlier = w_outlier * p_outlier
+    """Summed log-likelihood of x where the parameters in multi hold one value per trial.
 
-    if multi is None:
-        return full_pdf(x, v, sv, a, z, sz, t, st, err)
-    else:
-        params = {'v': v, 'z': z, 't': t, 'a': a, 'sv': sv, 'sz': sz, 'st': st}
-        params_iter = copy(params)
-        for i in range(size):
-            for param in multi:
-                params_iter[param] = params[param][i]
-            if abs(x[i]) != 999.:
-                p = full_pdf(x[i], params_iter['v'],
-                             params_iter['sv'], params_iter['a'], params_iter['z'],
-                             params_iter['sz'], params_iter['t'], params_iter['st'],
-                             err, n_st, n_sz, use_adaptive, simps_err)
-                p = p * (1 - p_outlier) + wp_outlier
-            elif x[i] == 999.:
-                p = prob_ub(params_iter['v'], params_iter['a'], params_iter['z'])
-            else: # x[i] == -999.
-                p = 1 - prob_ub(params_iter['v'], params_iter['a'], params_iter['z'])
-
-            sum_logp += log(p)
-
-        return sum_logp
+    See wiener_like_trials, which broadcasts every scalar parameter.
+    """
+    return wiener_like_trials(x, v, sv, a, z, sz, t, st, err, n_st, n_sz, use_adaptive, simps_err,
+                              p_outlier, w_outlier)
 
 
 def wiener_like_multi_rlddm(np.ndarray[double, ndim=1] x, 
@@ -281,104 +864,444 @@ def wiener_like_multi_rlddm(np.ndarray[double, ndim=1] x,
                       double q, v, sv, a, z, sz, t, st, alpha, double err, multi=None,
                       int n_st=10, int n_sz=10, bint use_adaptive=1, double simps_err=1e-3,
                       double p_outlier=0, double w_outlier=0):
+    """Summed RLDDM log-likelihood with per-trial parameters.
+
+    The parameters (including alpha) are scalars or arrays with one value
+    per trial, multi is only kept for compatibility. The q values are
+    reset to q whenever split_by changes from one trial to the next.
+    """
     cdef Py_ssize_t size = x.shape[0]
-    cdef Py_ssize_t ij
-    cdef Py_ssize_t s_size
-    cdef double p = 0
+    cdef Py_ssize_t i
     cdef double sum_logp = 0
-    cdef double wp_outlier = w_outlier * p_outlier
-    cdef int s
-    cdef np.ndarray[double, ndim=1] qs = np.array([q, q])
+    cdef double qs[2]
+    cdef double[:] xs = x
+    cdef long[:] responses = response
+    cdef double[:] feedbacks = feedback
+    cdef long[:] splits = split_by
+    cdef double[:] vs = trial_params(v, size)
+    cdef double[:] svs = trial_params(sv, size)
+    cdef double[:] as_ = trial_params(a, size)
+    cdef double[:] zs = trial_params(z, size)
+    cdef double[:] szs = trial_params(sz, size)
+    cdef double[:] ts = trial_params(t, size)
+    cdef double[:] sts = trial_params(st, size)
+    cdef double[:] alphas = trial_params(alpha, size)
 
-    if multi is None:
-        return full_pdf(x, v, sv, a, z, sz, t, st, err)
-    else:
-        params = {'v': v, 'z': z, 't': t, 'a': a, 'sv': sv, 'sz': sz, 'st': st, 'alpha':alpha}
-        params_iter = copy(params)
+    if not p_outlier_in_range(p_outlier):
+        return -np.inf
+
+    with nogil:
         qs[0] = q
         qs[1] = q
         for i in range(size):
-            for param in multi:
-                params_iter[param] = params[param][i]
-
-            if (i != 0):
-                if (split_by[i] != split_by[i-1]):
-                    qs[0] = q
-                    qs[1] = q
-
-            p = full_pdf(x[i], params_iter['v'] * (qs[1] - qs[0]),
-                         params_iter['sv'], params_iter['a'], params_iter['z'],
-                         params_iter['sz'], params_iter[
-                             't'], params_iter['st'],
-                         err, n_st, n_sz, use_adaptive, simps_err)
-            p = p * (1 - p_outlier) + wp_outlier
-            sum_logp += log(p)
+            if i != 0 and splits[i] != splits[i - 1]:
+                qs[0] = q
+                qs[1] = q
 
-            alfa = (2.718281828459**params_iter['alpha']) / (1 + 2.718281828459**params_iter['alpha'])   
-            qs[response[i]] = qs[response[i]] + alfa * (feedback[i] - qs[response[i]])
+            sum_logp += log_like_trial(xs[i], vs[i] * (qs[1] - qs[0]), svs[i], as_[i], zs[i], szs[i],
+                                       ts[i], sts[i], err, n_st, n_sz, use_adaptive, simps_err, 0,
+                                       p_outlier, w_outlier)
 
-        return sum_logp
+            rl_update(qs, responses[i], feedbacks[i], alphas[i], alphas[i])
 
+    return sum_logp
 
-def gen_rts_from_cdf(double v, double sv, double a, double z, double sz, double t,
-                     double st, int samples=1000, double cdf_lb=-6, double cdf_ub=6, double dt=1e-2):
 
-    cdef np.ndarray[double, ndim = 1] x = np.arange(cdf_lb, cdf_ub, dt)
-    cdef np.ndarray[double, ndim = 1] l_cdf = np.empty(x.shape[0], dtype=np.double)
-    cdef double pdf, rt
-    cdef Py_ssize_t size = x.shape[0]
-    cdef Py_ssize_t i, j
-    cdef int idx
+def _gen_cdf_table(double v, double sv, double a, double z, double sz, double cdf_lb, double cdf_ub,
+                   double dt, double err):
+    x = np.arange(cdf_lb, cdf_ub, dt)
+    # decision times only, the non-decision time is added when sampling
+    cdef Py_ssize_t n = len(x)
+    pdf = pdf_array(x, v, sv, a, z, sz, 0, 0, err)
+    cdf = np.concatenate(([0], np.cumsum((pdf[1:] + pdf[:n - 1]) / 2)))
+    cdf /= cdf[n - 1]
+    x.setflags(write=False)
+    cdf.setflags(write=False)
+    return x, cdf
 
-    l_cdf[0] = 0
-    for i from 1 <= i < size:
-        pdf = full_pdf(x[i], v, sv, a, z, sz, 0, 0, 1e-4)
-        l_cdf[i] = l_cdf[i - 1] + pdf
+gen_cdf_table = lru_cache(maxsize=128)(_gen_cdf_table)
+gen_cdf_table.__doc__ = """Grid x over [cdf_lb, cdf_ub) and the CDF of the signed decision time on it.
 
-    l_cdf /= l_cdf[x.shape[0] - 1]
+The density is integrated with the trapezoidal rule. The last 128 tables
+are cached and shared by all callers.
+"""
+
+def gen_rts_from_cdf(double v, double sv, double a, double z, double sz, double t,
+                     double st, int samples=1000, double cdf_lb=-6, double cdf_ub=6, double dt=1e-2,
+                     double err=1e-4):
+    """Sample signed RTs by inverting the CDF of the decision time.
+
+    All draws are located in the table with one searchsorted and
+    interpolated linearly within their bin; the non-decision time is
+    added with its uniform variability st. Tables are reused for repeated
+    calls with the same parameters (rounded to 1e-10) and grid.
+    """
+    x, cdf = gen_cdf_table(round(v, 10), round(sv, 10), round(a, 10), round(z, 10), round(sz, 10),
+                           cdf_lb, cdf_ub, dt, err)
 
-    cdef np.ndarray[double, ndim = 1] rts = np.empty(samples, dtype=np.double)
     cdef np.ndarray[double, ndim = 1] f = np.random.rand(samples)
     cdef np.ndarray[double, ndim = 1] delay
 
     if st != 0:
         delay = (np.random.rand(samples) * st + (t - st / 2.))
-    for i from 0 <= i < samples:
-        idx = np.searchsorted(l_cdf, f[i])
-        rt = x[idx]
-        if st == 0:
-            rt = rt + np.sign(rt) * t
+    else:
+        delay = np.full(samples, t)
+
+    idx = np.clip(np.searchsorted(cdf, f), 1, cdf.shape[0] - 1)
+    cdf_0 = cdf[idx - 1]
+    width = cdf[idx] - cdf_0
+    rts = x[idx - 1] + np.where(width > 0, (f - cdf_0) / np.where(width > 0, width, 1), 0) * dt
+
+    return rts + np.sign(rts) * delay
+
+
+cdef double fpt_ratio(double u, double w) nogil:
+    """f(u|0,1,w)/f0(u,w), the probability that a path from w that first reaches 0
+    at normalized time u has not touched 1 before.
+    """
+    cdef int k
+    cdef double r, a_k, log_f0, term
+
+    if u < 1:
+        # small-time series, the terms for +k and -k are paired to avoid cancellation
+        r = 1
+        for k in range(1, 100):
+            a_k = exp(-2*k*(k - w)/u)
+            r += a_k + exp(-2*k*(k + w)/u) + 2*k/w*a_k*expm1(-4*k*w/u)
+            if a_k*(2 + 8*k*k/u) < 1e-16:
+                break
+    elif u == INFINITY:
+        return 0
+    else:
+        # large-time series divided by f0, taken in log space
+        log_f0 = log(w) - .5*log(2*M_PI) - 1.5*log(u) - w*w/(2*u)
+        r = 0
+        for k in range(1, 100):
+            term = k*exp(-k*k*M_PI*M_PI*u/2 - log_f0)
+            r += term*sin(k*M_PI*w)
+            if term < 1e-16:
+                break
+        r *= M_PI
+
+    return min(max(r, 0.), 1.)
+
+cdef inline double prob_ub_normalized(double vn, double z) nogil:
+    """Probability of the upper boundary for the normalized drift vn = v*a,
+    without overflow for large |vn|.
+    """
+    cdef double m = 2*fabs(vn)
+
+    if vn == 0:
+        return z
+    elif vn > 0:
+        return expm1(-m*z)/expm1(-m)
+    return (exp(m*(z - 1)) - exp(-m))/-expm1(-m)
+
+cdef inline double fpt_proposal(double w, double d, double y, double u_ig, double u_acc) nogil:
+    """Normalized first-passage time at the boundary at distance w with drift d
+    towards it, or -1 if the proposal is rejected.
+
+    The proposal is the first-passage time to that boundary alone, an inverse
+    Gaussian with mean w/|d| and shape w**2 (Michael, Schucany & Haas, 1976)
+    drawn from y ~ chi2(1) and the uniform u_ig. It is accepted with the
+    uniform u_acc if it does not cross the other boundary first.
+    """
+    cdef double mu, c, u
+
+    if d == 0:
+        u = w*w/y
+    else:
+        mu = w/fabs(d)
+        c = mu*y/(2*w*w)
+        u = mu/(1 + c + sqrt(c*c + 2*c))
+        if u_ig > mu/(mu + u):
+            u = mu*mu/u
+    if u_acc < fpt_ratio(u, w):
+        return u
+    return -1
+
+def gen_rts_exact(v, sv, a, z, sz, t, st, int samples=1000):
+    """Sample signed RTs exactly, without discretizing time or tabulating the CDF.
+
+    v, z and t are drawn for every trial from sv, sz and st. The boundary is
+    drawn from its probability, the decision time from the inverse Gaussian
+    first-passage time to that boundary alone by rejecting paths that reach
+    the other boundary first. On average at most two proposals are needed
+    per sample.
+
+    Every parameter can also be an array with one value per sample, e.g.
+    the outputs of regressors.
+    """
+    cdef Py_ssize_t i, j, n
+    cdef double vn
+    cdef np.ndarray[double, ndim=1] vs, zs, as_, us, rts
+    cdef np.ndarray[double, ndim=1] ws = np.empty(samples)
+    cdef np.ndarray[double, ndim=1] ds = np.empty(samples)
+    cdef np.ndarray[double, ndim=1] signs = np.empty(samples)
+    cdef np.ndarray[double, ndim=1] u = np.empty(samples)
+    cdef double[:] vs_view, zs_view, as_view, us_view, ws_view = ws, ds_view = ds, signs_view = signs
+    cdef double[:] ys_view, u_ig_view, u_acc_view, props_view
+    cdef Py_ssize_t[:] pending_view
+
+    vs = trial_params(v, samples)
+    svs = trial_params(sv, samples)
+    if svs.any():
+        vs = vs + svs*np.random.standard_normal(samples)
+    zs = trial_params(z, samples)
+    szs = trial_params(sz, samples)
+    if szs.any():
+        zs = zs + szs*(np.random.rand(samples) - .5)
+    as_ = trial_params(a, samples)
+    us = np.random.rand(samples)
+    vs_view, zs_view, as_view, us_view = vs, zs, as_, us
+
+    for i in prange(samples, nogil=True):
+        vn = vs_view[i]*as_view[i]
+        if us_view[i] < prob_ub_normalized(vn, zs_view[i]):
+            ws_view[i] = 1 - zs_view[i]
+            ds_view[i] = vn
+            signs_view[i] = 1
         else:
-            rt = rt + np.sign(rt) * delay[i]
-        rts[i] = rt
-    return rts
+            ws_view[i] = zs_view[i]
+            ds_view[i] = -vn
+            signs_view[i] = -1
+
+    pending = np.arange(samples, dtype=np.intp)
+    while pending.shape[0]:
+        n = pending.shape[0]
+        pending_view = pending
+        ys_view = np.random.standard_normal(n)**2
+        u_ig_view = np.random.rand(n)
+        u_acc_view = np.random.rand(n)
+        props = np.empty(n)
+        props_view = props
+        for j in prange(n, nogil=True):
+            i = pending_view[j]
+            props_view[j] = fpt_proposal(ws_view[i], ds_view[i], ys_view[j], u_ig_view[j], u_acc_view[j])
+        accepted = props >= 0
+        u[pending[accepted]] = props[accepted]
+        pending = pending[~accepted]
+
+    rts = as_*as_*u + trial_params(t, samples)
+    sts = trial_params(st, samples)
+    if sts.any():
+        rts += (np.random.rand(samples) - .5)*sts
+    return signs*rts
+
+
+def bit_generator(rng=None):
+    """The BitGenerator of rng, a np.random.Generator or BitGenerator.
+
+    Without rng a new one is seeded from np.random, so that np.random.seed
+    still makes the draws taken from C reproducible.
+    """
+    if rng is None:
+        rng = np.random.default_rng(np.random.randint(2**31, size=4))
+    if isinstance(rng, np.random.Generator):
+        rng = rng.bit_generator
+    if not isinstance(rng, np.random.BitGenerator):
+        raise TypeError("rng must be a numpy Generator or BitGenerator, not %s" % type(rng).__name__)
+    return rng
+
+cdef bitgen_t *bitgen_pointer(bit_gen) except NULL:
+    return <bitgen_t *> PyCapsule_GetPointer(bit_gen.capsule, "BitGenerator")
+
+cdef inline double random_normal(bitgen_t *rng) nogil:
+    """Standard normal draw (Box-Muller)."""
+    return sqrt(-2*log(1 - rng.next_double(rng.state)))*cos(2*M_PI*rng.next_double(rng.state))
+
+cdef double sample_rt(bitgen_t *rng, double v, double a, double z, double t) nogil:
+    """One signed RT of the DDM without variabilities, as in gen_rts_exact."""
+    cdef double w, d, sign, n, u
+
+    if rng.next_double(rng.state) < prob_ub_normalized(v*a, z):
+        w, d, sign = 1 - z, v*a, 1
+    else:
+        w, d, sign = z, -v*a, -1
+    while True:
+        n = random_normal(rng)
+        u = fpt_proposal(w, d, n*n, rng.next_double(rng.state), rng.next_double(rng.state))
+        if u >= 0:
+            return sign*(a*a*u + t)
+
+def gen_rl_trials(np.ndarray[double, ndim=1] rew_up, np.ndarray[double, ndim=1] rew_low, double q_init,
+                  double alpha, double pos_alpha, double scaler, double a=NAN, double t=NAN, double z=.5,
+                  rng=None):
+    """Simulate one subject of the RLDDM, or of the RL model if a is NaN.
+
+    Q-values of the chosen option are updated towards its reward, with
+    pos_alpha when the reward exceeds the Q-value. The drift of a trial is
+    scaler times the difference of the Q-values, the choice and RT are
+    drawn from the DDM with a, t and z. Without a, only the choice is
+    drawn with the probability of the upper boundary (p) for a=1.
+
+    Draws are taken from rng, a np.random.Generator or BitGenerator (see
+    bit_generator). Returns q_up, q_low, sim_drift, p, response, rt and
+    feedback arrays.
+    """
+    cdef Py_ssize_t i, n = rew_up.shape[0]
+    cdef bint with_rt = a == a
+    cdef double q_up = q_init, q_low = q_init, lr, drift, rt
+    cdef double[:] rew_up_view = rew_up, rew_low_view = rew_low
+    cdef np.ndarray[double, ndim=2] out = np.empty((7, n))
+    cdef double[:, :] o = out
+    bit_gen = bit_generator(rng)
+    cdef bitgen_t *c_rng = bitgen_pointer(bit_gen)
+
+    with bit_gen.lock, nogil:
+        for i in range(n):
+            drift = (q_up - q_low)*scaler
+            o[0, i] = q_up
+            o[1, i] = q_low
+            o[2, i] = drift
+            if with_rt:
+                o[3, i] = prob_ub_normalized(drift*a, z)
+                rt = sample_rt(c_rng, drift, a, z, t)
+                o[4, i] = rt > 0
+                o[5, i] = fabs(rt)
+            else:
+                if fabs(drift) < .01:
+                    o[3, i] = .5
+                else:
+                    o[3, i] = prob_ub_normalized(drift, z)
+                o[4, i] = c_rng.next_double(c_rng.state) < o[3, i]
+                o[5, i] = NAN
+            if o[4, i] == 1:
+                o[6, i] = rew_up_view[i]
+                lr = pos_alpha if o[6, i] > q_up else alpha
+                q_up = q_up + lr*(o[6, i] - q_up)
+            else:
+                o[6, i] = rew_low_view[i]
+                lr = pos_alpha if o[6, i] > q_low else alpha
+                q_low = q_low + lr*(o[6, i] - q_low)
+
+    return tuple(out)
+
+
+def gen_rl_batch(np.ndarray[double, ndim=2] params, segments, double q, np.ndarray[double, ndim=1] rewards,
+                 reward_offsets, rng=None):
+    """Closed-loop simulation of the RLDDM for K parameter sets at once.
+
+    params is a (K, 9) array with columns v, alpha, pos_alpha, sv, a, z, sz,
+    t and st; rows with a NaN only simulate choices (the RL model, as in
+    wiener_like_rl). Conditions are given by segments from rl_segments, the
+    q values start at q in each. The feedback of a simulated choice of
+    response r in condition k is drawn uniformly from
+    rewards[reward_offsets[2*k + r]:reward_offsets[2*k + r + 1]]. Draws are
+    taken from rng as in gen_rl_trials.
+
+    Returns response, rt and feedback as (K, n_trials) arrays in the order
+    of the trials.
+    """
+    cdef Py_ssize_t k, c, j, i, m, pool
+    cdef Py_ssize_t n_sets = params.shape[0]
+    cdef Py_ssize_t[:] order = segments[0]
+    cdef Py_ssize_t[:] offsets = segments[1]
+    cdef Py_ssize_t[:] r_offsets = np.ascontiguousarray(reward_offsets, dtype=np.intp)
+    cdef double[:] rews = rewards
+    cdef double[:, :] ps = params
+    cdef double v, alpha, pos_alfa, sv, a, z, sz, t, st, drift, x, p
+    cdef long response
+    cdef double qs[2]
+    cdef np.ndarray[double, ndim=2] responses = np.empty((n_sets, order.shape[0]))
+    cdef np.ndarray[double, ndim=2] rts = np.empty((n_sets, order.shape[0]))
+    cdef np.ndarray[double, ndim=2] feedbacks = np.empty((n_sets, order.shape[0]))
+    cdef double[:, :] responses_view = responses, rts_view = rts, feedbacks_view = feedbacks
+    cdef bitgen_t *c_rng
+
+    if params.shape[1] != 9:
+        raise ValueError("params must have 9 columns: v, alpha, pos_alpha, sv, a, z, sz, t, st")
+    bit_gen = bit_generator(rng)
+    c_rng = bitgen_pointer(bit_gen)
+
+    with bit_gen.lock, nogil:
+        for k in range(n_sets):
+            v, alpha, sv, a, z, sz, t, st = ps[k, 0], ps[k, 1], ps[k, 3], ps[k, 4], ps[k, 5], ps[k, 6], ps[k, 7], ps[k, 8]
+            pos_alfa = alpha if ps[k, 2] == 100.00 else ps[k, 2]
+            for c in range(offsets.shape[0] - 1):
+                qs[0] = q
+                qs[1] = q
+                for j in range(offsets[c], offsets[c + 1]):
+                    i = order[j]
+                    drift = (qs[1] - qs[0]) * v
+                    if a == a:
+                        if sv != 0:
+                            drift = drift + sv*random_normal(c_rng)
+                        x = sample_rt(c_rng, drift, a,
+                                      z + sz*(c_rng.next_double(c_rng.state) - .5) if sz != 0 else z,
+                                      t + st*(c_rng.next_double(c_rng.state) - .5) if st != 0 else t)
+                        response = x > 0
+                        rts_view[k, i] = fabs(x)
+                    else:
+                        p = .5 if drift == 0 else prob_ub_normalized(drift, z)
+                        response = c_rng.next_double(c_rng.state) < p
+                        rts_view[k, i] = NAN
+                    pool = 2*c + response
+                    m = r_offsets[pool + 1] - r_offsets[pool]
+                    responses_view[k, i] = response
+                    feedbacks_view[k, i] = rews[r_offsets[pool] + min(<Py_ssize_t>(c_rng.next_double(c_rng.state)*m), m - 1)]
+                    rl_update(qs, response, feedbacks_view[k, i], alpha, pos_alfa)
+
+    return responses, rts, feedbacks
+
+
+cdef double _wiener_like_contaminant_sum(double[:] x, int[:] cont_x, double v, double sv, double a,
+                                         double z, double sz, double t, double st, double err, int n_st,
+                                         int n_sz, bint use_adaptive, double simps_err) nogil:
+    """Summed log-likelihood of the non-contaminant trials in x, serial over trials."""
+    cdef Py_ssize_t i
+    cdef double p
+    cdef double sum_logp = 0
+
+    for i in range(x.shape[0]):
+        if cont_x[i] == 0:
+            p = full_pdf(x[i], v, sv, a, z, sz, t, st, err,
+                         n_st, n_sz, use_adaptive, simps_err)
+            if p == 0:
+                return -INFINITY
+            sum_logp += log(p)
+
+    return sum_logp
 
 
 def wiener_like_contaminant(np.ndarray[double, ndim=1] x, np.ndarray[int, ndim=1] cont_x, double v,
                             double sv, double a, double z, double sz, double t, double st, double t_min,
                             double t_max, double err, int n_st=10, int n_sz=10, bint use_adaptive=1,
-                            double simps_err=1e-8):
+                            double simps_err=1e-8, bint deterministic=0):
     """Wiener likelihood function where RTs could come from a
     separate, uniform contaminant distribution.
 
+    Trials are reduced in parallel; see wiener_like for the meaning of
+    deterministic.
+
     Reference: Lee, Vandekerckhove, Navarro, & Tuernlinckx (2007)
     """
     cdef Py_ssize_t size = x.shape[0]
-    cdef Py_ssize_t i
+    cdef Py_ssize_t i, b, lb, ub
+    cdef Py_ssize_t n_blocks = (size + sum_block_size - 1) // sum_block_size
     cdef double p
     cdef double sum_logp = 0
     cdef int n_cont = np.sum(cont_x)
-    cdef int pos_cont = 0
-
-    for i in prange(size, nogil=True):
-        if cont_x[i] == 0:
-            p = full_pdf(x[i], v, sv, a, z, sz, t, st, err,
-                         n_st, n_sz, use_adaptive, simps_err)
-            if p == 0:
-                with gil:
-                    return -np.inf
-            sum_logp += log(p)
-        # If one probability = 0, the log sum will be -Inf
+    cdef double[:] xs = x
+    cdef int[:] cont = cont_x
+    cdef double[:] partial
+
+    if deterministic:
+        partial = np.empty(n_blocks, dtype=np.double)
+        for b in prange(n_blocks, nogil=True, schedule='dynamic'):
+            lb = b * sum_block_size
+            ub = min(lb + sum_block_size, size)
+            partial[b] = _wiener_like_contaminant_sum(xs[lb:ub], cont[lb:ub], v, sv, a, z, sz, t, st,
+                                                      err, n_st, n_sz, use_adaptive, simps_err)
+        for b in range(n_blocks):
+            sum_logp += partial[b]
+    else:
+        for i in prange(size, nogil=True, schedule='dynamic', chunksize=64):
+            if cont[i] == 0:
+                p = full_pdf(xs[i], v, sv, a, z, sz, t, st, err,
+                             n_st, n_sz, use_adaptive, simps_err)
+                # If one probability = 0, the log sum will be -Inf
+                sum_logp += log(p)
 
     # add the log likelihood of the contaminations
     sum_logp += n_cont * log(0.5 * 1. / (t_max - t_min))
@@ -388,7 +1311,7 @@ def wiener_like_contaminant(np.ndarray[double, ndim=1] x, np.ndarray[int, ndim=1
 
 def gen_cdf_using_pdf(double v, double sv, double a, double z, double sz, double t, double st, double err,
                       int N=500, double time=5., int n_st=2, int n_sz=2, bint use_adaptive=1, double simps_err=1e-3,
-                      double p_outlier=0, double w_outlier=0):
+                      double p_outlier=0, double w_outlier=0, bint st_exact=0):
     """
     generate cdf vector using the pdf
     """
@@ -403,10 +1326,10 @@ def gen_cdf_using_pdf(double v, double sv, double a, double z, double sz, double
 
     # compute pdf on the real line
     cdf_array = pdf_array(x, v, sv, a, z, sz, t, st, err, 0,
-                          n_st, n_sz, use_adaptive, simps_err, p_outlier, w_outlier)
+                          n_st, n_sz, use_adaptive, simps_err, p_outlier, w_outlier, st_exact)
 
     # integrate
-    cdf_array[1:] = integrate.cumtrapz(cdf_array)
+    cdf_array[1:] = integrate.cumulative_trapezoid(cdf_array)
 
     # normalize
     cdf_array /= cdf_array[x.shape[0] - 1]